@@ -0,0 +1,153 @@
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import threading
+import subprocess
+import urllib.request
+from datetime import datetime
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, BENCH_DIR)
+
+from load import HttpDriver, run_scenario, git_revision
+
+def wait_for(url, timeout=60.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            urllib.request.urlopen(url, timeout=2).read()
+            return
+        except Exception:
+            time.sleep(0.25)
+    raise RuntimeError(f'{url} did not come up within {timeout:.0f}s')
+
+def gevent_available():
+    try:
+        import gevent
+        return True
+    except ImportError:
+        return False
+
+def start_gunicorn(worker_class, args, env):
+    env = dict(env,
+               GUNICORN_WORKER_CLASS=worker_class,
+               GUNICORN_BIND=f'127.0.0.1:{args.port}',
+               WEB_CONCURRENCY=str(args.workers),
+               GUNICORN_THREADS=str(args.threads),
+               GUNICORN_WORKER_CONNECTIONS=str(args.connections),
+               GUNICORN_TIMEOUT='120')
+    process = subprocess.Popen([sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py', 'app:app'],
+                               cwd=ROOT_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    wait_for(f'http://127.0.0.1:{args.port}/')
+    return process
+
+def run_mixed(driver, scenarios, requests_count, concurrency):
+    # Slow and fast routes run side by side; the fast route's latency shows whether
+    # requests stuck waiting on OpenAI starve everything else.
+    results = {}
+
+    def run(name):
+        results[name] = run_scenario(driver, scenarios[name], requests_count, concurrency)
+
+    threads = [threading.Thread(target=run, args=(name,)) for name in scenarios]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+def main():
+    arg_parser = argparse.ArgumentParser(
+        description='Compare gunicorn worker classes on OpenAI-bound routes using a slow stub OpenAI backend.')
+    arg_parser.add_argument('--database-url', default=os.environ.get('DATABASE_URL'), required=not os.environ.get('DATABASE_URL'),
+                            help='A seeded database (see seed_data.py --scale); candidates log in with password123')
+    arg_parser.add_argument('--worker-classes', default='sync,gthread,gevent')
+    arg_parser.add_argument('--workers', type=int, default=2)
+    arg_parser.add_argument('--threads', type=int, default=16, help='Threads per gthread worker')
+    arg_parser.add_argument('--connections', type=int, default=200, help='Greenlets per gevent worker')
+    arg_parser.add_argument('--latency', type=float, default=1.0, help='Stub OpenAI response time in seconds')
+    arg_parser.add_argument('--requests', type=int, default=100, help='Requests per route')
+    arg_parser.add_argument('--concurrency', type=int, default=32, help='Concurrent clients per route')
+    arg_parser.add_argument('--port', type=int, default=5055)
+    arg_parser.add_argument('--openai-port', type=int, default=8099)
+    arg_parser.add_argument('--output', default='concurrency_output.json')
+    args = arg_parser.parse_args()
+
+    os.environ['DATABASE_URL'] = args.database_url
+    from talentbridge import create_app
+    from talentbridge.extensions import db
+    from talentbridge.models import User, Job, Resume, RecommendedJob
+
+    app = create_app()
+    with app.app_context():
+        # Prefer a user the batch scorer has covered so the route's time is the OpenAI call, not live scoring.
+        candidate = User.query.join(RecommendedJob, RecommendedJob.user_id == User.id).first() or \
+            User.query.join(Resume, Resume.user_id == User.id).filter(Resume.is_primary == True).first()
+        job_ids = [row[0] for row in db.session.query(Job.id).filter_by(is_active=True).limit(1000).all()]
+        credentials = {candidate.id: (candidate.email, 'password123')}
+        candidate_id = candidate.id
+
+    env = dict(os.environ,
+               DATABASE_URL=args.database_url,
+               OPENAI_API_KEY='stub',
+               OPENAI_BASE_URL=f'http://127.0.0.1:{args.openai_port}/v1',
+               MATCHING_MODE='keyword')
+    stub = subprocess.Popen([sys.executable, os.path.join(BENCH_DIR, 'mock_openai.py'), '--port', str(args.openai_port),
+                             '--latency', str(args.latency), '--jitter', '0'],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    counter = [0]
+
+    def job_detail():
+        counter[0] += 1
+        return 'GET', f'/jobs/{job_ids[counter[0] % len(job_ids)]}', None, None
+
+    scenarios = {
+        'recommended': lambda: ('GET', '/resumes/recommended', candidate_id, None),
+        'job_detail': job_detail,
+    }
+
+    results = {
+        'timestamp': datetime.utcnow().isoformat(),
+        'git_revision': git_revision(),
+        'python': platform.python_version(),
+        'cpus': os.cpu_count(),
+        'openai_latency_s': args.latency,
+        'requests_per_route': args.requests,
+        'concurrency': args.concurrency,
+        'workers': args.workers,
+        'modes': {},
+    }
+    try:
+        wait_for(f'http://127.0.0.1:{args.openai_port}/stats')
+        for worker_class in args.worker_classes.split(','):
+            worker_class = worker_class.strip()
+            if worker_class == 'gevent' and not gevent_available():
+                print('Skipping gevent (pip install gevent psycogreen)')
+                continue
+            print(f'Running {worker_class} ({args.workers} workers)...')
+            server = start_gunicorn(worker_class, args, env)
+            try:
+                driver = HttpDriver(f'http://127.0.0.1:{args.port}', credentials)
+                mode = run_mixed(driver, scenarios, args.requests, args.concurrency)
+            finally:
+                server.terminate()
+                server.wait()
+            results['modes'][worker_class] = mode
+            for route, stats in mode.items():
+                print(f"  {route:<12} {stats['throughput_rps']} req/s  p50 {stats['p50_ms']} ms  "
+                      f"p95 {stats['p95_ms']} ms  errors {stats['errors']}")
+    finally:
+        stub.terminate()
+        stub.wait()
+
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f'\nResults written to {args.output}')
+
+if __name__ == '__main__':
+    main()
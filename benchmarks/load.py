@@ -0,0 +1,286 @@
+import os
+import io
+import re
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import subprocess
+import threading
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+ADMIN_PAGES = ['/admin/', '/admin/jobs', '/admin/users', '/admin/candidates', '/admin/employers',
+               '/admin/resumes', '/admin/aggregated-jobs', '/admin/applications']
+SEARCH_TERMS = ['py', 'engineer', 'data', 'manager', 'senior', 'devops', 'design', 'tech']
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return None
+    index = max(0, min(len(sorted_values) - 1, int(round(pct / 100.0 * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+def summarize(samples, errors, wall_time):
+    latencies = sorted(samples)
+    count = len(latencies)
+    return {
+        'requests': count,
+        'errors': errors,
+        'throughput_rps': round(count / wall_time, 2) if wall_time else None,
+        'mean_ms': round(sum(latencies) / count, 2) if count else None,
+        'p50_ms': percentile(latencies, 50),
+        'p95_ms': percentile(latencies, 95),
+        'p99_ms': percentile(latencies, 99),
+        'max_ms': latencies[-1] if latencies else None,
+    }
+
+def build_resume_docx():
+    from docx import Document
+    document = Document()
+    document.add_paragraph('Load Test Candidate')
+    document.add_paragraph('Senior Software Engineer with 6 years of experience.')
+    document.add_paragraph('Skills: Python, Flask, SQL, Docker, Kubernetes, AWS, React')
+    document.add_paragraph("Bachelor's of Science in Computer Science")
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+class TestClientDriver:
+
+    def __init__(self, app):
+        self.app = app
+        self.app.config['WTF_CSRF_ENABLED'] = False
+        self.local = threading.local()
+
+    def client(self, user_id):
+        clients = getattr(self.local, 'clients', None)
+        if clients is None:
+            clients = self.local.clients = {}
+        if user_id not in clients:
+            client = self.app.test_client()
+            if user_id is not None:
+                with client.session_transaction() as session:
+                    session['_user_id'] = str(user_id)
+                    session['_fresh'] = True
+            clients[user_id] = client
+        return clients[user_id]
+
+    def request(self, method, path, user_id=None, data=None):
+        client = self.client(user_id)
+        if method == 'POST':
+            response = client.post(path, data=data, content_type='multipart/form-data')
+        else:
+            response = client.get(path)
+        return response.status_code
+
+class HttpDriver:
+
+    def __init__(self, base_url, credentials):
+        import requests
+        self.requests = requests
+        self.base_url = base_url.rstrip('/')
+        self.credentials = credentials
+        self.local = threading.local()
+
+    def client(self, user_id):
+        sessions = getattr(self.local, 'sessions', None)
+        if sessions is None:
+            sessions = self.local.sessions = {}
+        if user_id not in sessions:
+            session = self.requests.Session()
+            if user_id is not None:
+                email, password = self.credentials[user_id]
+                page = session.get(f'{self.base_url}/auth/login')
+                token = re.search(r'name="csrf_token"[^>]*value="([^"]+)"', page.text)
+                session.post(f'{self.base_url}/auth/login', data={
+                    'csrf_token': token.group(1) if token else '',
+                    'email': email,
+                    'password': password,
+                }, allow_redirects=False)
+            sessions[user_id] = session
+        return sessions[user_id]
+
+    def request(self, method, path, user_id=None, data=None):
+        session = self.client(user_id)
+        url = f'{self.base_url}{path}'
+        if method == 'POST':
+            files = {key: (value[1], value[0]) for key, value in data.items() if isinstance(value, tuple)}
+            fields = {key: value for key, value in data.items() if not isinstance(value, tuple)}
+            page = session.get(url)
+            token = re.search(r'name="csrf_token"[^>]*value="([^"]+)"', page.text)
+            if token:
+                fields['csrf_token'] = token.group(1)
+            response = session.post(url, data=fields, files=files, allow_redirects=False)
+        else:
+            response = session.get(url, allow_redirects=False)
+        return response.status_code
+
+def build_scenarios(job_ids, candidate_user_id, admin_user_id, resume_bytes, rng):
+    def job_list():
+        page = rng.randint(1, 50)
+        if rng.random() < 0.5:
+            return 'GET', f'/jobs/?page={page}', None, None
+        return 'GET', f'/jobs/?keyword={rng.choice(SEARCH_TERMS)}&page={page}', None, None
+
+    def api_search():
+        return 'GET', f'/jobs/api/search?q={rng.choice(SEARCH_TERMS)}', None, None
+
+    def job_detail():
+        return 'GET', f'/jobs/{rng.choice(job_ids)}', None, None
+
+    def recommended():
+        return 'GET', '/resumes/recommended', candidate_user_id, None
+
+    def upload():
+        data = {'resume': (io.BytesIO(resume_bytes), f'loadtest_resume_{rng.randrange(10 ** 9)}.docx')}
+        return 'POST', '/resumes/upload', candidate_user_id, data
+
+    def admin():
+        return 'GET', rng.choice(ADMIN_PAGES), admin_user_id, None
+
+    return {
+        'job_list': job_list,
+        'api_search': api_search,
+        'job_detail': job_detail,
+        'recommended': recommended,
+        'upload': upload,
+        'admin': admin,
+    }
+
+def run_scenario(driver, scenario, requests_count, concurrency):
+    samples = []
+    errors = [0]
+    lock = threading.Lock()
+    remaining = [requests_count]
+
+    def worker():
+        while True:
+            with lock:
+                if remaining[0] <= 0:
+                    return
+                remaining[0] -= 1
+                method, path, user_id, data = scenario()
+            start = time.perf_counter()
+            try:
+                status = driver.request(method, path, user_id=user_id, data=data)
+            except Exception:
+                status = 599
+            elapsed = (time.perf_counter() - start) * 1000
+            with lock:
+                samples.append(round(elapsed, 3))
+                if status >= 400:
+                    errors[0] += 1
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return summarize(samples, errors[0], time.perf_counter() - started)
+
+def git_revision():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', 'HEAD'], stderr=subprocess.DEVNULL).decode().strip()
+    except Exception:
+        return None
+
+def compare(current, previous_path):
+    with open(previous_path) as f:
+        previous = json.load(f)
+    print(f"\nComparison against {previous_path} ({previous.get('git_revision')}):")
+    for route, stats in current['routes'].items():
+        old = previous.get('routes', {}).get(route)
+        if not old or not old.get('p95_ms') or not stats.get('p95_ms'):
+            continue
+        delta = (stats['p95_ms'] - old['p95_ms']) / old['p95_ms'] * 100
+        print(f"  {route:<12} p95 {old['p95_ms']:>9.2f} -> {stats['p95_ms']:>9.2f} ms ({delta:+.1f}%)")
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='Load-test the TalentBridge routes.')
+    arg_parser.add_argument('--base-url', help='Drive a running server (e.g. gunicorn) instead of the Flask test client')
+    arg_parser.add_argument('--requests', type=int, default=200, help='Requests per route')
+    arg_parser.add_argument('--concurrency', type=int, default=1)
+    arg_parser.add_argument('--routes', default='job_list,api_search,job_detail,recommended,upload,admin')
+    arg_parser.add_argument('--seed-scale', action='store_true', help='Seed the scaled dataset before running')
+    arg_parser.add_argument('--users', type=int, default=1000)
+    arg_parser.add_argument('--jobs', type=int, default=100000)
+    arg_parser.add_argument('--aggregated-jobs', type=int, default=1000000)
+    arg_parser.add_argument('--resumes', type=int, default=1000)
+    arg_parser.add_argument('--seed', type=int, default=42)
+    arg_parser.add_argument('--output', default='bench_output.json')
+    arg_parser.add_argument('--compare', help='Previous results file to compare p95 latencies against')
+    args = arg_parser.parse_args()
+
+    import seed_data
+    from talentbridge.extensions import db
+    from talentbridge.models import User, Job, Resume, AggregatedJob
+
+    app = seed_data.app
+    seed_data.seed_database()
+    if args.seed_scale:
+        seed_data.seed_scaled_database(num_users=args.users, num_jobs=args.jobs,
+                                       num_aggregated_jobs=args.aggregated_jobs,
+                                       num_resumes=args.resumes, seed=args.seed)
+
+    with app.app_context():
+        admin = User.query.filter_by(email='admin@talentbridge.com').first()
+        candidate = User.query.join(Resume).filter(Resume.is_primary == True).first() \
+            or User.query.filter_by(email='john.doe@example.com').first()
+        job_ids = [row[0] for row in db.session.query(Job.id).filter_by(is_active=True).limit(10000).all()]
+        dataset = {
+            'users': User.query.count(),
+            'jobs': Job.query.count(),
+            'aggregated_jobs': AggregatedJob.query.count(),
+            'resumes': Resume.query.count(),
+        }
+        candidate_password = 'password123'
+        credentials = {
+            admin.id: (admin.email, 'admin123'),
+            candidate.id: (candidate.email, candidate_password),
+        }
+        admin_id, candidate_id = admin.id, candidate.id
+
+    if args.base_url:
+        driver = HttpDriver(args.base_url, credentials)
+    else:
+        driver = TestClientDriver(app)
+
+    rng = random.Random(args.seed)
+    scenarios = build_scenarios(job_ids, candidate_id, admin_id, build_resume_docx(), rng)
+
+    results = {
+        'timestamp': datetime.utcnow().isoformat(),
+        'git_revision': git_revision(),
+        'python': platform.python_version(),
+        'driver': 'http' if args.base_url else 'test_client',
+        'base_url': args.base_url,
+        'requests_per_route': args.requests,
+        'concurrency': args.concurrency,
+        'dataset': dataset,
+        'routes': {},
+    }
+
+    for route in args.routes.split(','):
+        route = route.strip()
+        if route not in scenarios:
+            print(f"Unknown route '{route}', skipping")
+            continue
+        print(f"Running {route} ({args.requests} requests, concurrency {args.concurrency})...")
+        stats = run_scenario(driver, scenarios[route], args.requests, args.concurrency)
+        results['routes'][route] = stats
+        print(f"  {stats['throughput_rps']} req/s  p50 {stats['p50_ms']} ms  "
+              f"p95 {stats['p95_ms']} ms  p99 {stats['p99_ms']} ms  errors {stats['errors']}")
+
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+if __name__ == '__main__':
+    main()
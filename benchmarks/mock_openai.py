@@ -0,0 +1,108 @@
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from talentbridge.resumes.parser import ResumeParser
+
+class MockOpenAIHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    parser = ResumeParser()
+    options = None
+    counters = {'requests': 0, 'rate_limited': 0, 'errors': 0}
+    lock = threading.Lock()
+
+    def log_message(self, format, *args):
+        if self.options.verbose:
+            super().log_message(format, *args)
+
+    def send_json(self, status, payload, headers=None):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path.rstrip('/') == '/stats':
+            with self.lock:
+                return self.send_json(200, dict(self.counters))
+        self.send_json(404, {'error': {'message': 'Not found'}})
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        request = json.loads(self.rfile.read(length) or b'{}')
+        if not self.path.endswith('/chat/completions'):
+            return self.send_json(404, {'error': {'message': 'Not found'}})
+
+        options = self.options
+        with self.lock:
+            self.counters['requests'] += 1
+        roll = random.random()
+        if roll < options.rate_limit_rate:
+            with self.lock:
+                self.counters['rate_limited'] += 1
+            return self.send_json(429, {'error': {'message': 'Rate limit reached', 'type': 'requests'}},
+                                  {'retry-after': str(options.retry_after)})
+        if roll < options.rate_limit_rate + options.error_rate:
+            with self.lock:
+                self.counters['errors'] += 1
+            return self.send_json(500, {'error': {'message': 'Internal server error', 'type': 'server_error'}})
+
+        time.sleep(max(0.0, random.gauss(options.latency, options.jitter)))
+
+        prompt = ' '.join(message.get('content', '') for message in request.get('messages', []))
+        user_text = request.get('messages', [{}])[-1].get('content', '')
+        skills = self.parser.extract_skills(user_text)
+        content = ', '.join(skills) if skills else 'communication'
+        prompt_tokens = len(prompt) // 4
+        completion_tokens = max(1, len(content) // 4)
+        self.send_json(200, {
+            'id': f'chatcmpl-mock{random.getrandbits(48):x}',
+            'object': 'chat.completion',
+            'created': int(time.time()),
+            'model': request.get('model', 'gpt-4o'),
+            'choices': [{
+                'index': 0,
+                'message': {'role': 'assistant', 'content': content},
+                'finish_reason': 'stop',
+            }],
+            'usage': {
+                'prompt_tokens': prompt_tokens,
+                'completion_tokens': completion_tokens,
+                'total_tokens': prompt_tokens + completion_tokens,
+            },
+        })
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='Local stand-in for the OpenAI chat completions API.')
+    arg_parser.add_argument('--host', default='127.0.0.1')
+    arg_parser.add_argument('--port', type=int, default=8099)
+    arg_parser.add_argument('--latency', type=float, default=0.5, help='Mean response time in seconds')
+    arg_parser.add_argument('--jitter', type=float, default=0.1)
+    arg_parser.add_argument('--rate-limit-rate', type=float, default=0.0, help='Fraction of requests answered with 429')
+    arg_parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests answered with 500')
+    arg_parser.add_argument('--retry-after', type=float, default=1.0)
+    arg_parser.add_argument('--verbose', action='store_true')
+    args = arg_parser.parse_args()
+
+    MockOpenAIHandler.options = args
+    server = ThreadingHTTPServer((args.host, args.port), MockOpenAIHandler)
+    print(f'Mock OpenAI API on http://{args.host}:{args.port}/v1 '
+          f'(set OPENAI_BASE_URL to this and OPENAI_API_KEY to any value)')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import Config
+
+DEFAULT_POLICIES = ['scrypt', 'scrypt:16384:8:1', 'pbkdf2:sha256:1000000', 'pbkdf2:sha256:600000', 'pbkdf2:sha256:260000']
+
+def verify_rate(hasher, pwhash, duration, threads):
+    deadline = time.perf_counter() + duration
+
+    def worker():
+        count = 0
+        while time.perf_counter() < deadline:
+            hasher.verify(pwhash, 'correct horse battery staple')
+            count += 1
+        return count
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        total = sum(pool.map(lambda _: worker(), range(threads)))
+    return total / (time.perf_counter() - started)
+
+def login_rate(policy, duration):
+    from talentbridge import create_app
+    from talentbridge.extensions import db
+    from talentbridge.models import User
+    from talentbridge.schema import upgrade_schema
+
+    class BenchConfig(Config):
+        SQLALCHEMY_DATABASE_URI = 'sqlite://'
+        WTF_CSRF_ENABLED = False
+        PASSWORD_HASH_METHOD = policy
+
+    app = create_app(BenchConfig)
+    upgrade_schema(app, db)
+    with app.app_context():
+        user = User(email='bench@example.com', full_name='Bench User')
+        user.set_password('correct horse battery staple')
+        db.session.add(user)
+        db.session.commit()
+
+    client = app.test_client()
+    count = 0
+    deadline = time.perf_counter() + duration
+    started = time.perf_counter()
+    while time.perf_counter() < deadline:
+        response = client.post('/auth/login', data={
+            'email': 'bench@example.com',
+            'password': 'correct horse battery staple',
+        })
+        assert response.status_code == 302
+        client.get('/auth/logout')
+        count += 1
+    return count / (time.perf_counter() - started)
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='Benchmark password hashing policies.')
+    arg_parser.add_argument('--policies', default=','.join(DEFAULT_POLICIES))
+    arg_parser.add_argument('--duration', type=float, default=3.0, help='Seconds per measurement')
+    arg_parser.add_argument('--threads', type=int, default=os.cpu_count() or 1)
+    arg_parser.add_argument('--skip-login', action='store_true', help='Only measure raw verification')
+    arg_parser.add_argument('--output', default='bench_output.json')
+    args = arg_parser.parse_args()
+
+    from talentbridge.security import PasswordHasher
+
+    results = {'python': platform.python_version(), 'cpus': os.cpu_count(), 'threads': args.threads, 'policies': {}}
+    print(f"{'policy':<28}{'hash ms':>10}{'verify/s/core':>16}{'verify/s x' + str(args.threads):>18}{'logins/s/core':>16}")
+    for policy in args.policies.split(','):
+        hasher = PasswordHasher(method=policy, workers=args.threads)
+        started = time.perf_counter()
+        pwhash = hasher.hash('correct horse battery staple')
+        hash_ms = (time.perf_counter() - started) * 1000
+
+        single = verify_rate(hasher, pwhash, args.duration, 1)
+        parallel = verify_rate(hasher, pwhash, args.duration, args.threads)
+        logins = None if args.skip_login else login_rate(policy, args.duration)
+
+        results['policies'][policy] = {
+            'canonical_method': hasher.canonical_method,
+            'hash_ms': round(hash_ms, 2),
+            'verify_per_second_per_core': round(single, 2),
+            'verify_per_second_all_threads': round(parallel, 2),
+            'logins_per_second_per_core': round(logins, 2) if logins is not None else None,
+        }
+        print(f"{policy:<28}{hash_ms:>10.1f}{single:>16.1f}{parallel:>18.1f}"
+              f"{(f'{logins:.1f}' if logins is not None else '-'):>16}")
+
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResults written to {args.output}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+import os
+import sys
+import json
+import argparse
+import platform
+import statistics
+import subprocess
+import tempfile
+from collections import defaultdict
+from datetime import datetime
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, BENCH_DIR)
+
+from load import git_revision
+
+HEAVY_MODULES = ['openai', 'PyPDF2', 'docx', 'numpy', 'bs4', 'requests', 'trafilatura']
+
+# What a gunicorn worker does when it boots: import the package and build the app.
+BOOT = '''
+import json, sys, time
+started = time.perf_counter()
+from talentbridge import create_app
+create_app()
+elapsed = time.perf_counter() - started
+print(json.dumps({"boot_ms": elapsed * 1000, "heavy": [name for name in %r if name in sys.modules]}))
+'''
+
+def parse_importtime(stderr):
+    total_us = 0
+    by_package = defaultdict(int)
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        head, cumulative_us, name = line.split('|')
+        # Nesting is shown by indentation; one leading space marks a top-level import.
+        if len(name) - len(name.lstrip()) == 1:
+            total_us += int(cumulative_us)
+        by_package[name.strip().split('.')[0]] += int(head.split(':')[1])
+    return total_us, by_package
+
+def profile(cwd, runs, env):
+    boots, imports, packages, heavy = [], [], defaultdict(list), []
+    for _ in range(runs):
+        result = subprocess.run([sys.executable, '-X', 'importtime', '-c', BOOT % (HEAVY_MODULES,)],
+                                cwd=cwd, env=env, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr[-2000:])
+        output = json.loads(result.stdout.strip().splitlines()[-1])
+        total_us, by_package = parse_importtime(result.stderr)
+        boots.append(output['boot_ms'])
+        imports.append(total_us / 1000)
+        heavy = output['heavy']
+        for name, self_us in by_package.items():
+            packages[name].append(self_us / 1000)
+    top = sorted(((name, statistics.median(values)) for name, values in packages.items()), key=lambda item: -item[1])
+    return {
+        'boot_ms': round(statistics.median(boots), 1),
+        'import_ms': round(statistics.median(imports), 1),
+        'heavy_modules_loaded': heavy,
+        'top_packages_ms': {name: round(ms, 1) for name, ms in top[:15]},
+    }
+
+def profile_revision(revision, runs, env):
+    with tempfile.TemporaryDirectory() as directory:
+        worktree = os.path.join(directory, 'tree')
+        subprocess.run(['git', 'worktree', 'add', '--detach', worktree, revision], cwd=ROOT_DIR, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            return profile(worktree, runs, env)
+        finally:
+            subprocess.run(['git', 'worktree', 'remove', '--force', worktree], cwd=ROOT_DIR,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+def report(label, stats):
+    print(f"{label}: boot {stats['boot_ms']} ms, imports {stats['import_ms']} ms")
+    print(f"  heavy modules loaded at boot: {', '.join(stats['heavy_modules_loaded']) or 'none'}")
+    for name, ms in list(stats['top_packages_ms'].items())[:8]:
+        print(f"  {name:<24}{ms:>8} ms")
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='Profile worker start-up with python -X importtime.')
+    arg_parser.add_argument('--runs', type=int, default=5, help='Fresh interpreters per measurement (median is reported)')
+    arg_parser.add_argument('--baseline', help='Git revision to profile for comparison, e.g. HEAD~1')
+    arg_parser.add_argument('--database-url', default=os.environ.get('DATABASE_URL', 'sqlite://'))
+    arg_parser.add_argument('--output', default='startup_output.json')
+    args = arg_parser.parse_args()
+
+    env = dict(os.environ, DATABASE_URL=args.database_url, PYTHONPATH='')
+    results = {
+        'timestamp': datetime.utcnow().isoformat(),
+        'git_revision': git_revision(),
+        'python': platform.python_version(),
+        'runs': args.runs,
+        'current': profile(ROOT_DIR, args.runs, env),
+    }
+    if args.baseline:
+        results['baseline_revision'] = args.baseline
+        results['baseline'] = profile_revision(args.baseline, args.runs, env)
+        report(f'baseline ({args.baseline})', results['baseline'])
+    report('current', results['current'])
+    if args.baseline:
+        saved = results['baseline']['boot_ms'] - results['current']['boot_ms']
+        print(f"\nBoot time {results['baseline']['boot_ms']} -> {results['current']['boot_ms']} ms ({saved:.1f} ms saved)")
+
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f'\nResults written to {args.output}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import tempfile
+from datetime import datetime
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, BENCH_DIR)
+
+from load import git_revision
+
+def capture_context(app, endpoint, url, user_id=None, **view_args):
+    from flask import template_rendered
+    from flask_login import login_user
+    from talentbridge.models import load_user
+
+    captured = []
+
+    def record(sender, template, context, **extra):
+        captured.append((template, context))
+
+    if user_id is not None:
+        login_user(load_user(user_id))
+    with template_rendered.connected_to(record, app):
+        app.view_functions[endpoint](**view_args)
+    if not captured:
+        raise RuntimeError(f'{url} did not render a template')
+    return captured[0]
+
+def time_renders(template, context, iterations, before=None):
+    samples = []
+    for _ in range(iterations):
+        if before:
+            before()
+        started = time.perf_counter()
+        template.render(context)
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return {
+        'mean_ms': round(sum(samples) / len(samples), 3),
+        'p50_ms': round(samples[len(samples) // 2], 3),
+        'p95_ms': round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 3),
+    }
+
+def compile_times(app):
+    from jinja2 import FileSystemBytecodeCache
+
+    names = app.jinja_env.list_templates(extensions=['html'])
+
+    def load_all(bytecode_cache):
+        env = app.jinja_env.overlay(cache_size=len(names) + 1, bytecode_cache=bytecode_cache)
+        started = time.perf_counter()
+        for name in names:
+            env.get_template(name)
+        return round((time.perf_counter() - started) * 1000, 2)
+
+    with tempfile.TemporaryDirectory() as directory:
+        source_ms = load_all(FileSystemBytecodeCache(directory))
+        bytecode_ms = load_all(FileSystemBytecodeCache(directory))
+    return {'templates': len(names), 'from_source_ms': source_ms, 'from_bytecode_ms': bytecode_ms}
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='Measure per-template render time with and without fragment caching.')
+    arg_parser.add_argument('--database-url', default=os.environ.get('DATABASE_URL'), required=not os.environ.get('DATABASE_URL'),
+                            help='A seeded database (see seed_data.py --scale)')
+    arg_parser.add_argument('--iterations', type=int, default=200, help='Renders per template and mode')
+    arg_parser.add_argument('--output', default='template_output.json')
+    args = arg_parser.parse_args()
+
+    os.environ['DATABASE_URL'] = args.database_url
+    os.environ.setdefault('TEMPLATE_PRECOMPILE', '0')
+    from talentbridge import create_app
+    from talentbridge.extensions import db, fragment_cache
+    from talentbridge.models import Job, Resume, RecommendedJob, User
+
+    app = create_app()
+    with app.app_context():
+        candidate = User.query.join(RecommendedJob, RecommendedJob.user_id == User.id).first() or \
+            User.query.join(Resume, Resume.user_id == User.id).first()
+        job_id = db.session.query(Job.id).filter_by(is_active=True).order_by(Job.posted_date.desc()).first()[0]
+
+    pages = [
+        ('home', 'main.index', '/', None, {}),
+        ('job_list', 'jobs.job_list', '/jobs/', None, {}),
+        ('job_list_logged_in', 'jobs.job_list', '/jobs/', candidate.id, {}),
+        ('job_detail', 'jobs.job_detail', f'/jobs/{job_id}', None, {'job_id': job_id}),
+        ('recommended', 'resumes.recommended', '/resumes/recommended', candidate.id, {}),
+    ]
+
+    results = {
+        'timestamp': datetime.utcnow().isoformat(),
+        'git_revision': git_revision(),
+        'python': platform.python_version(),
+        'iterations': args.iterations,
+        'compile': compile_times(app),
+        'templates': {},
+    }
+    print(f"Loading {results['compile']['templates']} templates: {results['compile']['from_source_ms']} ms from source, "
+          f"{results['compile']['from_bytecode_ms']} ms from bytecode cache\n")
+    print(f"{'page':<22}{'template':<30}{'no cache':>12}{'miss':>12}{'hit':>12}  (mean ms)")
+
+    for label, endpoint, url, user_id, view_args in pages:
+        with app.test_request_context(url):
+            template, context = capture_context(app, endpoint, url, user_id, **view_args)
+            environment = app.jinja_env
+            environment.fragment_cache = None
+            uncached = time_renders(template, context, args.iterations)
+            environment.fragment_cache = fragment_cache
+            miss = time_renders(template, context, args.iterations, before=fragment_cache.clear)
+            template.render(context)
+            hit = time_renders(template, context, args.iterations)
+        results['templates'][label] = {'template': template.name, 'no_cache': uncached, 'miss': miss, 'hit': hit}
+        print(f"{label:<22}{template.name:<30}{uncached['mean_ms']:>12}{miss['mean_ms']:>12}{hit['mean_ms']:>12}")
+
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f'\nResults written to {args.output}')
+
+if __name__ == '__main__':
+    main()
@@ -6,17 +6,69 @@ class Config:
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL')
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     SQLALCHEMY_ENGINE_OPTIONS = {
-        'pool_recycle': 300,
-        'pool_pre_ping': True,
+        'pool_recycle': int(os.environ.get('DB_POOL_RECYCLE', 300)),
+        'pool_pre_ping': os.environ.get('DB_POOL_PRE_PING', '0') == '1',
     }
+    DB_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', 5))
+    DB_MAX_OVERFLOW = int(os.environ.get('DB_MAX_OVERFLOW', 10))
+    DB_POOL_TIMEOUT = int(os.environ.get('DB_POOL_TIMEOUT', 30))
+    DATABASE_REPLICA_URLS = os.environ.get('DATABASE_REPLICA_URLS', '')
+    DB_REPLICA_STICKY_SECONDS = int(os.environ.get('DB_REPLICA_STICKY_SECONDS', 5))
+    MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'migrations')
     
     PERMANENT_SESSION_LIFETIME = timedelta(hours=4)
     SESSION_PERMANENT = True
     
     UPLOAD_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'uploads')
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024
+    UPLOAD_CHUNK_SIZE = int(os.environ.get('UPLOAD_CHUNK_SIZE', 1024 * 1024))
+    UPLOAD_BYTES_PER_SECOND = int(os.environ.get('UPLOAD_BYTES_PER_SECOND', 2 * 1024 * 1024))
+    UPLOAD_SESSION_TTL = int(os.environ.get('UPLOAD_SESSION_TTL', 24 * 3600))
     ALLOWED_EXTENSIONS = {'pdf', 'docx'}
+    RESUME_DOWNLOAD_MODE = os.environ.get('RESUME_DOWNLOAD_MODE', '').lower()
+    RESUME_ACCEL_PREFIX = os.environ.get('RESUME_ACCEL_PREFIX', '/protected/resumes/')
+    RESUME_PREVIEWS = os.environ.get('RESUME_PREVIEWS', '1') == '1'
+    RESUME_TEXT_CODEC = os.environ.get('RESUME_TEXT_CODEC', 'zlib').lower()
+    RESUME_PREVIEW_DIR = os.environ.get('RESUME_PREVIEW_DIR') or os.path.join(UPLOAD_FOLDER, 'previews')
     
     OPENAI_API_KEY = os.environ.get('OPENAI_API_KEY')
+    OPENAI_MODEL = os.environ.get('OPENAI_MODEL', 'gpt-4o')
+    OPENAI_CONCURRENCY = int(os.environ.get('OPENAI_CONCURRENCY', 8))
+    OPENAI_REQUESTS_PER_MINUTE = int(os.environ.get('OPENAI_REQUESTS_PER_MINUTE', 500))
+    OPENAI_TOKENS_PER_MINUTE = int(os.environ.get('OPENAI_TOKENS_PER_MINUTE', 30000))
+    OPENAI_CACHE_DIR = os.environ.get('OPENAI_CACHE_DIR') or os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cache', 'openai')
+    OPENAI_INPUT_COST_PER_1M = float(os.environ.get('OPENAI_INPUT_COST_PER_1M', 2.50))
+    OPENAI_OUTPUT_COST_PER_1M = float(os.environ.get('OPENAI_OUTPUT_COST_PER_1M', 10.00))
     
     JOBS_PER_PAGE = 12
+    API_PAGE_SIZE = int(os.environ.get('API_PAGE_SIZE', 50))
+    API_MAX_PAGE_SIZE = int(os.environ.get('API_MAX_PAGE_SIZE', 200))
+    API_CACHE_SECONDS = int(os.environ.get('API_CACHE_SECONDS', 30))
+    API_COMPRESS_MIN_SIZE = int(os.environ.get('API_COMPRESS_MIN_SIZE', 1024))
+    API_GZIP_LEVEL = int(os.environ.get('API_GZIP_LEVEL', 6))
+    API_BROTLI_QUALITY = int(os.environ.get('API_BROTLI_QUALITY', 5))
+    
+    MATCHING_MODE = os.environ.get('MATCHING_MODE', 'keyword')
+    EMBEDDING_DIM = 256
+    EMBEDDING_INDEX_DIR = os.environ.get('EMBEDDING_INDEX_DIR') or os.path.join(os.path.dirname(os.path.abspath(__file__)), 'indexes')
+    EMBEDDING_NPROBE = int(os.environ.get('EMBEDDING_NPROBE', 8))
+    
+    RECOMMENDATION_TOP_K = 50
+    RECOMMENDATION_WORKERS = int(os.environ.get('RECOMMENDATION_WORKERS', 0)) or None
+    
+    BULK_CHUNK_SIZE = int(os.environ.get('BULK_CHUNK_SIZE', 5000))
+    BULK_BACKGROUND_THRESHOLD = int(os.environ.get('BULK_BACKGROUND_THRESHOLD', 20000))
+    BULK_STALE_SECONDS = int(os.environ.get('BULK_STALE_SECONDS', 600))
+    
+    USER_CACHE_TTL = int(os.environ.get('USER_CACHE_TTL', 30))
+    USER_CACHE_URL = os.environ.get('USER_CACHE_URL')
+    
+    TEMPLATE_BYTECODE_DIR = os.environ.get('TEMPLATE_BYTECODE_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cache', 'jinja'))
+    TEMPLATE_PRECOMPILE = os.environ.get('TEMPLATE_PRECOMPILE', '1') == '1'
+    FRAGMENT_CACHE_TTL = int(os.environ.get('FRAGMENT_CACHE_TTL', 3600))
+    FRAGMENT_CACHE_URL = os.environ.get('FRAGMENT_CACHE_URL')
+    STATIC_MAX_AGE = int(os.environ.get('STATIC_MAX_AGE', 365 * 24 * 3600))
+    
+    PASSWORD_HASH_METHOD = os.environ.get('PASSWORD_HASH_METHOD', 'scrypt')
+    PASSWORD_HASH_SALT_LENGTH = 16
+    PASSWORD_HASH_WORKERS = int(os.environ.get('PASSWORD_HASH_WORKERS', 0)) or None
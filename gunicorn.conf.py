@@ -0,0 +1,34 @@
+import os
+import multiprocessing
+
+# Serving modes:
+#   sync    - one request per worker process (the old default)
+#   gthread - WEB_CONCURRENCY processes x GUNICORN_THREADS threads; threads waiting on OpenAI,
+#             scraping or file I/O release the GIL so other requests keep running
+#   gevent  - cooperative greenlets, GUNICORN_WORKER_CONNECTIONS per process; requires
+#             `pip install gevent psycogreen`
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:5000')
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'gthread')
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+# Gunicorn silently upgrades sync workers to gthread when threads > 1.
+threads = int(os.environ.get('GUNICORN_THREADS', 8)) if worker_class == 'gthread' else 1
+worker_connections = int(os.environ.get('GUNICORN_WORKER_CONNECTIONS', 200))
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 60))
+keepalive = 5
+
+def post_fork(server, worker):
+    if worker_class != 'gevent':
+        return
+    # gevent's patched select module has no epoll, which trio needs at import time; the OpenAI
+    # client's HTTP stack imports trio when it is installed, so load it before the worker patches.
+    try:
+        import trio
+    except ImportError:
+        pass
+    # psycopg2 blocks in C code unless it is given a gevent-aware wait callback.
+    try:
+        from psycogreen.gevent import patch_psycopg
+    except ImportError:
+        server.log.warning('psycogreen is not installed; PostgreSQL queries will block the gevent loop')
+    else:
+        patch_psycopg()
@@ -1,17 +1,21 @@
 import os
 import sys
+import argparse
 
 os.environ.setdefault('DATABASE_URL', os.environ.get('DATABASE_URL', ''))
 
 from talentbridge import create_app
 from talentbridge.extensions import db
 from talentbridge.models import User, Job, Testimonial, AggregatedJob
+from talentbridge.datagen import DataGenerator
+from talentbridge.schema import upgrade_schema
+from talentbridge.skills import SkillIndex
 
 app = create_app()
 
 def seed_database():
+    upgrade_schema(app, db)
     with app.app_context():
-        db.create_all()
         
         if User.query.filter_by(email='admin@talentbridge.com').first():
             print("Database already seeded. Skipping...")
@@ -223,10 +227,51 @@ def seed_database():
             db.session.add(testimonial)
         
         db.session.commit()
+        SkillIndex().rebuild()
         print("Database seeded successfully!")
         print("\nAdmin credentials:")
         print("Email: admin@talentbridge.com")
         print("Password: admin123")
 
+def seed_scaled_database(num_users=1000, num_jobs=100000, num_aggregated_jobs=1000000,
+                         num_resumes=1000, num_applications=5000, num_saved_jobs=5000,
+                         resume_files=0, seed=42, batch_size=10000):
+    upgrade_schema(app, db)
+    with app.app_context():
+        
+        if User.query.filter_by(email='loadtest0@example.com').first():
+            print("Scaled dataset already present. Skipping...")
+            return
+        
+        generator = DataGenerator(seed=seed, batch_size=batch_size,
+                                  upload_folder=app.config['UPLOAD_FOLDER'])
+        report = generator.generate(users=num_users, jobs=num_jobs, aggregated_jobs=num_aggregated_jobs,
+                                    resumes=num_resumes, applications=num_applications,
+                                    saved=num_saved_jobs, resume_files=resume_files)
+        
+        for table, stats in report['tables'].items():
+            print(f"  {table}: {stats['rows']} rows in {stats['seconds']}s")
+        print(f"Scaled dataset seeded successfully in {report['seconds']}s!")
+
 if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser(description='Seed the TalentBridge database.')
+    arg_parser.add_argument('--scale', action='store_true', help='Also generate a scaled load-testing dataset')
+    arg_parser.add_argument('--users', type=int, default=1000)
+    arg_parser.add_argument('--jobs', type=int, default=100000)
+    arg_parser.add_argument('--aggregated-jobs', type=int, default=1000000)
+    arg_parser.add_argument('--resumes', type=int, default=1000)
+    arg_parser.add_argument('--applications', type=int, default=5000)
+    arg_parser.add_argument('--saved-jobs', type=int, default=5000)
+    arg_parser.add_argument('--resume-files', type=int, default=0,
+                            help='Number of resumes that also get a generated PDF/DOCX file on disk')
+    arg_parser.add_argument('--batch-size', type=int, default=10000)
+    arg_parser.add_argument('--seed', type=int, default=42)
+    args = arg_parser.parse_args()
+    
     seed_database()
+    if args.scale:
+        seed_scaled_database(num_users=args.users, num_jobs=args.jobs,
+                             num_aggregated_jobs=args.aggregated_jobs,
+                             num_resumes=args.resumes, num_applications=args.applications,
+                             num_saved_jobs=args.saved_jobs, resume_files=args.resume_files,
+                             seed=args.seed, batch_size=args.batch_size)
@@ -1,20 +1,32 @@
 import os
+import click
 from flask import Flask
 from config import Config
-from talentbridge.extensions import db, login_manager
+from talentbridge.extensions import db, db_topology, login_manager, user_cache, fragment_cache, password_hasher, static_assets
+from talentbridge.templating import init_templates, compile_templates
+from talentbridge.schema import init_migrations
 
 def create_app(config_class=Config):
     app = Flask(__name__)
     app.config.from_object(config_class)
+    init_templates(app, fragment_cache)
     
     os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
     os.makedirs(os.path.join(app.config['UPLOAD_FOLDER'], 'resumes'), exist_ok=True)
     
-    db.init_app(app)
+    db_topology.init_app(app, db)
+    # Alembic adds ~120ms to a boot and only the `flask db` commands need it. The flask CLI builds
+    # the app inside a click context; gunicorn workers do not.
+    if click.get_current_context(silent=True) is not None:
+        init_migrations(app, db)
     login_manager.init_app(app)
     login_manager.login_view = 'auth.login'
     login_manager.login_message = 'Please log in to access this page.'
     login_manager.login_message_category = 'info'
+    user_cache.init_app(app, 'USER_CACHE_TTL', 'USER_CACHE_URL')
+    password_hasher.init_app(app)
+    fragment_cache.init_app(app, 'FRAGMENT_CACHE_TTL', 'FRAGMENT_CACHE_URL')
+    static_assets.init_app(app)
     
     from talentbridge.auth import bp as auth_bp
     app.register_blueprint(auth_bp, url_prefix='/auth')
@@ -28,10 +40,16 @@ def create_app(config_class=Config):
     from talentbridge.admin import bp as admin_bp
     app.register_blueprint(admin_bp, url_prefix='/admin')
     
+    from talentbridge.api import bp as api_bp
+    app.register_blueprint(api_bp, url_prefix='/api/v1')
+    
     from talentbridge.main import bp as main_bp
     app.register_blueprint(main_bp)
     
-    with app.app_context():
-        db.create_all()
+    from talentbridge.commands import register_commands
+    register_commands(app)
+    
+    if app.config['TEMPLATE_PRECOMPILE']:
+        compile_templates(app)
     
     return app
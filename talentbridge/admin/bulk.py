@@ -0,0 +1,125 @@
+import json
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, List
+from flask import current_app
+from sqlalchemy import func, update
+from talentbridge.extensions import db
+from talentbridge.models import BulkAction, Candidate, Employer, JobApplication
+from talentbridge.admin.exports import EXPORTS
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+BULK_TARGETS = {
+    'applications': {
+        'model': JobApplication,
+        'statuses': ('submitted', 'reviewed', 'interviewing', 'hired', 'rejected'),
+        'endpoint': 'admin.manage_applications',
+    },
+    'candidates': {
+        'model': Candidate,
+        'statuses': ('new', 'reviewing', 'contacted', 'rejected'),
+        'endpoint': 'admin.manage_candidates',
+    },
+    'employers': {
+        'model': Employer,
+        'statuses': ('pending', 'contacted', 'in_progress', 'closed'),
+        'endpoint': 'admin.manage_employers',
+    },
+}
+
+def selection(name: str, status: str, ids: List[int] = None, filters: Dict = None) -> List:
+    model = BULK_TARGETS[name]['model']
+    # Rows that already have the new status are left alone so counts reflect real changes.
+    conditions = [model.status.is_distinct_from(status)]
+    if ids is not None:
+        conditions.append(model.id.in_(ids))
+    else:
+        for arg, column in EXPORTS[name]['filters'].items():
+            if (filters or {}).get(arg):
+                conditions.append(column == filters[arg])
+    return conditions
+
+def expire_stale(action: BulkAction, stale_seconds: int) -> BulkAction:
+    # The thread dies with its worker when gunicorn restarts or recycles it, leaving the row 'running'.
+    # An action that has not committed a window for stale_seconds is reported as failed instead.
+    if action is not None and action.state in ('pending', 'running'):
+        cutoff = datetime.utcnow() - timedelta(seconds=stale_seconds)
+        if (action.updated_at or action.created_at) < cutoff:
+            action.state = 'failed'
+            action.error = 'The worker running this action stopped before it finished'
+            action.finished_at = datetime.utcnow()
+            db.session.commit()
+    return action
+
+class BulkStatusUpdater:
+
+    def __init__(self, chunk_size: int = 5000, background_threshold: int = 20000):
+        self.chunk_size = chunk_size
+        self.background_threshold = background_threshold
+
+    def count(self, name: str, status: str, filters: Dict) -> int:
+        model = BULK_TARGETS[name]['model']
+        return db.session.query(func.count(model.id)).filter(*selection(name, status, filters=filters)).scalar()
+
+    def apply(self, name: str, status: str, ids: List[int] = None, filters: Dict = None) -> int:
+        model = BULK_TARGETS[name]['model']
+        updated = 0
+        if ids is not None:
+            # Keep each IN list under the database's bound parameter limit.
+            for start in range(0, len(ids), self.chunk_size):
+                updated += self._update(model, status, selection(name, status, ids=ids[start:start + self.chunk_size]))
+        else:
+            updated = self._update(model, status, selection(name, status, filters=filters))
+        db.session.commit()
+        logger.info(f"Bulk set {updated} {name} to {status}")
+        return updated
+
+    def start(self, name: str, status: str, filters: Dict, user_id: int = None) -> BulkAction:
+        action = BulkAction(target=name, status=status, filters=json.dumps(filters),
+                            total=self.count(name, status, filters), created_by=user_id)
+        db.session.add(action)
+        db.session.commit()
+        thread = threading.Thread(target=self._run_in_context, args=(current_app._get_current_object(), action.id),
+                                  name=f'bulk-action-{action.id}', daemon=True)
+        thread.start()
+        return action
+
+    def run(self, action_id: int):
+        action = db.session.get(BulkAction, action_id)
+        model = BULK_TARGETS[action.target]['model']
+        conditions = selection(action.target, action.status, filters=json.loads(action.filters or '{}'))
+        action.state = 'running'
+        db.session.commit()
+        try:
+            low, high = db.session.query(func.min(model.id), func.max(model.id)).filter(*conditions).one()
+            if low is not None:
+                # Walk the primary key in fixed windows so each commit holds the write lock briefly
+                # and progress is visible to the polling page.
+                for start in range(low, high + 1, self.chunk_size):
+                    window = [model.id >= start, model.id < start + self.chunk_size]
+                    action.processed += self._update(model, action.status, conditions + window)
+                    db.session.commit()
+            action.state = 'done'
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Error running bulk action {action_id}: {str(e)}")
+            action.state = 'failed'
+            action.error = str(e)
+        action.finished_at = datetime.utcnow()
+        db.session.commit()
+        logger.info(f"Bulk action {action_id} {action.state}: {action.processed}/{action.total} {action.target}")
+        return action
+
+    def _run_in_context(self, app, action_id: int):
+        with app.app_context():
+            try:
+                self.run(action_id)
+            finally:
+                db.session.remove()
+
+    def _update(self, model, status: str, conditions: List) -> int:
+        statement = update(model).where(*conditions).values(status=status)
+        return db.session.execute(statement.execution_options(synchronize_session=False)).rowcount
@@ -0,0 +1,111 @@
+import io
+import csv
+import json
+from datetime import date, datetime
+from typing import Dict, Iterable, Iterator, List
+from sqlalchemy import select
+from talentbridge.extensions import db
+from talentbridge.models import User, Job, AggregatedJob, Candidate, Employer, JobApplication
+
+EXPORTS = {
+    'candidates': {
+        'columns': [Candidate.id, Candidate.name, Candidate.email, Candidate.phone, Candidate.skills,
+                    Candidate.experience_years, Candidate.current_role, Candidate.expected_salary,
+                    Candidate.status, Candidate.notes, Candidate.submitted_at],
+        'order_by': Candidate.id,
+        'filters': {'status': Candidate.status},
+    },
+    'employers': {
+        'columns': [Employer.id, Employer.company_name, Employer.contact_name, Employer.contact_email,
+                    Employer.phone, Employer.industry, Employer.company_size, Employer.hiring_needs,
+                    Employer.positions_count, Employer.budget_range, Employer.timeline, Employer.status,
+                    Employer.notes, Employer.submitted_at],
+        'order_by': Employer.id,
+        'filters': {'status': Employer.status},
+    },
+    'applications': {
+        'columns': [JobApplication.id, JobApplication.user_id, User.full_name.label('applicant_name'),
+                    User.email.label('applicant_email'), JobApplication.job_id, Job.title.label('job_title'),
+                    Job.company.label('company'), JobApplication.resume_id, JobApplication.status,
+                    JobApplication.applied_at],
+        'joins': [(User, JobApplication.user_id == User.id), (Job, JobApplication.job_id == Job.id)],
+        'order_by': JobApplication.id,
+        'filters': {'status': JobApplication.status},
+    },
+    'aggregated-jobs': {
+        'columns': [AggregatedJob.id, AggregatedJob.source_platform, AggregatedJob.external_id,
+                    AggregatedJob.title, AggregatedJob.company, AggregatedJob.description, AggregatedJob.location,
+                    AggregatedJob.salary_info, AggregatedJob.job_type, AggregatedJob.url, AggregatedJob.scraped_at,
+                    AggregatedJob.is_active],
+        'order_by': AggregatedJob.id,
+        'filters': {'platform': AggregatedJob.source_platform},
+    },
+}
+
+FORMATS = {
+    'csv': 'text/csv',
+    'jsonl': 'application/x-ndjson',
+}
+
+def apply_filters(query, name: str, args: Dict):
+    for arg, column in EXPORTS[name]['filters'].items():
+        value = args.get(arg, '')
+        if value:
+            query = query.filter(column == value)
+    return query
+
+def export_rows(name: str, args: Dict, batch_size: int = 2000) -> Iterator:
+    export = EXPORTS[name]
+    query = select(*export['columns'])
+    for target, onclause in export.get('joins', []):
+        query = query.join(target, onclause)
+    query = apply_filters(query, name, args).order_by(export['order_by'])
+    # yield_per streams through a server-side cursor instead of buffering the whole result.
+    result = db.session.execute(query.execution_options(yield_per=batch_size))
+    yield result.keys()
+    for partition in result.partitions():
+        yield from partition
+
+def _value(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+def _csv_cell(value):
+    value = _value(value)
+    # Stop spreadsheets from evaluating user-submitted text as formulas.
+    if isinstance(value, str) and value[:1] in ('=', '+', '-', '@', '\t', '\r'):
+        return "'" + value
+    return value
+
+def generate_csv(rows: Iterable, chunk_rows: int = 1000) -> Iterator[str]:
+    rows = iter(rows)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(list(next(rows)))
+    count = 0
+    for row in rows:
+        writer.writerow([_csv_cell(value) for value in row])
+        count += 1
+        if count % chunk_rows == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+def generate_jsonl(rows: Iterable, chunk_rows: int = 1000) -> Iterator[str]:
+    rows = iter(rows)
+    keys = list(next(rows))
+    lines: List[str] = []
+    for row in rows:
+        lines.append(json.dumps({key: _value(value) for key, value in zip(keys, row)}))
+        if len(lines) >= chunk_rows:
+            yield '\n'.join(lines) + '\n'
+            lines = []
+    if lines:
+        yield '\n'.join(lines) + '\n'
+
+GENERATORS = {
+    'csv': generate_csv,
+    'jsonl': generate_jsonl,
+}
@@ -1,19 +1,30 @@
 from functools import wraps
-from flask import render_template, request, redirect, url_for, flash
+from datetime import datetime
+from flask import render_template, request, redirect, url_for, flash, abort, jsonify, current_app, Response, stream_with_context
 from flask_login import current_user, login_required
-from talentbridge.extensions import db
+from talentbridge.extensions import db, db_topology, user_cache
 from talentbridge.admin import bp
-from talentbridge.models import User, Job, AggregatedJob, Resume, Candidate, Employer, Message, Testimonial, JobApplication
+from talentbridge.models import User, Job, AggregatedJob, Resume, Candidate, Employer, Message, Testimonial, JobApplication, BulkAction, check_admin
+from talentbridge.jobs.similarity import refresh_similar_jobs, remove_similar_jobs
+from talentbridge.resumes.talent import TalentMatcher
+from talentbridge.skills import SkillIndex
+from talentbridge.admin.exports import EXPORTS, FORMATS, GENERATORS, apply_filters, export_rows
+from talentbridge.admin.bulk import BULK_TARGETS, BulkStatusUpdater, expire_stale
 
 def admin_required(f):
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        if not current_user.is_authenticated or not current_user.is_admin:
+        if not check_admin(current_user):
             flash('Admin access required.', 'danger')
             return redirect(url_for('main.index'))
         return f(*args, **kwargs)
     return decorated_function
 
+def current_bulk_action():
+    action_id = request.args.get('bulk_action', type=int)
+    action = BulkAction.query.get(action_id) if action_id else None
+    return expire_stale(action, current_app.config['BULK_STALE_SECONDS'])
+
 @bp.route('/')
 @login_required
 @admin_required
@@ -53,6 +64,7 @@ def manage_jobs():
 @admin_required
 def create_job():
     if request.method == 'POST':
+        from talentbridge.resumes.embeddings import embed_job, index_jobs
         job = Job(
             title=request.form.get('title'),
             company=request.form.get('company'),
@@ -69,13 +81,41 @@ def create_job():
             is_featured=bool(request.form.get('is_featured')),
             apply_url=request.form.get('apply_url')
         )
+        embed_job(job)
         db.session.add(job)
+        db.session.flush()
+        SkillIndex().index_jobs([(job.id, job.skills_required)])
         db.session.commit()
+        refresh_similar_jobs([job.id])
+        index_jobs([job])
         flash('Job created successfully!', 'success')
         return redirect(url_for('admin.manage_jobs'))
     
     return render_template('admin/job_form.html', title='Create Job', job=None)
 
+@bp.route('/jobs/import', methods=['GET', 'POST'])
+@login_required
+@admin_required
+def import_jobs():
+    stats = None
+    if request.method == 'POST':
+        from talentbridge.jobs.importer import detect_format, import_jobs as import_feed
+        feed = request.files.get('feed')
+        if not feed or not feed.filename:
+            flash('Please choose a CSV, JSON or JSONL file.', 'danger')
+            return redirect(url_for('admin.import_jobs'))
+        try:
+            fmt = detect_format(feed.filename)
+        except ValueError as e:
+            flash(str(e), 'danger')
+            return redirect(url_for('admin.import_jobs'))
+        
+        stats = import_feed(feed.stream, fmt)
+        flash(f"Imported {stats['inserted']} new and {stats['updated']} updated jobs; "
+              f"{stats['rejected']} row(s) rejected.", 'success' if not stats['rejected'] else 'warning')
+    
+    return render_template('admin/job_import.html', title='Import Jobs', stats=stats)
+
 @bp.route('/jobs/<int:job_id>/edit', methods=['GET', 'POST'])
 @login_required
 @admin_required
@@ -83,6 +123,7 @@ def edit_job(job_id):
     job = Job.query.get_or_404(job_id)
     
     if request.method == 'POST':
+        from talentbridge.resumes.embeddings import embed_job, index_jobs
         job.title = request.form.get('title')
         job.company = request.form.get('company')
         job.description = request.form.get('description')
@@ -98,8 +139,12 @@ def edit_job(job_id):
         job.is_featured = bool(request.form.get('is_featured'))
         job.is_active = bool(request.form.get('is_active'))
         job.apply_url = request.form.get('apply_url')
+        embed_job(job)
+        SkillIndex().index_jobs([(job.id, job.skills_required)])
         
         db.session.commit()
+        refresh_similar_jobs([job.id])
+        index_jobs([job])
         flash('Job updated successfully!', 'success')
         return redirect(url_for('admin.manage_jobs'))
     
@@ -109,12 +154,23 @@ def edit_job(job_id):
 @login_required
 @admin_required
 def delete_job(job_id):
+    from talentbridge.resumes.embeddings import unindex_jobs
     job = Job.query.get_or_404(job_id)
+    remove_similar_jobs([job_id])
     db.session.delete(job)
     db.session.commit()
+    unindex_jobs([job_id])
     flash('Job deleted.', 'info')
     return redirect(url_for('admin.manage_jobs'))
 
+@bp.route('/jobs/<int:job_id>/candidates')
+@login_required
+@admin_required
+def job_candidates(job_id):
+    job = Job.query.options(db.undefer(Job.requirements)).get_or_404(job_id)
+    matches = TalentMatcher().top_candidates(job, limit=20)
+    return render_template('admin/job_candidates.html', title=f'Best Candidates: {job.title}', job=job, matches=matches)
+
 @bp.route('/users')
 @login_required
 @admin_required
@@ -134,6 +190,7 @@ def toggle_admin(user_id):
     user = User.query.get_or_404(user_id)
     user.is_admin = not user.is_admin
     db.session.commit()
+    user_cache.invalidate(user.id)
     flash(f'Admin status updated for {user.email}.', 'success')
     return redirect(url_for('admin.manage_users'))
 
@@ -142,8 +199,12 @@ def toggle_admin(user_id):
 @admin_required
 def manage_candidates():
     page = request.args.get('page', 1, type=int)
-    candidates = Candidate.query.order_by(Candidate.submitted_at.desc()).paginate(page=page, per_page=20, error_out=False)
-    return render_template('admin/candidates.html', title='Candidates', candidates=candidates)
+    status_filter = request.args.get('status', '')
+    
+    query = apply_filters(Candidate.query, 'candidates', request.args)
+    candidates = query.order_by(Candidate.submitted_at.desc()).paginate(page=page, per_page=20, error_out=False)
+    return render_template('admin/candidates.html', title='Candidates', candidates=candidates, status_filter=status_filter,
+                           statuses=BULK_TARGETS['candidates']['statuses'], bulk_action=current_bulk_action())
 
 @bp.route('/candidates/<int:candidate_id>')
 @login_required
@@ -170,12 +231,10 @@ def manage_employers():
     page = request.args.get('page', 1, type=int)
     status_filter = request.args.get('status', '')
     
-    query = Employer.query
-    if status_filter:
-        query = query.filter_by(status=status_filter)
-    
+    query = apply_filters(Employer.query, 'employers', request.args)
     employers = query.order_by(Employer.submitted_at.desc()).paginate(page=page, per_page=20, error_out=False)
-    return render_template('admin/employers.html', title='Employer Requests', employers=employers, status_filter=status_filter)
+    return render_template('admin/employers.html', title='Employer Requests', employers=employers, status_filter=status_filter,
+                           statuses=BULK_TARGETS['employers']['statuses'], bulk_action=current_bulk_action())
 
 @bp.route('/employers/<int:employer_id>')
 @login_required
@@ -274,10 +333,7 @@ def manage_aggregated_jobs():
     page = request.args.get('page', 1, type=int)
     platform = request.args.get('platform', '')
     
-    query = AggregatedJob.query
-    if platform:
-        query = query.filter_by(source_platform=platform)
-    
+    query = apply_filters(AggregatedJob.query, 'aggregated-jobs', request.args)
     jobs = query.order_by(AggregatedJob.scraped_at.desc()).paginate(page=page, per_page=20, error_out=False)
     
     platforms = db.session.query(AggregatedJob.source_platform).distinct().all()
@@ -306,8 +362,12 @@ def run_aggregation():
 @admin_required
 def manage_applications():
     page = request.args.get('page', 1, type=int)
-    applications = JobApplication.query.order_by(JobApplication.applied_at.desc()).paginate(page=page, per_page=20, error_out=False)
-    return render_template('admin/applications.html', title='Job Applications', applications=applications)
+    status_filter = request.args.get('status', '')
+    
+    query = apply_filters(JobApplication.query, 'applications', request.args)
+    applications = query.order_by(JobApplication.applied_at.desc()).paginate(page=page, per_page=20, error_out=False)
+    return render_template('admin/applications.html', title='Job Applications', applications=applications, status_filter=status_filter,
+                           statuses=BULK_TARGETS['applications']['statuses'], bulk_action=current_bulk_action())
 
 @bp.route('/applications/<int:application_id>/update-status', methods=['POST'])
 @login_required
@@ -318,3 +378,62 @@ def update_application_status(application_id):
     db.session.commit()
     flash('Application status updated.', 'success')
     return redirect(url_for('admin.manage_applications'))
+
+@bp.route('/bulk/<name>/status', methods=['POST'])
+@login_required
+@admin_required
+def bulk_update_status(name):
+    if name not in BULK_TARGETS:
+        abort(404)
+    
+    target = BULK_TARGETS[name]
+    status = request.form.get('status', '')
+    filters = {arg: request.form.get(f'filter_{arg}', '') for arg in EXPORTS[name]['filters']}
+    filter_args = {arg: value for arg, value in filters.items() if value}
+    if status not in target['statuses']:
+        flash('Choose a status to apply.', 'danger')
+        return redirect(url_for(target['endpoint'], **filter_args))
+    
+    updater = BulkStatusUpdater(current_app.config['BULK_CHUNK_SIZE'], current_app.config['BULK_BACKGROUND_THRESHOLD'])
+    if request.form.get('scope') == 'filter':
+        if updater.count(name, status, filters) > updater.background_threshold:
+            action = updater.start(name, status, filters, current_user.id)
+            flash(f'Updating {action.total} {name} in the background.', 'info')
+            return redirect(url_for(target['endpoint'], bulk_action=action.id, **filter_args))
+        updated = updater.apply(name, status, filters=filters)
+    else:
+        ids = request.form.getlist('ids', type=int)
+        if not ids:
+            flash('Select at least one row.', 'warning')
+            return redirect(url_for(target['endpoint'], **filter_args))
+        updated = updater.apply(name, status, ids=ids)
+    
+    flash(f'Updated {updated} {name}.', 'success')
+    return redirect(url_for(target['endpoint'], **filter_args))
+
+@bp.route('/bulk-actions/<int:action_id>')
+@login_required
+@admin_required
+def bulk_action_status(action_id):
+    action = BulkAction.query.get_or_404(action_id)
+    expire_stale(action, current_app.config['BULK_STALE_SECONDS'])
+    return jsonify(action.to_dict())
+
+@bp.route('/db-pool')
+@login_required
+@admin_required
+def db_pool_metrics():
+    return jsonify(db_topology.metrics(db.engines))
+
+@bp.route('/export/<name>.<fmt>')
+@login_required
+@admin_required
+def export_table(name, fmt):
+    if name not in EXPORTS or fmt not in FORMATS:
+        abort(404)
+    
+    rows = export_rows(name, request.args.to_dict())
+    response = Response(stream_with_context(GENERATORS[fmt](rows)), mimetype=FORMATS[fmt])
+    response.headers['Content-Disposition'] = f'attachment; filename={name}-{datetime.utcnow():%Y%m%d}.{fmt}'
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
@@ -0,0 +1,152 @@
+import base64
+import binascii
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import select, tuple_, or_
+from talentbridge.extensions import db
+from talentbridge.models import Job, AggregatedJob, RecommendedJob
+from talentbridge.api.responses import ApiError, dumps, loads
+from talentbridge.skills import jobs_with_skills
+
+JOB_FIELDS = {
+    'id': Job.id,
+    'title': Job.title,
+    'company': Job.company,
+    'description': Job.description,
+    'requirements': Job.requirements,
+    'salary_min': Job.salary_min,
+    'salary_max': Job.salary_max,
+    'salary_currency': Job.salary_currency,
+    'location': Job.location,
+    'industry': Job.industry,
+    'job_type': Job.job_type,
+    'experience_level': Job.experience_level,
+    'skills_required': Job.skills_required,
+    'posted_date': Job.posted_date,
+    'is_featured': Job.is_featured,
+    'apply_url': Job.apply_url,
+    'updated_at': Job.updated_at,
+}
+
+RESOURCES = {
+    'jobs': {
+        'fields': JOB_FIELDS,
+        'default_fields': ['id', 'title', 'company', 'location', 'job_type', 'salary_min', 'salary_max',
+                           'salary_currency', 'posted_date'],
+        'where': [Job.is_active == True],
+        'keys': [Job.posted_date, Job.id],
+        'search': [Job.title, Job.company],
+        'filters': {'location': Job.location, 'industry': Job.industry, 'job_type': Job.job_type},
+        'skill_filter': Job.id,
+    },
+    'aggregated-jobs': {
+        'fields': {
+            'id': AggregatedJob.id,
+            'source_platform': AggregatedJob.source_platform,
+            'external_id': AggregatedJob.external_id,
+            'title': AggregatedJob.title,
+            'company': AggregatedJob.company,
+            'description': AggregatedJob.description,
+            'location': AggregatedJob.location,
+            'salary_info': AggregatedJob.salary_info,
+            'job_type': AggregatedJob.job_type,
+            'url': AggregatedJob.url,
+            'scraped_at': AggregatedJob.scraped_at,
+        },
+        'default_fields': ['id', 'source_platform', 'title', 'company', 'location', 'url', 'scraped_at'],
+        'where': [AggregatedJob.is_active == True],
+        'keys': [AggregatedJob.scraped_at, AggregatedJob.id],
+        'search': [AggregatedJob.title, AggregatedJob.company],
+        'filters': {'location': AggregatedJob.location, 'platform': AggregatedJob.source_platform,
+                    'job_type': AggregatedJob.job_type},
+    },
+    'recommendations': {
+        'fields': dict(JOB_FIELDS,
+                       overall_score=RecommendedJob.overall_score,
+                       skill_match=RecommendedJob.skill_match,
+                       title_match=RecommendedJob.title_match,
+                       experience_match=RecommendedJob.experience_match,
+                       computed_at=RecommendedJob.computed_at),
+        'default_fields': ['id', 'title', 'company', 'location', 'overall_score', 'skill_match', 'title_match',
+                           'experience_match'],
+        'joins': [(Job, RecommendedJob.job_id == Job.id)],
+        'from': RecommendedJob,
+        'where': [Job.is_active == True],
+        'keys': [RecommendedJob.overall_score, RecommendedJob.job_id],
+        'search': [Job.title, Job.company],
+        'filters': {'location': Job.location, 'job_type': Job.job_type},
+        'skill_filter': Job.id,
+    },
+}
+
+def requested_fields(name: str, value: Optional[str]) -> List[str]:
+    resource = RESOURCES[name]
+    if not value:
+        return resource['default_fields']
+    fields = list(dict.fromkeys(field.strip() for field in value.split(',') if field.strip()))
+    unknown = [field for field in fields if field not in resource['fields']]
+    if unknown:
+        raise ApiError(f"Unknown fields: {', '.join(unknown)}", 400, allowed=sorted(resource['fields']))
+    return fields
+
+def encode_cursor(values) -> str:
+    values = [value.isoformat() if isinstance(value, datetime) else value for value in values]
+    return base64.urlsafe_b64encode(dumps(values)).decode('ascii').rstrip('=')
+
+def decode_cursor(name: str, cursor: str) -> List:
+    keys = RESOURCES[name]['keys']
+    try:
+        values = loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+        if not isinstance(values, list) or len(values) != len(keys) or None in values:
+            raise ValueError
+        return [datetime.fromisoformat(value) if isinstance(key.type, db.DateTime) else value
+                for key, value in zip(keys, values)]
+    except (ValueError, TypeError, binascii.Error):
+        raise ApiError('Invalid cursor', 400)
+
+def fetch_page(name: str, fields: List[str], args: Dict, limit: int, where=()) -> Tuple[List[Dict], Optional[str]]:
+    resource = RESOURCES[name]
+    keys = resource['keys']
+    # Only the requested columns are read; the sort keys ride along for the next cursor.
+    columns = [resource['fields'][field].label(field) for field in fields]
+    columns += [key.label(f'_key{i}') for i, key in enumerate(keys)]
+    query = select(*columns)
+    if 'from' in resource:
+        query = query.select_from(resource['from'])
+    for target, onclause in resource.get('joins', []):
+        query = query.join(target, onclause)
+    query = query.where(*resource['where'], *where)
+
+    keyword = args.get('q', '').strip()
+    if keyword:
+        query = query.where(or_(*[column.ilike(f'%{keyword}%') for column in resource['search']]))
+    for arg, column in resource['filters'].items():
+        value = args.get(arg, '').strip()
+        if value:
+            query = query.where(column == value)
+    skills = args.get('skill', '').strip()
+    if skills and 'skill_filter' in resource:
+        query = query.where(resource['skill_filter'].in_(jobs_with_skills(skills.split(','))))
+
+    # Keyset pagination: each page starts strictly after the last row of the previous one, so deep
+    # pages cost the same as the first and rows inserted meanwhile do not shift the window. A row
+    # with a NULL sort key has no place in that order, so lists leave it out.
+    query = query.where(*[key.isnot(None) for key in keys if key.expression.nullable])
+    cursor = args.get('cursor')
+    if cursor:
+        query = query.where(tuple_(*keys) < tuple_(*decode_cursor(name, cursor)))
+    query = query.order_by(*[key.desc() for key in keys]).limit(limit + 1)
+
+    rows = db.session.execute(query).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1][len(fields):])
+    return [dict(zip(fields, row)) for row in rows], next_cursor
+
+def fetch_one(name: str, fields: List[str], item_id: int) -> Optional[Dict]:
+    resource = RESOURCES[name]
+    query = select(*[resource['fields'][field].label(field) for field in fields])
+    query = query.where(resource['fields']['id'] == item_id, *resource['where'])
+    row = db.session.execute(query).first()
+    return dict(zip(fields, row)) if row else None
@@ -0,0 +1,79 @@
+import gzip
+import json
+import hashlib
+from datetime import date, datetime
+from flask import current_app, request
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+class ApiError(Exception):
+
+    def __init__(self, message: str, status: int = 400, **extra):
+        super().__init__(message)
+        self.status = status
+        self.extra = extra
+
+def _default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f'Cannot serialize {type(value).__name__}')
+
+def dumps(payload) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, default=_default, separators=(',', ':')).encode('utf-8')
+
+def loads(data):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _choose_encoding(body: bytes):
+    if len(body) < current_app.config['API_COMPRESS_MIN_SIZE']:
+        return None
+    encodings = request.accept_encodings
+    if brotli is not None and encodings['br']:
+        return 'br'
+    if encodings['gzip']:
+        return 'gzip'
+    return None
+
+def _compress(body: bytes, encoding: str) -> bytes:
+    if encoding == 'br':
+        return brotli.compress(body, quality=current_app.config['API_BROTLI_QUALITY'])
+    return gzip.compress(body, compresslevel=current_app.config['API_GZIP_LEVEL'], mtime=0)
+
+def api_response(payload, status: int = 200, cache_seconds: int = 0, private: bool = False):
+    body = dumps(payload)
+    encoding = _choose_encoding(body)
+    response = current_app.response_class(status=status, mimetype='application/json')
+    response.vary.add('Accept-Encoding')
+    if status == 200:
+        # Each encoding is its own representation, so it gets its own strong tag. A client that
+        # already holds it gets a 304 before anything is compressed.
+        etag = hashlib.blake2b(body, digest_size=16).hexdigest() + (f'-{encoding}' if encoding else '')
+        response.set_etag(etag)
+        response.cache_control.private = private or None
+        if cache_seconds:
+            response.cache_control.max_age = cache_seconds
+        else:
+            response.cache_control.no_cache = True
+        if request.if_none_match.contains(etag):
+            response.status_code = 304
+            return response
+    if encoding:
+        body = _compress(body, encoding)
+        response.headers['Content-Encoding'] = encoding
+    response.set_data(body)
+    return response
+
+def error_response(error: ApiError):
+    return api_response(dict(error.extra, error=str(error)), status=error.status)
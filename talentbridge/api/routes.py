@@ -0,0 +1,63 @@
+from flask import request, url_for, current_app
+from flask_login import current_user
+from talentbridge.api import bp
+from talentbridge.api.resources import requested_fields, fetch_page, fetch_one
+from talentbridge.api.responses import ApiError, api_response, error_response
+from talentbridge.database import replica_reads
+from talentbridge.models import Resume, RecommendedJob
+
+@bp.errorhandler(ApiError)
+def handle_api_error(error):
+    return error_response(error)
+
+def page_limit():
+    limit = request.args.get('limit', current_app.config['API_PAGE_SIZE'], type=int)
+    return max(1, min(limit, current_app.config['API_MAX_PAGE_SIZE']))
+
+def page_response(endpoint, items, next_cursor, **kwargs):
+    next_url = None
+    if next_cursor:
+        args = dict(request.args.items(), cursor=next_cursor)
+        next_url = url_for(endpoint, **args)
+    return api_response({'data': items, 'next_cursor': next_cursor, 'next': next_url}, **kwargs)
+
+@bp.route('/jobs')
+@replica_reads
+def jobs():
+    fields = requested_fields('jobs', request.args.get('fields'))
+    items, next_cursor = fetch_page('jobs', fields, request.args, page_limit())
+    return page_response('api.jobs', items, next_cursor, cache_seconds=current_app.config['API_CACHE_SECONDS'])
+
+@bp.route('/jobs/<int:job_id>')
+@replica_reads
+def job(job_id):
+    fields = requested_fields('jobs', request.args.get('fields'))
+    item = fetch_one('jobs', fields, job_id)
+    if item is None:
+        raise ApiError('Job not found', 404)
+    return api_response({'data': item}, cache_seconds=current_app.config['API_CACHE_SECONDS'])
+
+@bp.route('/aggregated-jobs')
+@replica_reads
+def aggregated_jobs():
+    fields = requested_fields('aggregated-jobs', request.args.get('fields'))
+    items, next_cursor = fetch_page('aggregated-jobs', fields, request.args, page_limit())
+    return page_response('api.aggregated_jobs', items, next_cursor,
+                         cache_seconds=current_app.config['API_CACHE_SECONDS'])
+
+@bp.route('/recommendations')
+@replica_reads
+def recommendations():
+    if not current_user.is_authenticated:
+        raise ApiError('Authentication required', 401)
+    resume = Resume.query.filter_by(user_id=current_user.id, is_primary=True).first() or \
+        Resume.query.filter_by(user_id=current_user.id).order_by(Resume.upload_date.desc()).first()
+    if resume is None:
+        raise ApiError('Upload a resume to get recommendations', 404)
+
+    # Served from the batch scorer's top-k only; live scoring stays on the HTML page.
+    fields = requested_fields('recommendations', request.args.get('fields'))
+    items, next_cursor = fetch_page('recommendations', fields, request.args, page_limit(),
+                                    where=[RecommendedJob.user_id == current_user.id,
+                                           RecommendedJob.resume_id == resume.id])
+    return page_response('api.recommendations', items, next_cursor, private=True)
@@ -0,0 +1,101 @@
+import os
+import gzip
+import json
+import hashlib
+import logging
+import mimetypes
+from typing import Dict
+from flask import current_app, request, send_from_directory
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+BUILD_DIR = 'dist'
+COMPRESSIBLE = {'.css', '.js', '.svg', '.json', '.txt', '.map', '.html', '.ico'}
+ENCODINGS = [('br', '.br'), ('gzip', '.gz')]
+
+def _write(path: str, data: bytes):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f'{path}.{os.getpid()}.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+def build_assets(static_folder: str) -> Dict[str, str]:
+    build_root = os.path.join(static_folder, BUILD_DIR)
+    manifest = {}
+    for directory, subdirs, files in os.walk(static_folder):
+        if os.path.abspath(directory).startswith(os.path.abspath(build_root)):
+            continue
+        for name in sorted(files):
+            source = os.path.join(directory, name)
+            relative = os.path.relpath(source, static_folder).replace(os.sep, '/')
+            with open(source, 'rb') as f:
+                data = f.read()
+            stem, extension = os.path.splitext(relative)
+            # Keeping the directory layout means relative url() references in CSS still resolve.
+            hashed = f'{BUILD_DIR}/{stem}.{hashlib.sha256(data).hexdigest()[:12]}{extension}'
+            target = os.path.join(static_folder, hashed)
+            if not os.path.exists(target):
+                _write(target, data)
+                if extension.lower() in COMPRESSIBLE:
+                    _write(target + '.gz', gzip.compress(data, compresslevel=9, mtime=0))
+                    if brotli is not None:
+                        _write(target + '.br', brotli.compress(data, quality=11))
+            manifest[relative] = hashed
+    _write(os.path.join(build_root, 'manifest.json'), json.dumps(manifest, indent=2, sort_keys=True).encode('utf-8'))
+    return manifest
+
+class StaticAssets:
+
+    def __init__(self):
+        self.manifest: Dict[str, str] = {}
+        self.max_age = 31536000
+
+    def init_app(self, app):
+        self.max_age = app.config['STATIC_MAX_AGE']
+        self.load(app)
+        app.url_defaults(self._fingerprint)
+        app.view_functions['static'] = self.send_static
+
+    def load(self, app):
+        path = os.path.join(app.static_folder, BUILD_DIR, 'manifest.json')
+        try:
+            with open(path) as f:
+                self.manifest = json.load(f)
+        except FileNotFoundError:
+            self.manifest = {}
+            logger.info("No static asset manifest; run `flask build-assets` to serve fingerprinted files")
+
+    def _fingerprint(self, endpoint, values):
+        # Debug servers serve files as edited rather than the last build.
+        if endpoint != 'static' or current_app.debug:
+            return
+        hashed = self.manifest.get(values.get('filename'))
+        if hashed:
+            values['filename'] = hashed
+
+    def send_static(self, filename):
+        app = current_app
+        if not filename.startswith(f'{BUILD_DIR}/') or filename.endswith('manifest.json'):
+            return app.send_static_file(filename)
+
+        mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+        encoding, suffix = None, ''
+        for name, extension in ENCODINGS:
+            if request.accept_encodings[name] and os.path.isfile(os.path.join(app.static_folder, filename + extension)):
+                encoding, suffix = name, extension
+                break
+        # The name changes whenever the content does, so browsers may keep the file without ever revalidating.
+        response = send_from_directory(app.static_folder, filename + suffix, mimetype=mimetype, max_age=self.max_age)
+        if encoding:
+            response.headers['Content-Encoding'] = encoding
+        response.vary.add('Accept-Encoding')
+        response.cache_control.public = True
+        response.cache_control.immutable = True
+        return response
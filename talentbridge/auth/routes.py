@@ -1,7 +1,7 @@
 from datetime import datetime
 from flask import render_template, redirect, url_for, flash, request
 from flask_login import login_user, logout_user, current_user, login_required
-from talentbridge.extensions import db
+from talentbridge.extensions import db, user_cache
 from talentbridge.auth import bp
 from talentbridge.auth.forms import LoginForm, RegistrationForm, ProfileForm, ChangePasswordForm, ForgotPasswordForm
 from talentbridge.models import User
@@ -18,8 +18,11 @@ def login():
             flash('Invalid email or password', 'danger')
             return redirect(url_for('auth.login'))
         
+        if user.password_needs_rehash():
+            user.set_password(form.password.data)
         user.last_login = datetime.utcnow()
         db.session.commit()
+        user_cache.invalidate(user.id)
         
         login_user(user, remember=form.remember_me.data)
         flash(f'Welcome back, {user.full_name}!', 'success')
@@ -66,11 +69,13 @@ def profile():
     password_form = ChangePasswordForm()
     
     if form.validate_on_submit() and 'update_profile' in request.form:
-        current_user.full_name = form.full_name.data
-        current_user.phone = form.phone.data
-        current_user.location = form.location.data
-        current_user.bio = form.bio.data
+        user = current_user.get_model()
+        user.full_name = form.full_name.data
+        user.phone = form.phone.data
+        user.location = form.location.data
+        user.bio = form.bio.data
         db.session.commit()
+        user_cache.invalidate(user.id)
         flash('Your profile has been updated.', 'success')
         return redirect(url_for('auth.profile'))
     
@@ -86,6 +91,7 @@ def change_password():
         else:
             current_user.set_password(form.new_password.data)
             db.session.commit()
+            user_cache.invalidate(current_user.id)
             flash('Your password has been changed.', 'success')
     else:
         for field, errors in form.errors.items():
@@ -0,0 +1,130 @@
+import json
+import time
+import uuid
+import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Optional
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+def _encode(value):
+    if isinstance(value, datetime):
+        return {'__datetime__': value.isoformat()}
+    if isinstance(value, (set, frozenset)):
+        return {'__set__': sorted(value)}
+    raise TypeError(f'Cannot serialize {type(value).__name__}')
+
+def _decode(obj):
+    if '__datetime__' in obj:
+        return datetime.fromisoformat(obj['__datetime__'])
+    if '__set__' in obj:
+        return set(obj['__set__'])
+    return obj
+
+class TTLCache:
+
+    def __init__(self, namespace: str, ttl: int = 30, max_size: int = 10000, versioned: bool = False):
+        self.namespace = namespace
+        self.ttl = ttl
+        self.max_size = max_size
+        # With a shared backend, a versioned cache tags each local entry with the key's version token and drops
+        # it once another worker changes the key, at the cost of one shared read per lookup.
+        self.versioned = versioned
+        self.shared = None
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def init_app(self, app, ttl_key: str, url_key: str):
+        self.ttl = app.config.get(ttl_key, self.ttl)
+        url = app.config.get(url_key)
+        if url:
+            try:
+                import redis
+                self.shared = redis.Redis.from_url(url)
+            except ImportError:
+                logger.warning(f"{url_key} is set but the redis package is not installed. Using in-process cache only.")
+
+    def _key(self, key) -> str:
+        return f'talentbridge:{self.namespace}:{key}'
+
+    def _version(self, key) -> Optional[str]:
+        if not self.versioned or self.shared is None:
+            return None
+        try:
+            raw = self.shared.get(self._key(key) + ':version')
+        except Exception as e:
+            logger.error(f"Shared cache read failed: {str(e)}")
+            return ''
+        return raw.decode() if raw is not None else None
+
+    def _bump(self, key) -> Optional[str]:
+        if not self.versioned or self.shared is None:
+            return None
+        # A random token rather than a counter, so an expired version key can never match an old entry again.
+        version = uuid.uuid4().hex
+        try:
+            self.shared.set(self._key(key) + ':version', version, ex=self.ttl * 2)
+        except Exception as e:
+            logger.error(f"Shared cache write failed: {str(e)}")
+        return version
+
+    def get(self, key) -> Optional[Any]:
+        if self.ttl <= 0:
+            return None
+        now = time.monotonic()
+        version = self._version(key)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, entry_version, value = entry
+                if expires_at > now and entry_version == version:
+                    self._entries.move_to_end(key)
+                    return value
+                del self._entries[key]
+
+        if self.shared is not None:
+            try:
+                raw = self.shared.get(self._key(key))
+            except Exception as e:
+                logger.error(f"Shared cache read failed: {str(e)}")
+                raw = None
+            if raw is not None:
+                value = json.loads(raw, object_hook=_decode)
+                self._store(key, value, version)
+                return value
+        return None
+
+    def set(self, key, value: Any, changed: bool = False):
+        # changed=True when the data itself changed rather than being loaded, so other workers drop their copy.
+        if self.ttl <= 0:
+            return
+        if self.shared is not None:
+            try:
+                self.shared.set(self._key(key), json.dumps(value, default=_encode), ex=self.ttl)
+            except Exception as e:
+                logger.error(f"Shared cache write failed: {str(e)}")
+        self._store(key, value, self._bump(key) if changed else self._version(key))
+
+    def _store(self, key, value, version=None):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, version, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+        if self.shared is not None:
+            try:
+                self.shared.delete(self._key(key))
+            except Exception as e:
+                logger.error(f"Shared cache delete failed: {str(e)}")
+            self._bump(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
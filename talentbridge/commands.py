@@ -0,0 +1,168 @@
+import csv
+import json
+import click
+from flask.cli import with_appcontext
+
+@click.command('rebuild-similar-jobs')
+@with_appcontext
+def rebuild_similar_jobs():
+    from talentbridge.jobs.similarity import JobSimilarityEngine
+    count = JobSimilarityEngine().rebuild()
+    click.echo(f'Computed similar jobs for {count} jobs.')
+
+@click.command('build-job-index')
+@click.option('--batch-size', default=2000, show_default=True)
+@with_appcontext
+def build_job_index(batch_size):
+    from talentbridge.resumes.embeddings import rebuild_job_index
+    count = rebuild_job_index(batch_size=batch_size)
+    click.echo(f'Indexed embeddings for {count} jobs.')
+
+@click.command('rebuild-skill-index')
+@with_appcontext
+def rebuild_skill_index():
+    from talentbridge.skills import SkillIndex
+    counts = SkillIndex().rebuild()
+    click.echo('Indexed ' + ', '.join(f'{count} {table}' for table, count in counts.items()) + '.')
+
+@click.command('score-recommendations')
+@click.option('--full', is_flag=True, help='Rescore every job instead of only those changed since the last run.')
+@click.option('--workers', type=int, default=None, help='Scoring processes (default: RECOMMENDATION_WORKERS or CPU count).')
+@click.option('--chunk-size', default=20, show_default=True)
+@with_appcontext
+def score_recommendations(full, workers, chunk_size):
+    from flask import current_app
+    from talentbridge.resumes.scoring import RecommendationScorer
+    scorer = RecommendationScorer(top_k=current_app.config['RECOMMENDATION_TOP_K'],
+                                  workers=workers or current_app.config['RECOMMENDATION_WORKERS'],
+                                  chunk_size=chunk_size)
+    run = scorer.run(full=full)
+    click.echo(f'Scored {run.users_scored} users against {run.jobs_scored} jobs.')
+
+@click.command('enhance-skills')
+@click.option('--batch-size', default=100, show_default=True)
+@click.option('--limit', type=int, default=None, help='Stop after this many resumes.')
+@click.option('--concurrency', type=int, default=None, help='Concurrent requests (default: OPENAI_CONCURRENCY).')
+@with_appcontext
+def enhance_skills(batch_size, limit, concurrency):
+    from flask import current_app
+    from talentbridge.resumes.enhancement import SkillEnhancer, enhance_resumes, format_stats
+    config = current_app.config
+    enhancer = SkillEnhancer(model=config['OPENAI_MODEL'],
+                             concurrency=concurrency or config['OPENAI_CONCURRENCY'],
+                             requests_per_minute=config['OPENAI_REQUESTS_PER_MINUTE'],
+                             tokens_per_minute=config['OPENAI_TOKENS_PER_MINUTE'],
+                             cache_dir=config['OPENAI_CACHE_DIR'],
+                             input_cost=config['OPENAI_INPUT_COST_PER_1M'],
+                             output_cost=config['OPENAI_OUTPUT_COST_PER_1M'])
+    batches = []
+
+    def report(stats):
+        batches.append(stats)
+        click.echo(f'Batch {len(batches)}: {format_stats(stats)}, {stats["updated"]} updated')
+
+    totals = enhance_resumes(enhancer, batch_size=batch_size, limit=limit, on_batch=report)
+    click.echo(f'Total: {format_stats(totals)}, {totals["updated"]} updated')
+
+@click.command('import-jobs')
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--format', 'fmt', type=click.Choice(['csv', 'json', 'jsonl']), default=None,
+              help='Feed format (default: from the file extension).')
+@click.option('--batch-size', default=1000, show_default=True)
+@click.option('--rejects', type=click.Path(dir_okay=False), default=None, help='Write rejected rows to this CSV file.')
+@with_appcontext
+def import_jobs_command(path, fmt, batch_size, rejects):
+    from talentbridge.jobs.importer import JobImporter, detect_format, read_records
+    reject_file = open(rejects, 'w', newline='') if rejects else None
+    on_reject = None
+    if reject_file:
+        writer = csv.writer(reject_file)
+        writer.writerow(['row', 'error', 'data'])
+
+        def on_reject(position, error, raw):
+            writer.writerow([position, error, raw if isinstance(raw, str) else json.dumps(raw, default=str)])
+
+    try:
+        with open(path, 'rb') as f:
+            stats = JobImporter(batch_size=batch_size, on_reject=on_reject).run(read_records(f, fmt or detect_format(path)))
+    finally:
+        if reject_file:
+            reject_file.close()
+
+    click.echo(f"Read {stats['read']} rows in {stats['elapsed']:.1f}s ({stats['rows_per_second']:.0f} rows/s): "
+               f"{stats['inserted']} inserted, {stats['updated']} updated, {stats['duplicates']} duplicates, "
+               f"{stats['rejected']} rejected; {stats['index_seconds']:.1f}s spent updating indexes.")
+    if stats['rejected'] and not rejects:
+        for reject in stats['rejects'][:20]:
+            click.echo(f"  row {reject['row']}: {reject['error']}")
+
+@click.command('purge-uploads')
+@with_appcontext
+def purge_uploads():
+    from flask import current_app
+    from talentbridge.resumes.uploads import ChunkedUploads
+    config = current_app.config
+    uploads = ChunkedUploads(chunk_size=config['UPLOAD_CHUNK_SIZE'], max_size=config['MAX_CONTENT_LENGTH'],
+                             session_ttl=config['UPLOAD_SESSION_TTL'])
+    count = uploads.purge_expired()
+    click.echo(f'Removed {count} abandoned upload sessions.')
+
+@click.command('build-resume-previews')
+@click.option('--batch-size', default=200, show_default=True)
+@with_appcontext
+def build_resume_previews(batch_size):
+    import os
+    from talentbridge.extensions import db
+    from talentbridge.models import Resume
+    from talentbridge.resumes.downloads import file_digest, write_preview
+    hashed = written = missing = 0
+    last_id = 0
+    while True:
+        resumes = Resume.query.filter(Resume.id > last_id).order_by(Resume.id).limit(batch_size).all()
+        if not resumes:
+            break
+        last_id = resumes[-1].id
+        for resume in resumes:
+            if not resume.content_hash:
+                if not os.path.isfile(resume.file_path):
+                    missing += 1
+                    continue
+                resume.content_hash, resume.file_size = file_digest(resume.file_path)
+                hashed += 1
+            if write_preview(resume):
+                written += 1
+        db.session.commit()
+        db.session.expunge_all()
+    click.echo(f'Hashed {hashed} resume files, {written} previews ready, {missing} files missing.')
+
+@click.command('compile-templates')
+@with_appcontext
+def compile_templates_command():
+    from flask import current_app
+    from talentbridge.templating import compile_templates
+    count = compile_templates(current_app)
+    click.echo(f"Compiled {count} templates into {current_app.config['TEMPLATE_BYTECODE_DIR']}.")
+
+@click.command('build-assets')
+@with_appcontext
+def build_assets_command():
+    from flask import current_app
+    from talentbridge.assets import build_assets
+    from talentbridge.extensions import static_assets
+    manifest = build_assets(current_app.static_folder)
+    static_assets.load(current_app)
+    for name, hashed in sorted(manifest.items()):
+        click.echo(f'  {name} -> {hashed}')
+    click.echo(f'Fingerprinted {len(manifest)} static files.')
+
+def register_commands(app):
+    app.cli.add_command(rebuild_similar_jobs)
+    app.cli.add_command(build_job_index)
+    app.cli.add_command(rebuild_skill_index)
+    app.cli.add_command(score_recommendations)
+    app.cli.add_command(enhance_skills)
+    app.cli.add_command(import_jobs_command)
+    app.cli.add_command(purge_uploads)
+    app.cli.add_command(build_resume_previews)
+    app.cli.add_command(compile_templates_command)
+    app.cli.add_command(build_assets_command)
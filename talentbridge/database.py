@@ -0,0 +1,142 @@
+import time
+import random
+import logging
+import threading
+from functools import wraps
+from weakref import WeakKeyDictionary
+from typing import Any, Dict, List, Optional
+from flask import current_app, g, request, session
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import Pool, QueuePool
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+REPLICA_PREFIX = 'replica_'
+STICKY_KEY = '_db_primary_until'
+SAFE_METHODS = {'GET', 'HEAD', 'OPTIONS'}
+
+def in_memory_sqlite(url: str) -> bool:
+    url = make_url(url)
+    return url.get_backend_name() == 'sqlite' and url.database in (None, '', ':memory:')
+
+class RoutingSession(Session):
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        # Only plain SELECTs outside a flush go to the replica chosen for this request;
+        # inserts, updates, deletes and textual SQL always use the primary.
+        replica = g.get('db_replica')
+        if replica and bind is None and not self._flushing and getattr(clause, 'is_select', False):
+            topology = current_app.extensions['db_topology']
+            topology.count(replica)
+            return self._db.engines[replica]
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+class DatabaseTopology:
+
+    def __init__(self):
+        self.replicas: List[str] = []
+        self.sticky_seconds = 0
+        self._pools = WeakKeyDictionary()
+        self._routed: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def init_app(self, app, db):
+        config = app.config
+        base_options = dict(config.get('SQLALCHEMY_ENGINE_OPTIONS') or {})
+        config['SQLALCHEMY_ENGINE_OPTIONS'] = self.engine_options(config, base_options, config['SQLALCHEMY_DATABASE_URI'])
+
+        # Binds do not inherit SQLALCHEMY_ENGINE_OPTIONS, so each replica gets the same pool settings explicitly.
+        urls = [url.strip() for url in config.get('DATABASE_REPLICA_URLS', '').split(',') if url.strip()]
+        binds = dict(config.get('SQLALCHEMY_BINDS') or {})
+        self.replicas = []
+        for i, url in enumerate(urls):
+            name = f'{REPLICA_PREFIX}{i}'
+            binds[name] = dict(self.engine_options(config, base_options, url), url=url)
+            self.replicas.append(name)
+        config['SQLALCHEMY_BINDS'] = binds
+        self.sticky_seconds = config.get('DB_REPLICA_STICKY_SECONDS', 5)
+
+        # Flask-SQLAlchemy builds its engines from the config above.
+        db.init_app(app)
+        with app.app_context():
+            for engine in db.engines.values():
+                self._instrument(engine.pool)
+
+        app.extensions['db_topology'] = self
+        app.after_request(self._stick_to_primary)
+        if self.replicas:
+            logger.info(f"Routing read-only views across {len(self.replicas)} replica(s)")
+
+    def engine_options(self, config, base_options: Dict[str, Any], url: str) -> Dict[str, Any]:
+        options = dict(base_options)
+        # In-memory SQLite runs on a single StaticPool connection, which takes no sizing arguments.
+        if url and not in_memory_sqlite(url):
+            options.setdefault('pool_size', config.get('DB_POOL_SIZE', 5))
+            options.setdefault('max_overflow', config.get('DB_MAX_OVERFLOW', 10))
+            options.setdefault('pool_timeout', config.get('DB_POOL_TIMEOUT', 30))
+        return options
+
+    def choose_replica(self) -> Optional[str]:
+        if not self.replicas:
+            return None
+        # Read-your-writes: after a write this browser reads from the primary until
+        # the replicas have had time to catch up.
+        if session.get(STICKY_KEY, 0) > time.time():
+            return None
+        return random.choice(self.replicas)
+
+    def count(self, name: str):
+        with self._lock:
+            self._routed[name] = self._routed.get(name, 0) + 1
+
+    def metrics(self, engines) -> Dict[str, Any]:
+        pools = {}
+        for name, engine in engines.items():
+            pool = engine.pool
+            stats = {
+                'pool': type(pool).__name__,
+                'url': engine.url.render_as_string(hide_password=True),
+            }
+            if isinstance(pool, QueuePool):
+                stats.update({
+                    'size': pool.size(),
+                    'checked_in': pool.checkedin(),
+                    'checked_out': pool.checkedout(),
+                    'overflow': pool.overflow(),
+                    'timeout': pool.timeout(),
+                })
+            stats.update(self._pools.get(pool, {'connects': 0, 'checkouts': 0, 'invalidated': 0}))
+            if name is not None:
+                stats['routed_selects'] = self._routed.get(name, 0)
+            pools[name or 'primary'] = stats
+        return {'replicas': len(self.replicas), 'sticky_seconds': self.sticky_seconds, 'pools': pools}
+
+    def _instrument(self, pool: Pool):
+        if pool in self._pools:
+            return
+        stats = self._pools[pool] = {'connects': 0, 'checkouts': 0, 'invalidated': 0}
+
+        def bump(key):
+            def listener(*args):
+                with self._lock:
+                    stats[key] += 1
+            return listener
+
+        event.listen(pool, 'connect', bump('connects'))
+        event.listen(pool, 'checkout', bump('checkouts'))
+        event.listen(pool, 'invalidate', bump('invalidated'))
+
+    def _stick_to_primary(self, response):
+        if self.replicas and request.method not in SAFE_METHODS:
+            session[STICKY_KEY] = time.time() + self.sticky_seconds
+        return response
+
+def replica_reads(view):
+    @wraps(view)
+    def decorated_function(*args, **kwargs):
+        g.db_replica = current_app.extensions['db_topology'].choose_replica()
+        return view(*args, **kwargs)
+    return decorated_function
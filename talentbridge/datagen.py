@@ -0,0 +1,356 @@
+import io
+import os
+import csv
+import time
+import random
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Sequence
+from talentbridge.extensions import db, password_hasher
+from talentbridge.admin.bulk import BULK_TARGETS
+from talentbridge.models import User, Job, AggregatedJob, Resume, ResumeText, JobApplication, saved_jobs, summarize
+from talentbridge.skills import SkillIndex
+from talentbridge.textstore import pack
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+EPOCH = datetime(2024, 1, 1)
+
+ROLES = {
+    'Software Engineer': ['Python', 'Java', 'Go', 'SQL', 'Docker', 'Kubernetes', 'AWS', 'Git', 'REST API', 'Microservices'],
+    'Frontend Developer': ['JavaScript', 'TypeScript', 'React', 'Vue', 'Angular', 'HTML', 'CSS', 'Sass', 'Jest', 'Figma'],
+    'Backend Developer': ['Python', 'Django', 'Flask', 'Node.js', 'PostgreSQL', 'Redis', 'MongoDB', 'GraphQL', 'Docker'],
+    'Data Scientist': ['Python', 'Machine Learning', 'TensorFlow', 'PyTorch', 'Scikit-learn', 'SQL', 'NLP', 'Data Visualization'],
+    'Data Engineer': ['Python', 'SQL', 'Spark', 'Airflow', 'AWS', 'Kafka', 'PostgreSQL', 'Data Analysis'],
+    'DevOps Engineer': ['AWS', 'Docker', 'Kubernetes', 'Terraform', 'Jenkins', 'Linux', 'Bash', 'CI/CD', 'Prometheus', 'Grafana'],
+    'Mobile Developer': ['Swift', 'Kotlin', 'iOS', 'Android', 'React Native', 'Flutter', 'Git', 'REST API'],
+    'QA Engineer': ['Selenium', 'Cypress', 'Jest', 'Unit Testing', 'Python', 'JavaScript', 'Jira', 'Agile'],
+    'Security Engineer': ['Security', 'Penetration Testing', 'OWASP', 'Cybersecurity', 'Linux', 'Networking', 'Python'],
+    'Product Manager': ['Product Strategy', 'Agile', 'Scrum', 'Jira', 'Data Analysis', 'User Research', 'Communication'],
+    'UX Designer': ['Figma', 'Sketch', 'Adobe XD', 'User Research', 'Wireframing', 'Prototyping', 'UI Design'],
+    'Marketing Manager': ['Digital Marketing', 'SEO', 'Google Analytics', 'Content Marketing', 'Team Leadership'],
+    'Financial Analyst': ['Financial Modeling', 'Excel', 'SQL', 'Tableau', 'Power BI', 'Financial Analysis'],
+    'Sales Executive': ['Salesforce', 'CRM', 'Communication', 'Negotiation', 'Lead Generation'],
+}
+ROLE_INDUSTRIES = {
+    'Marketing Manager': 'Marketing',
+    'Financial Analyst': 'Finance',
+    'Sales Executive': 'Retail',
+}
+LEVELS = [('Junior', 'Entry Level', 0), ('', 'Mid Level', 2), ('Senior', 'Senior', 5),
+          ('Lead', 'Senior', 7), ('Principal', 'Executive', 10)]
+COMPANIES = ['TechCorp Inc.', 'DataInsights LLC', 'InnovateTech', 'CloudFirst Solutions', 'WebDesign Pro',
+             'GrowthHub Marketing', 'FinanceFirst Corp', 'Global Tech Solutions', 'StartUp Hub', 'Enterprise Corp',
+             'Innovation Labs', 'Digital Solutions LLC', 'Creative Digital', 'Indian IT Services', 'Tech Startup India']
+LOCATIONS = ['San Francisco, CA', 'New York, NY', 'Remote', 'Austin, TX', 'Seattle, WA', 'Chicago, IL',
+             'Boston, MA', 'Los Angeles, CA', 'Bangalore', 'Hyderabad', 'London', 'Berlin']
+JOB_TYPES = ['Full-time'] * 6 + ['Part-time', 'Contract', 'Internship', 'Remote']
+PLATFORMS = ['indeed', 'linkedin', 'naukri']
+FIRST_NAMES = ['John', 'Jane', 'Mike', 'Sarah', 'David', 'Emily', 'Robert', 'Lisa', 'Priya', 'Arjun',
+               'Wei', 'Maria', 'Ahmed', 'Olga', 'Kenji', 'Fatima', 'Lucas', 'Ana', 'Noah', 'Zara']
+LAST_NAMES = ['Doe', 'Smith', 'Wilson', 'Johnson', 'Chen', 'Rodriguez', 'Kim', 'Thompson', 'Martinez',
+              'Patel', 'Sharma', 'Garcia', 'Nguyen', 'Khan', 'Ivanova', 'Tanaka', 'Silva', 'Brown']
+EDUCATION = ["Bachelor's of Science", "Bachelor's of Engineering", "Master's of Science", 'MBA', 'B.Tech', 'M.Tech', 'PhD']
+# The statuses the admin pages filter and bulk-update by, with most applications still waiting for review.
+APPLICATION_STATUSES = ['submitted'] * 4 + list(BULK_TARGETS['applications']['statuses'])
+
+def build_pdf(lines: Sequence[str]) -> bytes:
+    content = ['BT', '/F1 11 Tf', '14 TL', '72 740 Td']
+    for line in lines:
+        escaped = line.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+        content.append(f'({escaped}) Tj T*')
+    content.append('ET')
+    stream = '\n'.join(content).encode('latin-1', 'replace')
+
+    objects = [
+        b'<< /Type /Catalog /Pages 2 0 R >>',
+        b'<< /Type /Pages /Kids [3 0 R] /Count 1 >>',
+        b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents 4 0 R '
+        b'/Resources << /Font << /F1 5 0 R >> >> >>',
+        b'<< /Length ' + str(len(stream)).encode() + b' >>\nstream\n' + stream + b'\nendstream',
+        b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>',
+    ]
+    out = io.BytesIO()
+    out.write(b'%PDF-1.4\n')
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(out.tell())
+        out.write(f'{number} 0 obj\n'.encode() + body + b'\nendobj\n')
+    xref = out.tell()
+    out.write(f'xref\n0 {len(objects) + 1}\n0000000000 65535 f \n'.encode())
+    for offset in offsets:
+        out.write(f'{offset:010d} 00000 n \n'.encode())
+    out.write(f'trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n'.encode())
+    return out.getvalue()
+
+def build_docx(lines: Sequence[str]) -> bytes:
+    from docx import Document
+    document = Document()
+    for line in lines:
+        document.add_paragraph(line)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+class DataGenerator:
+
+    def __init__(self, seed: int = 42, batch_size: int = 10000, upload_folder: str = None,
+                 email_prefix: str = 'loadtest'):
+        self.seed = seed
+        self.batch_size = batch_size
+        self.upload_folder = upload_folder
+        self.email_prefix = email_prefix
+        self.roles = list(ROLES)
+        self.timings = {}
+
+    def rng(self, stream: str) -> random.Random:
+        # Each table gets its own stream so changing one count doesn't reshuffle the others.
+        return random.Random(f'{self.seed}:{stream}')
+
+    @property
+    def is_postgres(self) -> bool:
+        return db.engine.dialect.name == 'postgresql'
+
+    def next_id(self, model) -> int:
+        return (db.session.query(db.func.max(model.id)).scalar() or 0) + 1
+
+    def bulk_load(self, table, columns: List[str], rows: Iterable[tuple]) -> int:
+        started = time.perf_counter()
+        total = 0
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= self.batch_size:
+                self._flush(table, columns, batch)
+                total += len(batch)
+                batch = []
+        if batch:
+            self._flush(table, columns, batch)
+            total += len(batch)
+        db.session.commit()
+
+        if self.is_postgres and 'id' in columns:
+            db.session.execute(db.text(
+                f"SELECT setval(pg_get_serial_sequence('{table.name}', 'id'), "
+                f"(SELECT COALESCE(MAX(id), 1) FROM {table.name}))"
+            ))
+            db.session.commit()
+
+        elapsed = time.perf_counter() - started
+        self.timings[table.name] = {'rows': total, 'seconds': round(elapsed, 2)}
+        logger.info(f"Loaded {total} rows into {table.name} in {elapsed:.2f}s")
+        return total
+
+    def _flush(self, table, columns: List[str], batch: List[tuple]):
+        connection = db.session.connection()
+        if self.is_postgres:
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            for row in batch:
+                writer.writerow(['\\N' if value is None else '\\x' + value.hex() if isinstance(value, bytes) else value
+                                 for value in row])
+            buffer.seek(0)
+            cursor = connection.connection.cursor()
+            cursor.copy_expert(
+                f"COPY {table.name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+                buffer
+            )
+        else:
+            connection.execute(table.insert(), [dict(zip(columns, row)) for row in batch])
+
+    def generate_users(self, count: int) -> List[int]:
+        rng = self.rng('users')
+        start_id = self.next_id(User)
+        password_hash = password_hasher.hash('password123')
+
+        def rows():
+            for i in range(count):
+                name = f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}'
+                yield (start_id + i, f'{self.email_prefix}{i}@example.com', password_hash, name,
+                       f'+1 555-{rng.randint(1000, 9999)}', rng.choice(LOCATIONS),
+                       EPOCH + timedelta(minutes=i), False)
+
+        self.bulk_load(User.__table__, ['id', 'email', 'password_hash', 'full_name', 'phone',
+                                        'location', 'created_at', 'is_admin'], rows())
+        return list(range(start_id, start_id + count))
+
+    def make_job(self, rng: random.Random, index: int) -> Dict:
+        role = rng.choice(self.roles)
+        prefix, level, years = rng.choice(LEVELS)
+        title = f'{prefix} {role}'.strip()
+        skills = rng.sample(ROLES[role], min(len(ROLES[role]), rng.randint(3, 6)))
+        company = rng.choice(COMPANIES)
+        salary_min = rng.randrange(40000, 160000, 5000)
+        description = (
+            f'{company} is looking for a {title} to join our growing team.\n\n'
+            f'Responsibilities:\n- Build and maintain systems using {skills[0]} and {skills[1]}\n'
+            f'- Collaborate with cross-functional teams\n- Mentor colleagues and review work\n\n'
+            f'You will work day to day with {", ".join(skills)}.'
+        )
+        requirements = (
+            f'- {years}+ years of relevant experience\n- Strong proficiency in {skills[0]}\n'
+            f'- Familiarity with {", ".join(skills[1:])}\n- Excellent communication skills'
+        )
+        return {
+            'title': title,
+            'company': company,
+            'description': description,
+            'summary': summarize(description),
+            'requirements': requirements,
+            'salary_min': salary_min,
+            'salary_max': salary_min + rng.randrange(10000, 60000, 5000),
+            'location': rng.choice(LOCATIONS),
+            'industry': ROLE_INDUSTRIES.get(role, 'Technology'),
+            'job_type': rng.choice(JOB_TYPES),
+            'experience_level': level,
+            'skills_required': ', '.join(skills),
+            'posted_date': EPOCH + timedelta(minutes=index),
+            'is_featured': rng.random() < 0.05,
+            'is_active': rng.random() < 0.95,
+        }
+
+    def generate_jobs(self, count: int) -> List[int]:
+        rng = self.rng('jobs')
+        start_id = self.next_id(Job)
+        columns = ['title', 'company', 'description', 'summary', 'requirements', 'salary_min', 'salary_max',
+                   'location', 'industry', 'job_type', 'experience_level', 'skills_required',
+                   'posted_date', 'is_featured', 'is_active']
+
+        def rows():
+            for i in range(count):
+                job = self.make_job(rng, i)
+                yield (start_id + i, 'USD', job['posted_date']) + tuple(job[c] for c in columns)
+
+        self.bulk_load(Job.__table__, ['id', 'salary_currency', 'updated_at'] + columns, rows())
+        return list(range(start_id, start_id + count))
+
+    def generate_aggregated_jobs(self, count: int) -> int:
+        rng = self.rng('aggregated_jobs')
+        start_id = self.next_id(AggregatedJob)
+
+        def rows():
+            for i in range(count):
+                platform = PLATFORMS[i % len(PLATFORMS)]
+                role = rng.choice(self.roles)
+                prefix, _, _ = rng.choice(LEVELS)
+                title = f'{prefix} {role}'.strip()
+                salary = rng.randrange(40, 200, 5)
+                company = rng.choice(COMPANIES)
+                description = f'Exciting {title} opportunity working with {", ".join(rng.sample(ROLES[role], 3))}.'
+                yield (start_id + i, platform, f'gen{start_id + i}', title, company, description, summarize(description),
+                       rng.choice(LOCATIONS), f'${salary},000 - ${salary + 30},000', rng.choice(JOB_TYPES),
+                       f'https://{platform}.example.com/jobs/{start_id + i}',
+                       EPOCH + timedelta(seconds=i), True)
+
+        return self.bulk_load(AggregatedJob.__table__, [
+            'id', 'source_platform', 'external_id', 'title', 'company', 'description', 'summary', 'location',
+            'salary_info', 'job_type', 'url', 'scraped_at', 'is_active'], rows())
+
+    def make_resume(self, rng: random.Random, name: str) -> Dict:
+        role = rng.choice(self.roles)
+        years = rng.randint(0, 15)
+        skills = sorted(s.lower() for s in rng.sample(ROLES[role], min(len(ROLES[role]), rng.randint(4, 8))))
+        education = rng.choice(EDUCATION)
+        lines = [
+            name,
+            f'{role} with {years} years of experience',
+            f'Skills: {", ".join(skills)}',
+            f'Education: {education}',
+            f'Worked at {rng.choice(COMPANIES)} and {rng.choice(COMPANIES)} delivering {role.lower()} projects.',
+        ]
+        return {
+            'lines': lines,
+            'text': '\n'.join(lines) + '\n',
+            'skills': skills,
+            'years': years,
+            'education': education,
+        }
+
+    def generate_resumes(self, user_ids: List[int], count: int, files: int = 0) -> Dict[int, List[int]]:
+        rng = self.rng('resumes')
+        start_id = self.next_id(Resume)
+        resume_dir = os.path.join(self.upload_folder or '', 'resumes')
+        if files:
+            os.makedirs(resume_dir, exist_ok=True)
+        by_user = {}
+        texts = []
+
+        def rows():
+            for i in range(count):
+                resume_id = start_id + i
+                user_id = user_ids[i % len(user_ids)]
+                resume = self.make_resume(rng, f'Candidate {user_id}')
+                ext = 'pdf' if i % 2 == 0 else 'docx'
+                filename = f'resume_{resume_id}.{ext}'
+                file_path = os.path.join(resume_dir, f'{user_id}_generated_{filename}')
+                if i < files:
+                    content = build_pdf(resume['lines']) if ext == 'pdf' else build_docx(resume['lines'])
+                    with open(file_path, 'wb') as f:
+                        f.write(content)
+                by_user.setdefault(user_id, []).append(resume_id)
+                texts.append((resume_id, resume['text']))
+                yield (resume_id, user_id, filename, file_path, EPOCH + timedelta(minutes=i),
+                       ','.join(resume['skills']), resume['years'], resume['education'], i < len(user_ids))
+
+        self.bulk_load(Resume.__table__, ['id', 'user_id', 'filename', 'file_path', 'upload_date',
+                                          'extracted_skills', 'experience_years', 'education', 'is_primary'], rows())
+        self.bulk_load(ResumeText.__table__, ['resume_id', 'codec', 'content', 'vocabulary'],
+                       ((resume_id, *pack(text)) for resume_id, text in texts))
+        return by_user
+
+    def generate_applications(self, user_ids: List[int], job_ids: List[int],
+                              resumes_by_user: Dict[int, List[int]], count: int) -> int:
+        rng = self.rng('applications')
+        per_user = max(1, -(-count // max(1, len(user_ids))))
+
+        def rows():
+            produced = 0
+            for user_id in user_ids:
+                resume_ids = resumes_by_user.get(user_id)
+                for job_id in rng.sample(job_ids, min(per_user, len(job_ids))):
+                    if produced >= count:
+                        return
+                    yield (user_id, job_id, rng.choice(resume_ids) if resume_ids else None,
+                           rng.choice(APPLICATION_STATUSES), EPOCH + timedelta(minutes=produced))
+                    produced += 1
+
+        return self.bulk_load(JobApplication.__table__, ['user_id', 'job_id', 'resume_id', 'status', 'applied_at'], rows())
+
+    def generate_saved_jobs(self, user_ids: List[int], job_ids: List[int], count: int) -> int:
+        rng = self.rng('saved_jobs')
+        per_user = max(1, -(-count // max(1, len(user_ids))))
+
+        def rows():
+            produced = 0
+            for user_id in user_ids:
+                for job_id in rng.sample(job_ids, min(per_user, len(job_ids))):
+                    if produced >= count:
+                        return
+                    yield (user_id, job_id, EPOCH + timedelta(minutes=produced))
+                    produced += 1
+
+        return self.bulk_load(saved_jobs, ['user_id', 'job_id', 'saved_at'], rows())
+
+    def generate_skill_index(self) -> Dict[str, int]:
+        started = time.perf_counter()
+        counts = SkillIndex(batch_size=self.batch_size).rebuild()
+        elapsed = round(time.perf_counter() - started, 2)
+        for table, rows in counts.items():
+            self.timings[table] = {'rows': rows, 'seconds': elapsed}
+        return counts
+
+    def generate(self, users: int = 1000, jobs: int = 100000, aggregated_jobs: int = 1000000,
+                 resumes: int = 1000, applications: int = 5000, saved: int = 5000, resume_files: int = 0) -> Dict:
+        started = time.perf_counter()
+        user_ids = self.generate_users(users)
+        job_ids = self.generate_jobs(jobs)
+        self.generate_aggregated_jobs(aggregated_jobs)
+        resumes_by_user = self.generate_resumes(user_ids, resumes, files=resume_files) if user_ids else {}
+        if user_ids and job_ids:
+            self.generate_applications(user_ids, job_ids, resumes_by_user, applications)
+            self.generate_saved_jobs(user_ids, job_ids, saved)
+        self.generate_skill_index()
+        total = time.perf_counter() - started
+        logger.info(f"Generated dataset in {total:.2f}s")
+        return {'seconds': round(total, 2), 'tables': self.timings}
@@ -1,5 +1,14 @@
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import LoginManager
+from talentbridge.cache import TTLCache
+from talentbridge.security import PasswordHasher
+from talentbridge.database import DatabaseTopology, RoutingSession
+from talentbridge.assets import StaticAssets
 
-db = SQLAlchemy()
+db = SQLAlchemy(session_options={'class_': RoutingSession})
+db_topology = DatabaseTopology()
 login_manager = LoginManager()
+user_cache = TTLCache('users', versioned=True)
+fragment_cache = TTLCache('fragments', max_size=20000)
+password_hasher = PasswordHasher()
+static_assets = StaticAssets()
@@ -0,0 +1,313 @@
+import io
+import re
+import csv
+import json
+import time
+import logging
+from datetime import datetime
+from typing import Callable, Dict, IO, Iterator, List, Optional, Tuple
+from sqlalchemy import func, insert, tuple_, update
+from sqlalchemy.exc import SQLAlchemyError
+from talentbridge.extensions import db
+from talentbridge.models import Job, summarize
+from talentbridge.jobs.similarity import JobSimilarityEngine
+from talentbridge.resumes.embeddings import get_embedder, index_jobs, rebuild_job_index
+from talentbridge.skills import SkillIndex
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+TEXT_FIELDS = ('external_id', 'title', 'company', 'description', 'requirements', 'salary_currency', 'location',
+               'industry', 'job_type', 'experience_level', 'skills_required', 'apply_url')
+INT_FIELDS = ('salary_min', 'salary_max')
+BOOL_FIELDS = ('is_featured', 'is_active')
+REQUIRED_FIELDS = ('title', 'company', 'description')
+TRUE_VALUES = {'1', 'true', 'yes', 'y', 't'}
+FALSE_VALUES = {'0', 'false', 'no', 'n', 'f'}
+INSERT_FIELDS = TEXT_FIELDS + INT_FIELDS + BOOL_FIELDS + ('summary', 'posted_date', 'updated_at')
+WHITESPACE_RE = re.compile(r'\s*')
+
+def detect_format(filename: str) -> str:
+    extension = filename.rsplit('.', 1)[-1].lower() if '.' in filename else ''
+    if extension in ('csv', 'json', 'jsonl'):
+        return extension
+    if extension == 'ndjson':
+        return 'jsonl'
+    raise ValueError(f'Unsupported feed type: {filename}')
+
+def read_records(stream: IO[bytes], fmt: str) -> Iterator[Tuple[int, object, Optional[str]]]:
+    text = io.TextIOWrapper(stream, encoding='utf-8-sig', newline='' if fmt == 'csv' else None)
+    if fmt == 'csv':
+        reader = csv.DictReader(text)
+        for row in reader:
+            yield reader.line_num, row, None
+    elif fmt == 'jsonl':
+        for line_num, line in enumerate(text, 1):
+            if not line.strip():
+                continue
+            try:
+                yield line_num, json.loads(line), None
+            except ValueError as e:
+                yield line_num, line.strip(), f'Invalid JSON: {e}'
+    else:
+        yield from _read_json_array(text)
+
+def _read_json_array(text: IO[str], chunk_size: int = 65536) -> Iterator[Tuple[int, object, Optional[str]]]:
+    # Decode one array element at a time so a large feed never has to fit in memory.
+    decoder = json.JSONDecoder()
+    buffer = text.read(chunk_size).lstrip()
+    if not buffer.startswith('['):
+        yield 0, buffer[:100], 'JSON feed must be an array of job objects'
+        return
+    pos = 1
+    index = 0
+    # True after the opening bracket and after each comma, when the next thing must be an element.
+    separated = True
+    while True:
+        pos = WHITESPACE_RE.match(buffer, pos).end()
+        if pos >= len(buffer):
+            more = text.read(chunk_size)
+            if not more:
+                yield index + 1, '', 'Invalid JSON: the array is not closed'
+                return
+            buffer = buffer[pos:] + more
+            pos = 0
+            continue
+        if buffer[pos] == ']' and not (separated and index):
+            return
+        if not separated:
+            if buffer[pos] != ',':
+                yield index + 1, buffer[pos:pos + 100], "Invalid JSON: expected ',' or ']' after an array element"
+                return
+            pos += 1
+            separated = True
+            continue
+        if buffer[pos] in ',]':
+            yield index + 1, buffer[pos:pos + 100], 'Invalid JSON: expected an array element'
+            return
+        try:
+            record, pos = decoder.raw_decode(buffer, pos)
+        except ValueError as e:
+            more = text.read(chunk_size)
+            if not more:
+                yield index + 1, buffer[pos:pos + 100], f'Invalid JSON: {e}'
+                return
+            buffer = buffer[pos:] + more
+            pos = 0
+            continue
+        index += 1
+        separated = False
+        yield index, record, None
+
+class JobImporter:
+
+    def __init__(self, batch_size: int = 1000, refresh_limit: int = 500, index_rebuild_limit: int = 5000,
+                 max_reported_rejects: int = 200, on_reject: Callable = None):
+        self.batch_size = batch_size
+        self.refresh_limit = refresh_limit
+        self.index_rebuild_limit = index_rebuild_limit
+        self.max_reported_rejects = max_reported_rejects
+        self.on_reject = on_reject
+        self.lengths = {name: Job.__table__.c[name].type.length for name in TEXT_FIELDS}
+        self.embedder = get_embedder()
+        self.skills = SkillIndex(batch_size=batch_size)
+
+    def clean(self, raw) -> Tuple[Optional[Dict], Optional[str]]:
+        if not isinstance(raw, dict):
+            return None, 'Row is not an object'
+        values = {}
+        for name in TEXT_FIELDS:
+            value = raw.get(name)
+            if value is None or not str(value).strip():
+                continue
+            value = str(value).strip()
+            if self.lengths[name] and len(value) > self.lengths[name]:
+                return None, f'{name} is longer than {self.lengths[name]} characters'
+            values[name] = value
+        missing = [name for name in REQUIRED_FIELDS if name not in values]
+        if missing:
+            return None, f"Missing {', '.join(missing)}"
+
+        for name in INT_FIELDS:
+            value = raw.get(name)
+            if value is None or str(value).strip() == '':
+                continue
+            try:
+                values[name] = int(float(str(value).replace(',', '').replace('$', '').strip()))
+            except ValueError:
+                return None, f'{name} is not a number'
+            if values[name] < 0:
+                return None, f'{name} is negative'
+        if values.get('salary_min') and values.get('salary_max') and values['salary_min'] > values['salary_max']:
+            return None, 'salary_min is greater than salary_max'
+
+        for name in BOOL_FIELDS:
+            value = raw.get(name)
+            if value is None or str(value).strip() == '':
+                continue
+            if isinstance(value, bool):
+                values[name] = value
+            elif str(value).strip().lower() in TRUE_VALUES:
+                values[name] = True
+            elif str(value).strip().lower() in FALSE_VALUES:
+                values[name] = False
+            else:
+                return None, f'{name} must be true or false'
+
+        if 'apply_url' in values and not values['apply_url'].startswith(('http://', 'https://')):
+            return None, 'apply_url must be an http(s) URL'
+        values['summary'] = summarize(values['description'])
+        if 'skills_required' in values:
+            values['skills_required'] = ', '.join(s.strip() for s in values['skills_required'].split(',') if s.strip())
+        if raw.get('posted_date'):
+            try:
+                values['posted_date'] = datetime.fromisoformat(str(raw['posted_date']).strip())
+            except ValueError:
+                return None, 'posted_date is not an ISO date'
+        return values, None
+
+    def natural_key(self, values: Dict) -> Tuple:
+        if values.get('external_id'):
+            return ('external', values['company'], values['external_id'])
+        return ('natural', values['company'], values['title'], values.get('location') or '')
+
+    def run(self, records: Iterator[Tuple[int, object, Optional[str]]]) -> Dict:
+        started = time.perf_counter()
+        stats = {'read': 0, 'inserted': 0, 'updated': 0, 'duplicates': 0, 'rejected': 0, 'rejects': [],
+                 'batches': 0}
+        affected = []
+        batch = {}
+        for position, raw, error in records:
+            stats['read'] += 1
+            values = None
+            if error is None:
+                values, error = self.clean(raw)
+            if error:
+                self._reject(stats, position, error, raw)
+                continue
+            key = self.natural_key(values)
+            if key in batch:
+                # The later posting in a feed wins, as it would across batches.
+                stats['duplicates'] += 1
+            batch[key] = (position, values)
+            if len(batch) >= self.batch_size:
+                affected.extend(self._flush(batch, stats))
+                batch = {}
+        if batch:
+            affected.extend(self._flush(batch, stats))
+
+        loaded = time.perf_counter()
+        self._update_indexes(affected)
+        stats['elapsed'] = time.perf_counter() - started
+        stats['index_seconds'] = time.perf_counter() - loaded
+        stats['rows_per_second'] = stats['read'] / stats['elapsed'] if stats['elapsed'] else 0.0
+        logger.info(f"Imported {stats['inserted']} new and {stats['updated']} updated jobs, "
+                    f"rejected {stats['rejected']} rows in {stats['elapsed']:.1f}s")
+        return stats
+
+    def _reject(self, stats: Dict, position: int, error: str, raw):
+        stats['rejected'] += 1
+        if len(stats['rejects']) < self.max_reported_rejects:
+            stats['rejects'].append({'row': position, 'error': error})
+        if self.on_reject:
+            self.on_reject(position, error, raw)
+
+    def _flush(self, batch: Dict[Tuple, Tuple[int, Dict]], stats: Dict) -> List[int]:
+        now = datetime.utcnow()
+        try:
+            existing = self._existing_ids(batch)
+            inserts = []
+            updates = []
+            for key, (_, values) in batch.items():
+                values = dict(values, updated_at=now)
+                if key in existing:
+                    updates.append(dict(values, id=existing[key]))
+                else:
+                    values.setdefault('salary_currency', 'USD')
+                    values.setdefault('is_active', True)
+                    values.setdefault('is_featured', False)
+                    values.setdefault('posted_date', now)
+                    inserts.append({name: values.get(name) for name in INSERT_FIELDS})
+
+            ids = [row['id'] for row in updates]
+            if updates:
+                db.session.execute(update(Job), updates)
+            if inserts:
+                ids.extend(db.session.scalars(insert(Job).returning(Job.id, sort_by_parameter_order=True), inserts))
+            self._embed(ids)
+            self._index_skills(ids)
+            db.session.commit()
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            logger.error(f"Error importing job batch: {str(e)}")
+            for position, values in batch.values():
+                self._reject(stats, position, f'Database error: {e.__class__.__name__}', values)
+            return []
+
+        stats['inserted'] += len(inserts)
+        stats['updated'] += len(updates)
+        stats['batches'] += 1
+        return ids
+
+    def _existing_ids(self, batch: Dict[Tuple, Tuple[int, Dict]]) -> Dict[Tuple, int]:
+        found = {}
+        external = [(key[1], key[2]) for key in batch if key[0] == 'external']
+        if external:
+            for job_id, company, external_id in db.session.query(Job.id, Job.company, Job.external_id).filter(
+                tuple_(Job.company, Job.external_id).in_(external)
+            ):
+                found[('external', company, external_id)] = job_id
+
+        # Rows without an external_id match can still update a job entered by hand with the same title.
+        natural = {}
+        for key, (_, values) in batch.items():
+            if key not in found:
+                natural[(values['company'], values['title'], values.get('location') or '')] = key
+        if natural:
+            location = func.coalesce(Job.location, '')
+            for job_id, company, title, loc, external_id in db.session.query(
+                Job.id, Job.company, Job.title, location, Job.external_id
+            ).filter(tuple_(Job.company, Job.title, location).in_(list(natural))):
+                key = natural[(company, title, loc)]
+                if key[0] == 'external' and external_id is not None:
+                    continue
+                found.setdefault(key, job_id)
+        return found
+
+    def _embed(self, job_ids: List[int]):
+        if not job_ids:
+            return
+        columns = (Job.id, Job.title, Job.skills_required, Job.industry, Job.experience_level, Job.requirements,
+                   Job.description)
+        rows = db.session.query(*columns).filter(Job.id.in_(job_ids)).all()
+        db.session.execute(update(Job), [
+            {'id': row.id, 'embedding': self.embedder.to_bytes(self.embedder.embed_job(row))} for row in rows
+        ])
+
+    def _index_skills(self, job_ids: List[int]):
+        if job_ids:
+            self.skills.index_jobs(db.session.query(Job.id, Job.skills_required).filter(Job.id.in_(job_ids)).all())
+
+    def _update_indexes(self, job_ids: List[int]):
+        job_ids = list(dict.fromkeys(job_ids))
+        if not job_ids:
+            return
+        # Big feeds are cheaper to index with one full rebuild than with per-job incremental updates.
+        try:
+            if len(job_ids) > self.index_rebuild_limit:
+                rebuild_job_index()
+            else:
+                for start in range(0, len(job_ids), self.batch_size):
+                    chunk = job_ids[start:start + self.batch_size]
+                    index_jobs(db.session.query(Job.id, Job.embedding, Job.is_active).filter(Job.id.in_(chunk)).all())
+            engine = JobSimilarityEngine()
+            if len(job_ids) > self.refresh_limit:
+                engine.rebuild()
+            else:
+                engine.refresh(job_ids)
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Error updating job indexes after import: {str(e)}")
+
+def import_jobs(stream: IO[bytes], fmt: str, **options) -> Dict:
+    return JobImporter(**options).run(read_records(stream, fmt))
@@ -1,11 +1,15 @@
 from flask import render_template, request, redirect, url_for, flash, jsonify
 from flask_login import current_user, login_required
-from sqlalchemy import or_
+from sqlalchemy import exists, or_
 from talentbridge.extensions import db
+from talentbridge.database import replica_reads
 from talentbridge.jobs import bp
 from talentbridge.models import Job, AggregatedJob, saved_jobs
+from talentbridge.jobs.similarity import get_similar_jobs
+from talentbridge.skills import jobs_matching_skill, jobs_with_skills
 
 @bp.route('/')
+@replica_reads
 def job_list():
     page = request.args.get('page', 1, type=int)
     per_page = 12
@@ -14,6 +18,7 @@ def job_list():
     location = request.args.get('location', '').strip()
     industry = request.args.get('industry', '').strip()
     job_type = request.args.get('job_type', '').strip()
+    skill = request.args.get('skill', '').strip()
     
     query = Job.query.filter_by(is_active=True)
     
@@ -23,10 +28,13 @@ def job_list():
                 Job.title.ilike(f'%{keyword}%'),
                 Job.company.ilike(f'%{keyword}%'),
                 Job.description.ilike(f'%{keyword}%'),
-                Job.skills_required.ilike(f'%{keyword}%')
+                Job.id.in_(jobs_matching_skill(keyword))
             )
         )
     
+    if skill:
+        query = query.filter(Job.id.in_(jobs_with_skills(skill.split(','))))
+    
     if location:
         query = query.filter(Job.location.ilike(f'%{location}%'))
     
@@ -59,9 +67,17 @@ def job_list():
     job_types = db.session.query(Job.job_type).filter(Job.job_type.isnot(None)).distinct().all()
     job_types = [j[0] for j in job_types if j[0]]
     
+    saved_job_ids = set()
+    applied_job_ids = set()
+    if current_user.is_authenticated:
+        saved_job_ids = current_user.saved_job_ids
+        applied_job_ids = current_user.applied_job_ids
+    
     return render_template('jobs/job_list.html', 
                           title='Find Jobs',
                           jobs=jobs,
+                          saved_job_ids=saved_job_ids,
+                          applied_job_ids=applied_job_ids,
                           aggregated_jobs=aggregated_jobs,
                           industries=industries,
                           job_types=job_types,
@@ -69,27 +85,22 @@ def job_list():
                               'keyword': keyword,
                               'location': location,
                               'industry': industry,
-                              'job_type': job_type
+                              'job_type': job_type,
+                              'skill': skill
                           })
 
 @bp.route('/<int:job_id>')
+@replica_reads
 def job_detail(job_id):
-    job = Job.query.get_or_404(job_id)
+    job = Job.query.options(db.undefer_group('body')).get_or_404(job_id)
     is_saved = False
     has_applied = False
     
     if current_user.is_authenticated:
-        is_saved = current_user.saved_jobs.filter_by(id=job_id).first() is not None
-        has_applied = any(app.job_id == job_id for app in current_user.applications)
+        is_saved = job_id in current_user.saved_job_ids
+        has_applied = job_id in current_user.applied_job_ids
     
-    similar_jobs = Job.query.filter(
-        Job.id != job_id,
-        Job.is_active == True,
-        or_(
-            Job.industry == job.industry,
-            Job.job_type == job.job_type
-        )
-    ).limit(4).all()
+    similar_jobs = get_similar_jobs(job, limit=4)
     
     return render_template('jobs/job_detail.html',
                           title=job.title,
@@ -103,13 +114,18 @@ def job_detail(job_id):
 def save_job(job_id):
     job = Job.query.get_or_404(job_id)
     
-    if current_user.saved_jobs.filter_by(id=job_id).first():
+    # The cached id sets can be stale in other workers, so writes check the table itself.
+    is_saved = db.session.query(exists().where(saved_jobs.c.user_id == current_user.id,
+                                               saved_jobs.c.job_id == job_id)).scalar()
+    if is_saved:
         current_user.saved_jobs.remove(job)
         db.session.commit()
+        current_user.mark_job_saved(job_id, False)
         flash('Job removed from saved jobs.', 'info')
     else:
         current_user.saved_jobs.append(job)
         db.session.commit()
+        current_user.mark_job_saved(job_id)
         flash('Job saved successfully!', 'success')
     
     return redirect(request.referrer or url_for('jobs.job_detail', job_id=job_id))
@@ -121,8 +137,10 @@ def apply_job(job_id):
     
     job = Job.query.get_or_404(job_id)
     
-    existing = JobApplication.query.filter_by(user_id=current_user.id, job_id=job_id).first()
-    if existing:
+    has_applied = db.session.query(exists().where(JobApplication.user_id == current_user.id,
+                                                  JobApplication.job_id == job_id)).scalar()
+    if has_applied:
+        current_user.mark_job_applied(job_id)
         flash('You have already applied for this job.', 'warning')
         return redirect(url_for('jobs.job_detail', job_id=job_id))
     
@@ -138,6 +156,7 @@ def apply_job(job_id):
         )
         db.session.add(application)
         db.session.commit()
+        current_user.mark_job_applied(job_id)
         
         flash('Application submitted successfully!', 'success')
         return redirect(url_for('jobs.job_detail', job_id=job_id))
@@ -146,6 +165,7 @@ def apply_job(job_id):
     return render_template('jobs/apply.html', title=f'Apply for {job.title}', job=job, resumes=resumes)
 
 @bp.route('/api/search')
+@replica_reads
 def api_search():
     keyword = request.args.get('q', '').strip()
     if len(keyword) < 2:
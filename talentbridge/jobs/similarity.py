@@ -0,0 +1,287 @@
+import re
+import math
+import zlib
+import heapq
+import random
+import logging
+from collections import Counter, defaultdict
+from datetime import datetime
+from typing import Dict, Iterable, List, Tuple
+from sqlalchemy import or_
+from talentbridge.extensions import db
+from talentbridge.models import Job, JobNeighbors, JobTerm, JobLshBucket
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+TOKEN_RE = re.compile(r'[a-z0-9][a-z0-9+#.]*')
+STOPWORDS = {'a', 'an', 'and', 'at', 'for', 'in', 'of', 'on', 'the', 'to', 'with', 'i', 'ii', 'iii'}
+MERSENNE_PRIME = (1 << 61) - 1
+BAND_KEY_MOD = 1 << 62
+
+def job_terms(title: str, skills_required: str, industry: str, job_type: str, experience_level: str) -> Counter:
+    terms = Counter()
+    for word in TOKEN_RE.findall((title or '').lower()):
+        if word not in STOPWORDS:
+            terms[f't:{word}'] += 2
+    for skill in (skills_required or '').split(','):
+        skill = skill.strip().lower()
+        if skill:
+            terms[f's:{skill}'] += 3
+    if industry:
+        terms[f'i:{industry.lower()}'] += 1
+    if job_type:
+        terms[f'j:{job_type.lower()}'] += 1
+    if experience_level:
+        terms[f'e:{experience_level.lower()}'] += 1
+    return terms
+
+def cosine(a: Dict[str, float], b: Dict[str, float]) -> float:
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(weight * b.get(term, 0.0) for term, weight in a.items())
+
+class JobSimilarityEngine:
+    COLUMNS = (Job.id, Job.title, Job.skills_required, Job.industry, Job.job_type, Job.experience_level)
+
+    def __init__(self, k: int = 10, num_hashes: int = 32, band_size: int = 2,
+                 max_candidates: int = 100, batch_size: int = 5000):
+        self.k = k
+        self.band_size = band_size
+        self.max_candidates = max_candidates
+        self.batch_size = batch_size
+        # Fixed seed so band keys stay comparable between the offline build and incremental refreshes.
+        rng = random.Random(20240101)
+        self.hash_params = [(rng.randrange(1, MERSENNE_PRIME), rng.randrange(0, MERSENNE_PRIME))
+                            for _ in range(num_hashes)]
+
+    def band_keys(self, terms: Iterable[str]) -> List[int]:
+        hashes = [zlib.crc32(term.encode()) for term in terms]
+        if not hashes:
+            return []
+        minima = [min((a * h + b) % MERSENNE_PRIME for h in hashes) for a, b in self.hash_params]
+        keys = []
+        for band, start in enumerate(range(0, len(minima), self.band_size)):
+            key = band
+            for value in minima[start:start + self.band_size]:
+                key = (key * 1000003 + value) % BAND_KEY_MOD
+            keys.append(key)
+        return keys
+
+    def vector(self, terms: Counter, doc_counts: Dict[str, int], total_docs: int) -> Dict[str, float]:
+        weights = {}
+        for term, tf in terms.items():
+            idf = math.log((1 + total_docs) / (1 + doc_counts.get(term, 0))) + 1
+            weights[term] = tf * idf
+        norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+        return {term: w / norm for term, w in weights.items()}
+
+    def rank(self, vector: Dict[str, float], candidates: Iterable[Tuple[int, Dict[str, float]]],
+             exclude: int = None, limit: int = None) -> List[Tuple[int, float]]:
+        scored = ((job_id, cosine(vector, other)) for job_id, other in candidates if job_id != exclude)
+        top = heapq.nlargest(limit or self.k, scored, key=lambda x: x[1])
+        return [(job_id, score) for job_id, score in top if score > 0]
+
+    def rebuild(self) -> int:
+        started = datetime.utcnow()
+        terms_by_job = {}
+        for row in db.session.query(*self.COLUMNS).filter(Job.is_active == True).yield_per(self.batch_size):
+            terms_by_job[row[0]] = job_terms(*row[1:])
+
+        doc_counts = Counter()
+        for terms in terms_by_job.values():
+            doc_counts.update(terms.keys())
+        total_docs = len(terms_by_job)
+
+        vectors = {}
+        keys_by_job = {}
+        buckets = defaultdict(list)
+        for job_id, terms in terms_by_job.items():
+            vectors[job_id] = self.vector(terms, doc_counts, total_docs)
+            keys_by_job[job_id] = self.band_keys(terms)
+            for key in keys_by_job[job_id]:
+                buckets[key].append(job_id)
+
+        # Jobs with identical term profiles share a candidate set, so rank it once.
+        ranked_by_profile = {}
+        neighbor_rows = []
+        for job_id, terms in terms_by_job.items():
+            profile = tuple(sorted(terms.items()))
+            ranked = ranked_by_profile.get(profile)
+            if ranked is None:
+                candidates = self._bucket_candidates(keys_by_job[job_id], buckets)
+                ranked = self.rank(vectors[job_id], ((c, vectors[c]) for c in candidates), limit=self.k + 1)
+                ranked_by_profile[profile] = ranked
+            neighbors = [(n, s) for n, s in ranked if n != job_id][:self.k]
+            neighbor_rows.append({'job_id': job_id, 'neighbors': JobNeighbors.encode(neighbors),
+                                  'terms': '\n'.join(sorted(terms)), 'computed_at': started})
+
+        db.session.execute(JobNeighbors.__table__.delete())
+        db.session.execute(JobTerm.__table__.delete())
+        db.session.execute(JobLshBucket.__table__.delete())
+        self._insert(JobNeighbors.__table__, neighbor_rows)
+        self._insert(JobTerm.__table__, [{'term': t, 'doc_count': c} for t, c in doc_counts.items()])
+        self._insert(JobLshBucket.__table__, [{'band_key': key, 'job_id': job_id}
+                                              for job_id, keys in keys_by_job.items() for key in set(keys)])
+        db.session.commit()
+
+        logger.info(f"Computed similar jobs for {total_docs} jobs in {(datetime.utcnow() - started).total_seconds():.1f}s")
+        return total_docs
+
+    def _bucket_candidates(self, keys: List[int], buckets: Dict[int, List[int]]) -> List[int]:
+        candidates = []
+        seen = set()
+        for key in keys:
+            for job_id in buckets.get(key, ()):
+                if job_id not in seen:
+                    seen.add(job_id)
+                    candidates.append(job_id)
+                    if len(candidates) >= self.max_candidates:
+                        return candidates
+        return candidates
+
+    def _insert(self, table, rows: List[Dict]):
+        for start in range(0, len(rows), self.batch_size):
+            db.session.execute(table.insert(), rows[start:start + self.batch_size])
+
+    def refresh(self, job_ids: List[int]) -> int:
+        job_ids = list(job_ids)
+        if not job_ids:
+            return 0
+        rows = {row[0]: row for row in db.session.query(*self.COLUMNS, Job.is_active).filter(Job.id.in_(job_ids)).all()}
+        previous = self._indexed_terms(job_ids)
+
+        db.session.query(JobLshBucket).filter(JobLshBucket.job_id.in_(job_ids)).delete(synchronize_session=False)
+        inactive = [job_id for job_id in job_ids if job_id not in rows or not rows[job_id].is_active]
+        if inactive:
+            db.session.query(JobNeighbors).filter(JobNeighbors.job_id.in_(inactive)).delete(synchronize_session=False)
+
+        active = {job_id: job_terms(*row[1:6]) for job_id, row in rows.items() if row.is_active}
+        self._update_doc_counts(previous.values(), active.values())
+        if not active:
+            db.session.commit()
+            return 0
+
+        total_docs = Job.query.filter_by(is_active=True).count()
+
+        keys_by_job = {job_id: self.band_keys(terms) for job_id, terms in active.items()}
+        db.session.execute(JobLshBucket.__table__.insert(), [
+            {'band_key': key, 'job_id': job_id} for job_id, keys in keys_by_job.items() for key in set(keys)
+        ])
+
+        candidate_ids = set()
+        candidates_by_job = {}
+        for job_id, keys in keys_by_job.items():
+            ids = [row[0] for row in db.session.query(JobLshBucket.job_id).filter(
+                JobLshBucket.band_key.in_(keys), JobLshBucket.job_id != job_id
+            ).distinct().limit(self.max_candidates).all()]
+            candidates_by_job[job_id] = ids
+            candidate_ids.update(ids)
+
+        candidate_terms = dict(active)
+        missing = candidate_ids - set(active)
+        if missing:
+            for row in db.session.query(*self.COLUMNS).filter(Job.id.in_(missing), Job.is_active == True).all():
+                candidate_terms[row[0]] = job_terms(*row[1:])
+
+        all_terms = set()
+        for terms in candidate_terms.values():
+            all_terms.update(terms.keys())
+        doc_counts = dict(db.session.query(JobTerm.term, JobTerm.doc_count).filter(JobTerm.term.in_(all_terms)).all())
+        vectors = {job_id: self.vector(terms, doc_counts, total_docs) for job_id, terms in candidate_terms.items()}
+
+        now = datetime.utcnow()
+        for job_id in active:
+            candidates = [(c, vectors[c]) for c in candidates_by_job[job_id] if c in vectors]
+            neighbors = self.rank(vectors[job_id], candidates, exclude=job_id)
+            row = db.session.get(JobNeighbors, job_id) or JobNeighbors(job_id=job_id)
+            row.neighbors = JobNeighbors.encode(neighbors)
+            row.terms = '\n'.join(sorted(active[job_id]))
+            row.computed_at = now
+            db.session.add(row)
+            self._link_back(job_id, neighbors, now)
+
+        db.session.commit()
+        return len(active)
+
+    def remove(self, job_ids: List[int]) -> int:
+        # Called before the jobs are deleted: their neighbor rows, which hold the indexed terms, go with them.
+        job_ids = list(job_ids)
+        if not job_ids:
+            return 0
+        previous = self._indexed_terms(job_ids)
+        self._update_doc_counts(previous.values(), ())
+        db.session.query(JobLshBucket).filter(JobLshBucket.job_id.in_(job_ids)).delete(synchronize_session=False)
+        db.session.query(JobNeighbors).filter(JobNeighbors.job_id.in_(job_ids)).delete(synchronize_session=False)
+        db.session.commit()
+        return len(previous)
+
+    def _indexed_terms(self, job_ids: List[int]) -> Dict[int, List[str]]:
+        rows = JobNeighbors.query.filter(JobNeighbors.job_id.in_(job_ids)).all()
+        return {row.job_id: row.get_terms() for row in rows}
+
+    def _update_doc_counts(self, old_term_sets: Iterable[Iterable[str]], new_term_sets: Iterable[Iterable[str]]):
+        delta = Counter()
+        for terms in old_term_sets:
+            delta.subtract(set(terms))
+        for terms in new_term_sets:
+            delta.update(set(terms))
+        delta = {term: count for term, count in delta.items() if count}
+        if not delta:
+            return
+        existing = {term.term: term for term in JobTerm.query.filter(JobTerm.term.in_(list(delta))).all()}
+        for term, count in delta.items():
+            row = existing.get(term)
+            if row is None:
+                if count > 0:
+                    db.session.add(JobTerm(term=term, doc_count=count))
+            elif row.doc_count + count > 0:
+                row.doc_count += count
+            else:
+                db.session.delete(row)
+        db.session.flush()
+
+    def _link_back(self, job_id: int, neighbors: List[Tuple[int, float]], now: datetime):
+        for neighbor_id, score in neighbors:
+            row = db.session.get(JobNeighbors, neighbor_id)
+            if row is None:
+                continue
+            current = [(n, s) for n, s in row.get_neighbors() if n != job_id]
+            if len(current) >= self.k and score <= current[-1][1]:
+                continue
+            current.append((job_id, score))
+            current.sort(key=lambda x: x[1], reverse=True)
+            row.neighbors = JobNeighbors.encode(current[:self.k])
+            row.computed_at = now
+
+def refresh_similar_jobs(job_ids: List[int]):
+    try:
+        JobSimilarityEngine().refresh(job_ids)
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"Error refreshing similar jobs: {str(e)}")
+
+def remove_similar_jobs(job_ids: List[int]):
+    try:
+        JobSimilarityEngine().remove(job_ids)
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"Error removing similar jobs: {str(e)}")
+
+def get_similar_jobs(job: Job, limit: int = 4) -> List[Job]:
+    row = db.session.get(JobNeighbors, job.id)
+    if row is None:
+        return Job.query.filter(
+            Job.id != job.id,
+            Job.is_active == True,
+            or_(
+                Job.industry == job.industry,
+                Job.job_type == job.job_type
+            )
+        ).limit(limit).all()
+
+    neighbor_ids = row.get_neighbor_ids()
+    if not neighbor_ids:
+        return []
+    jobs = {j.id: j for j in Job.query.filter(Job.id.in_(neighbor_ids), Job.is_active == True).all()}
+    return [jobs[job_id] for job_id in neighbor_ids if job_id in jobs][:limit]
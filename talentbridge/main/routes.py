@@ -1,9 +1,12 @@
 from flask import render_template, request, redirect, url_for, flash
 from talentbridge.extensions import db
+from talentbridge.database import replica_reads
 from talentbridge.main import bp
 from talentbridge.models import Job, Testimonial, Candidate, Employer, Message
+from talentbridge.resumes.talent import index_talent
 
 @bp.route('/')
+@replica_reads
 def index():
     featured_jobs = Job.query.filter_by(is_active=True, is_featured=True).order_by(Job.posted_date.desc()).limit(6).all()
     if len(featured_jobs) < 6:
@@ -64,6 +67,7 @@ def submit_cv():
         )
         db.session.add(candidate)
         db.session.commit()
+        index_talent(candidate)
         flash('Thank you for registering! We will review your profile and contact you with relevant opportunities.', 'success')
         return redirect(url_for('main.submit_cv'))
     
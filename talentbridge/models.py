@@ -1,7 +1,19 @@
+import re
+import html
 from datetime import datetime
-from werkzeug.security import generate_password_hash, check_password_hash
 from flask_login import UserMixin
-from talentbridge.extensions import db, login_manager
+from talentbridge.extensions import db, login_manager, user_cache, password_hasher
+from talentbridge.textstore import pack, unpack
+
+SUMMARY_LENGTH = 200
+TAG_RE = re.compile(r'<[^>]+>')
+
+def summarize(text, length=SUMMARY_LENGTH):
+    # Descriptions may hold HTML (job_detail renders them |safe); cards get plain text cut at a word.
+    text = ' '.join(html.unescape(TAG_RE.sub(' ', text or '')).split())
+    if len(text) <= length:
+        return text
+    return text[:length - 1].rsplit(' ', 1)[0].rstrip(' ,.;:') + '…'
 
 saved_jobs = db.Table('saved_jobs',
     db.Column('user_id', db.Integer, db.ForeignKey('users.id'), primary_key=True),
@@ -9,6 +21,50 @@ saved_jobs = db.Table('saved_jobs',
     db.Column('saved_at', db.DateTime, default=datetime.utcnow)
 )
 
+class Skill(db.Model):
+    __tablename__ = 'skills'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(100), unique=True, nullable=False)
+    
+    def __repr__(self):
+        return f'<Skill {self.name}>'
+
+class Degree(db.Model):
+    __tablename__ = 'degrees'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(100), unique=True, nullable=False)
+    
+    def __repr__(self):
+        return f'<Degree {self.name}>'
+
+# Normalized (lowercased, deduplicated) copies of the comma-separated text columns, which stay as the
+# text users typed. The (skill_id, owner) indexes make "who has this skill" an index lookup.
+job_skills = db.Table('job_skills',
+    db.Column('job_id', db.Integer, db.ForeignKey('jobs.id', ondelete='CASCADE'), primary_key=True),
+    db.Column('skill_id', db.Integer, db.ForeignKey('skills.id'), primary_key=True),
+    db.Index('ix_job_skills_skill', 'skill_id', 'job_id')
+)
+
+resume_skills = db.Table('resume_skills',
+    db.Column('resume_id', db.Integer, db.ForeignKey('resumes.id', ondelete='CASCADE'), primary_key=True),
+    db.Column('skill_id', db.Integer, db.ForeignKey('skills.id'), primary_key=True),
+    db.Index('ix_resume_skills_skill', 'skill_id', 'resume_id')
+)
+
+# Degrees have their own dictionary, so they never show up in skill searches.
+resume_degrees = db.Table('resume_degrees',
+    db.Column('resume_id', db.Integer, db.ForeignKey('resumes.id', ondelete='CASCADE'), primary_key=True),
+    db.Column('degree_id', db.Integer, db.ForeignKey('degrees.id'), primary_key=True)
+)
+
+candidate_skills = db.Table('candidate_skills',
+    db.Column('candidate_id', db.Integer, db.ForeignKey('candidates.id', ondelete='CASCADE'), primary_key=True),
+    db.Column('skill_id', db.Integer, db.ForeignKey('skills.id'), primary_key=True),
+    db.Index('ix_candidate_skills_skill', 'skill_id', 'candidate_id')
+)
+
 class User(UserMixin, db.Model):
     __tablename__ = 'users'
     
@@ -28,17 +84,93 @@ class User(UserMixin, db.Model):
                                   backref=db.backref('saved_by_users', lazy='dynamic'))
     
     def set_password(self, password):
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = password_hasher.hash(password)
     
     def check_password(self, password):
-        return check_password_hash(self.password_hash, password)
+        return password_hasher.verify(self.password_hash, password)
+    
+    def password_needs_rehash(self):
+        return password_hasher.needs_rehash(self.password_hash)
     
     def __repr__(self):
         return f'<User {self.email}>'
+    
+    def snapshot_data(self):
+        return {field: getattr(self, field) for field in UserSnapshot.FIELDS}
+
+class UserSnapshot(UserMixin):
+    FIELDS = ('id', 'email', 'full_name', 'phone', 'location', 'bio', 'created_at', 'last_login', 'is_admin')
+    
+    def __init__(self, data):
+        self.__dict__.update(data)
+        self._data = data
+        self._model = None
+    
+    def __getattr__(self, name):
+        # Anything not in the snapshot (relationships, password checks) comes from the real row.
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return getattr(self.get_model(), name)
+    
+    def get_model(self):
+        if self._model is None:
+            self._model = db.session.get(User, self.id)
+        return self._model
+    
+    @property
+    def saved_job_ids(self):
+        return self._cached_ids('saved_job_ids', lambda: db.session.query(saved_jobs.c.job_id)
+                                .filter(saved_jobs.c.user_id == self.id))
+    
+    @property
+    def applied_job_ids(self):
+        return self._cached_ids('applied_job_ids', lambda: db.session.query(JobApplication.job_id)
+                                .filter(JobApplication.user_id == self.id))
+    
+    def mark_job_saved(self, job_id, saved=True):
+        ids = set(self.saved_job_ids)
+        if saved:
+            ids.add(job_id)
+        else:
+            ids.discard(job_id)
+        self._update_cached('saved_job_ids', ids, changed=True)
+    
+    def mark_job_applied(self, job_id):
+        self._update_cached('applied_job_ids', self.applied_job_ids | {job_id}, changed=True)
+    
+    def _cached_ids(self, key, query):
+        ids = self._data.get(key)
+        if ids is None:
+            ids = {row[0] for row in query()}
+            self._update_cached(key, ids)
+        return ids
+    
+    def _update_cached(self, key, ids, changed=False):
+        # Copy on write: the cached dict is shared with other requests in this worker.
+        self._data = dict(self._data, **{key: ids})
+        user_cache.set(self.id, self._data, changed=changed)
+    
+    def __repr__(self):
+        return f'<UserSnapshot {self.email}>'
 
 @login_manager.user_loader
 def load_user(id):
-    return User.query.get(int(id))
+    user_id = int(id)
+    data = user_cache.get(user_id)
+    if data is None:
+        user = db.session.get(User, user_id)
+        if user is None:
+            return None
+        data = user.snapshot_data()
+        user_cache.set(user_id, data)
+    return UserSnapshot(data)
+
+def check_admin(user):
+    # The snapshot's is_admin only drives navigation: after a change in another worker it can be stale for
+    # USER_CACHE_TTL seconds, so authorization reads the row.
+    if not user.is_authenticated:
+        return False
+    return bool(db.session.query(User.is_admin).filter(User.id == user.id).scalar())
 
 class Job(db.Model):
     __tablename__ = 'jobs'
@@ -46,8 +178,10 @@ class Job(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(200), nullable=False, index=True)
     company = db.Column(db.String(150), nullable=False)
-    description = db.Column(db.Text, nullable=False)
-    requirements = db.Column(db.Text)
+    # The long text and the embedding stay out of list queries; detail views undefer the 'body' group.
+    description = db.deferred(db.Column(db.Text, nullable=False), group='body')
+    requirements = db.deferred(db.Column(db.Text), group='body')
+    summary = db.Column(db.String(SUMMARY_LENGTH))
     salary_min = db.Column(db.Integer)
     salary_max = db.Column(db.Integer)
     salary_currency = db.Column(db.String(10), default='USD')
@@ -60,10 +194,29 @@ class Job(db.Model):
     is_featured = db.Column(db.Boolean, default=False)
     is_active = db.Column(db.Boolean, default=True)
     apply_url = db.Column(db.String(500))
+    embedding = db.deferred(db.Column(db.LargeBinary))  # existing databases: migration 5c2d8e9a1f37
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)  # migration 5c2d8e9a1f37
+    external_id = db.Column(db.String(100))  # migration 5c2d8e9a1f37, with ix_jobs_company_external_id
+    
+    normalized_skills = db.relationship('Skill', secondary=job_skills, order_by='Skill.name')
+    
+    __table_args__ = (
+        db.Index('ix_jobs_company_external_id', 'company', 'external_id', unique=True),
+        db.Index('ix_jobs_natural_key', 'company', 'title', 'location'),
+        db.Index('ix_jobs_active_posted', 'is_active', 'posted_date', 'id'),
+    )
     
     def __repr__(self):
         return f'<Job {self.title} at {self.company}>'
     
+    @db.validates('description')
+    def _summarize_description(self, key, value):
+        self.summary = summarize(value)
+        return value
+    
+    def get_skill_names(self):
+        return [skill.name for skill in self.normalized_skills]
+    
     def get_salary_display(self):
         if self.salary_min and self.salary_max:
             return f'{self.salary_currency} {self.salary_min:,} - {self.salary_max:,}'
@@ -73,6 +226,128 @@ class Job(db.Model):
             return f'Up to {self.salary_currency} {self.salary_max:,}'
         return 'Competitive'
 
+class JobNeighbors(db.Model):
+    __tablename__ = 'job_neighbors'
+    
+    job_id = db.Column(db.Integer, db.ForeignKey('jobs.id'), primary_key=True)
+    neighbors = db.Column(db.Text, nullable=False, default='')
+    # Terms counted into job_terms for this job, so a refresh can take them back out.
+    terms = db.Column(db.Text)  # existing databases: migration 5c2d8e9a1f37
+    computed_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    job = db.relationship('Job', backref=db.backref('neighbors_row', uselist=False, cascade='all, delete-orphan'))
+    
+    def __repr__(self):
+        return f'<JobNeighbors for Job {self.job_id}>'
+    
+    def get_neighbors(self):
+        result = []
+        for item in self.neighbors.split(','):
+            if item:
+                job_id, score = item.split(':')
+                result.append((int(job_id), float(score)))
+        return result
+    
+    def get_neighbor_ids(self):
+        return [job_id for job_id, _ in self.get_neighbors()]
+    
+    def get_terms(self):
+        return [term for term in (self.terms or '').split('\n') if term]
+    
+    @staticmethod
+    def encode(neighbors):
+        return ','.join(f'{job_id}:{score:.4f}' for job_id, score in neighbors)
+
+class JobTerm(db.Model):
+    __tablename__ = 'job_terms'
+    
+    term = db.Column(db.String(200), primary_key=True)
+    doc_count = db.Column(db.Integer, nullable=False, default=0)
+
+class JobLshBucket(db.Model):
+    __tablename__ = 'job_lsh_buckets'
+    
+    band_key = db.Column(db.BigInteger, primary_key=True)
+    job_id = db.Column(db.Integer, primary_key=True, index=True)
+
+class RecommendedJob(db.Model):
+    __tablename__ = 'recommended_jobs'
+    
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), primary_key=True)
+    job_id = db.Column(db.Integer, db.ForeignKey('jobs.id'), primary_key=True)
+    resume_id = db.Column(db.Integer, db.ForeignKey('resumes.id'), nullable=False)
+    overall_score = db.Column(db.Float, nullable=False)
+    skill_match = db.Column(db.Float)
+    title_match = db.Column(db.Float)
+    experience_match = db.Column(db.Float)
+    computed_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    job = db.relationship('Job', backref=db.backref('recommendations', lazy='dynamic', cascade='all, delete-orphan'))
+    resume = db.relationship('Resume', backref=db.backref('recommendations', lazy='dynamic', cascade='all, delete-orphan'))
+    
+    __table_args__ = (
+        db.Index('ix_recommended_jobs_user_score', 'user_id', 'overall_score'),
+    )
+    
+    def __repr__(self):
+        return f'<RecommendedJob {self.job_id} for User {self.user_id}>'
+    
+    def get_match_data(self):
+        return {
+            'job_id': self.job_id,
+            'overall_score': self.overall_score,
+            'skill_match': self.skill_match,
+            'title_match': self.title_match,
+            'experience_match': self.experience_match
+        }
+
+class RecommendationRun(db.Model):
+    __tablename__ = 'recommendation_runs'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    started_at = db.Column(db.DateTime, nullable=False)
+    finished_at = db.Column(db.DateTime)
+    full = db.Column(db.Boolean, default=False)
+    jobs_scored = db.Column(db.Integer, default=0)
+    users_scored = db.Column(db.Integer, default=0)
+    
+    def __repr__(self):
+        return f'<RecommendationRun {self.started_at}>'
+
+class BulkAction(db.Model):
+    __tablename__ = 'bulk_actions'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    target = db.Column(db.String(50), nullable=False)
+    status = db.Column(db.String(50), nullable=False)
+    filters = db.Column(db.Text)
+    state = db.Column(db.String(20), default='pending')
+    total = db.Column(db.Integer, default=0)
+    processed = db.Column(db.Integer, default=0)
+    error = db.Column(db.Text)
+    created_by = db.Column(db.Integer, db.ForeignKey('users.id'))
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    # Touched by every committed window, so a stalled action can be told apart from a slow one.
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)  # migration 5c2d8e9a1f37
+    finished_at = db.Column(db.DateTime)
+    
+    def __repr__(self):
+        return f'<BulkAction {self.target} -> {self.status}>'
+    
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'target': self.target,
+            'status': self.status,
+            'state': self.state,
+            'total': self.total or 0,
+            'processed': self.processed or 0,
+            'error': self.error,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None,
+        }
+
 class AggregatedJob(db.Model):
     __tablename__ = 'aggregated_jobs'
     
@@ -81,7 +356,8 @@ class AggregatedJob(db.Model):
     external_id = db.Column(db.String(100))
     title = db.Column(db.String(200), nullable=False, index=True)
     company = db.Column(db.String(150), nullable=False)
-    description = db.Column(db.Text)
+    description = db.deferred(db.Column(db.Text))
+    summary = db.Column(db.String(SUMMARY_LENGTH))
     location = db.Column(db.String(150), index=True)
     salary_info = db.Column(db.String(100))
     job_type = db.Column(db.String(50))
@@ -91,10 +367,16 @@ class AggregatedJob(db.Model):
     
     __table_args__ = (
         db.UniqueConstraint('source_platform', 'external_id', name='unique_external_job'),
+        db.Index('ix_aggregated_jobs_active_scraped', 'is_active', 'scraped_at', 'id'),
     )
     
     def __repr__(self):
         return f'<AggregatedJob {self.title} from {self.source_platform}>'
+    
+    @db.validates('description')
+    def _summarize_description(self, key, value):
+        self.summary = summarize(value)
+        return value
 
 class Resume(db.Model):
     __tablename__ = 'resumes'
@@ -104,19 +386,92 @@ class Resume(db.Model):
     filename = db.Column(db.String(255), nullable=False)
     file_path = db.Column(db.String(500), nullable=False)
     upload_date = db.Column(db.DateTime, default=datetime.utcnow)
-    parsed_text = db.Column(db.Text)
     extracted_skills = db.Column(db.Text)
     experience_years = db.Column(db.Integer)
     education = db.Column(db.Text)
     is_primary = db.Column(db.Boolean, default=False)
+    embedding = db.deferred(db.Column(db.LargeBinary))  # existing databases: migration 5c2d8e9a1f37
+    content_hash = db.Column(db.String(64), index=True)  # content_hash and file_size: migration 5c2d8e9a1f37
+    file_size = db.Column(db.Integer)
+    # Bumped by any change to the row (skills enhanced, primary switched), so the batch scorer rescores it.
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)  # migration 5c2d8e9a1f37
+    
+    normalized_skills = db.relationship('Skill', secondary=resume_skills, order_by='Skill.name')
+    normalized_education = db.relationship('Degree', secondary=resume_degrees, order_by='Degree.name')
+    text = db.relationship('ResumeText', uselist=False, cascade='all, delete-orphan')
     
     def __repr__(self):
         return f'<Resume {self.filename}>'
     
+    @property
+    def parsed_text(self):
+        if self.text is None:
+            return None
+        return unpack(self.text.content, self.text.codec)
+    
+    @parsed_text.setter
+    def parsed_text(self, value):
+        if not value:
+            self.text = None
+            return
+        codec, content, vocabulary = pack(value)
+        if self.text is None:
+            self.text = ResumeText()
+        self.text.codec, self.text.content, self.text.vocabulary = codec, content, vocabulary
+    
+    @property
+    def vocabulary(self):
+        if self.text is None:
+            return ''
+        return unpack(self.text.vocabulary, self.text.codec)
+    
     def get_skills_list(self):
         if self.extracted_skills:
             return [s.strip() for s in self.extracted_skills.split(',')]
         return []
+    
+    def get_skill_names(self):
+        return [skill.name for skill in self.normalized_skills]
+
+class ResumeText(db.Model):
+    __tablename__ = 'resume_texts'
+    
+    # Kept out of resumes so its rows stay narrow. The matchers only read the vocabulary;
+    # the full text is for previews, embeddings and AI prompts (see talentbridge/textstore.py).
+    resume_id = db.Column(db.Integer, db.ForeignKey('resumes.id', ondelete='CASCADE'), primary_key=True)
+    codec = db.Column(db.String(10), nullable=False)
+    content = db.deferred(db.Column(db.LargeBinary, nullable=False))
+    vocabulary = db.Column(db.LargeBinary, nullable=False)
+
+class UploadSession(db.Model):
+    __tablename__ = 'upload_sessions'
+    
+    id = db.Column(db.String(32), primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False, index=True)
+    filename = db.Column(db.String(255), nullable=False)
+    file_path = db.Column(db.String(500), nullable=False)
+    size = db.Column(db.Integer, nullable=False)
+    received = db.Column(db.Integer, default=0)
+    checksum = db.Column(db.String(64))
+    set_primary = db.Column(db.Boolean, default=False)
+    rate_tat = db.Column(db.Float, default=0.0)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
+    
+    def __repr__(self):
+        return f'<UploadSession {self.id} {self.received}/{self.size}>'
+    
+    @property
+    def partial_path(self):
+        return f'{self.file_path}.part'
+    
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'filename': self.filename,
+            'size': self.size,
+            'offset': self.received or 0,
+        }
 
 class Candidate(db.Model):
     __tablename__ = 'candidates'
@@ -134,8 +489,13 @@ class Candidate(db.Model):
     status = db.Column(db.String(50), default='new')
     submitted_at = db.Column(db.DateTime, default=datetime.utcnow)
     
+    normalized_skills = db.relationship('Skill', secondary=candidate_skills, order_by='Skill.name')
+    
     def __repr__(self):
         return f'<Candidate {self.name}>'
+    
+    def get_skill_names(self):
+        return [skill.name for skill in self.normalized_skills]
 
 class Employer(db.Model):
     __tablename__ = 'employers'
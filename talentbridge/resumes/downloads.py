@@ -0,0 +1,103 @@
+import os
+import gzip
+import hashlib
+from typing import Optional, Tuple
+from flask import current_app, request, abort
+from werkzeug.utils import send_file
+from talentbridge.extensions import db
+from talentbridge.models import Resume
+
+READ_SIZE = 1024 * 1024
+OFFLOAD_MODES = ('x-accel-redirect', 'x-sendfile')
+
+def file_digest(path: str) -> Tuple[str, int]:
+    hasher = hashlib.sha256()
+    size = 0
+    with open(path, 'rb') as f:
+        while True:
+            piece = f.read(READ_SIZE)
+            if not piece:
+                break
+            hasher.update(piece)
+            size += len(piece)
+    return hasher.hexdigest(), size
+
+def ensure_content_hash(resume: Resume) -> str:
+    # Resumes uploaded before hashes were stored get one on first download.
+    if not resume.content_hash:
+        resume.content_hash, resume.file_size = file_digest(resume.file_path)
+        db.session.commit()
+    return resume.content_hash
+
+def preview_path(content_hash: str) -> str:
+    return os.path.join(current_app.config['RESUME_PREVIEW_DIR'], content_hash[:2], f'{content_hash}.txt.gz')
+
+def write_preview(resume: Resume) -> Optional[str]:
+    if resume.text is None or not resume.content_hash:
+        return None
+    path = preview_path(resume.content_hash)
+    if os.path.exists(path):
+        return path
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f'{path}.{os.getpid()}.tmp'
+    # mtime=0 keeps the compressed bytes identical for identical text.
+    with open(tmp, 'wb') as raw, gzip.GzipFile(fileobj=raw, mode='wb', compresslevel=9, mtime=0) as f:
+        f.write(resume.parsed_text.encode('utf-8'))
+    os.replace(tmp, path)
+    return path
+
+def remove_preview(resume: Resume):
+    if not resume.content_hash:
+        return
+    shared = Resume.query.filter(Resume.content_hash == resume.content_hash, Resume.id != resume.id).count()
+    if not shared:
+        try:
+            os.remove(preview_path(resume.content_hash))
+        except FileNotFoundError:
+            pass
+
+def send_resume(resume: Resume):
+    if not os.path.isfile(resume.file_path):
+        abort(404)
+    etag = ensure_content_hash(resume)
+    mode = current_app.config['RESUME_DOWNLOAD_MODE']
+
+    if mode in OFFLOAD_MODES:
+        # The front-end server reads the file and answers Range requests itself; only
+        # If-None-Match/If-Modified-Since are settled here so a 304 never reaches it.
+        response = send_file(resume.file_path, request.environ, as_attachment=True, download_name=resume.filename,
+                             use_x_sendfile=True, etag=etag, conditional=False)
+        response = response.make_conditional(request.environ)
+        path = response.headers.pop('X-Sendfile')
+        if response.status_code != 304:
+            if mode == 'x-accel-redirect':
+                directory = os.path.join(current_app.config['UPLOAD_FOLDER'], 'resumes')
+                response.headers['X-Accel-Redirect'] = (current_app.config['RESUME_ACCEL_PREFIX'] +
+                                                        os.path.relpath(resume.file_path, directory))
+            else:
+                response.headers['X-Sendfile'] = path
+    else:
+        # Whole-file responses go out through wsgi.file_wrapper, which gunicorn sends with os.sendfile.
+        response = send_file(resume.file_path, request.environ, as_attachment=True, download_name=resume.filename,
+                             etag=etag, conditional=True)
+    response.cache_control.private = True
+    return response
+
+def send_preview(resume: Resume):
+    if resume.text is None:
+        abort(404)
+    etag = f'{ensure_content_hash(resume)}-txt'
+    # With RESUME_PREVIEWS off nothing is written to disk; the text is sent uncompressed.
+    path = write_preview(resume) if current_app.config['RESUME_PREVIEWS'] else None
+
+    if path and 'gzip' in request.accept_encodings:
+        response = send_file(path, request.environ, mimetype='text/plain', etag=etag, conditional=False)
+        response.headers['Content-Encoding'] = 'gzip'
+    else:
+        response = current_app.response_class(resume.parsed_text, mimetype='text/plain')
+        response.set_etag(etag)
+    response = response.make_conditional(request.environ)
+    response.vary.add('Accept-Encoding')
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response
@@ -0,0 +1,325 @@
+import os
+import re
+import json
+import zlib
+import threading
+import logging
+from contextlib import contextmanager
+from typing import Iterable, List, Tuple
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+TOKEN_RE = re.compile(r'[a-z0-9][a-z0-9+#.]*')
+STOPWORDS = {'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'in', 'is', 'of', 'on', 'or',
+             'our', 'the', 'to', 'we', 'will', 'with', 'you', 'your'}
+
+class HashingEmbedder:
+
+    def __init__(self, dim: int = 256):
+        self.dim = dim
+
+    def features(self, text: str, weight: float = 1.0) -> Iterable[Tuple[str, float]]:
+        words = [w.strip('.') for w in TOKEN_RE.findall(text.lower())]
+        words = [w for w in words if w and w not in STOPWORDS]
+        for word in words:
+            yield f'w:{word}', weight
+            if len(word) > 4:
+                # Character trigrams let "developer"/"development" land close together.
+                for i in range(len(word) - 2):
+                    yield f'c:{word[i:i + 3]}', weight * 0.25
+        for first, second in zip(words, words[1:]):
+            yield f'b:{first}_{second}', weight * 0.5
+
+    def embed_text(self, weighted_texts: Iterable[Tuple[str, float]]) -> np.ndarray:
+        vector = np.zeros(self.dim, dtype=np.float32)
+        for text, weight in weighted_texts:
+            if not text:
+                continue
+            for feature, value in self.features(text, weight):
+                h = zlib.crc32(feature.encode())
+                vector[h % self.dim] += value if (h >> 16) & 1 else -value
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def embed_job(self, job) -> np.ndarray:
+        return self.embed_text([
+            (job.title, 3.0),
+            ((job.skills_required or '').replace(',', ' '), 2.0),
+            (job.industry, 1.0),
+            (job.experience_level, 0.5),
+            ((job.requirements or '')[:1000], 1.0),
+            ((job.description or '')[:1000], 0.5),
+        ])
+
+    def embed_resume(self, text: str, skills: List[str] = None) -> np.ndarray:
+        return self.embed_text([
+            (' '.join(skills or []), 2.0),
+            ((text or '')[:4000], 1.0),
+        ])
+
+    def to_bytes(self, vector: np.ndarray) -> bytes:
+        return vector.astype(np.float16).tobytes()
+
+    def from_bytes(self, data: bytes) -> np.ndarray:
+        return np.frombuffer(data, dtype=np.float16).astype(np.float32)
+
+class IVFIndex:
+
+    def __init__(self, path: str, dim: int = 256):
+        self.path = path
+        self.dim = dim
+        self.record_dtype = np.dtype([('id', '<i8'), ('vector', '<f4', (dim,))])
+        self._lock = threading.Lock()
+        self._version = None
+        self._delta_size = -1
+        self._delta = None
+        self.vectors = None
+        self.ids = None
+        self.centroids = None
+        self.offsets = None
+
+    def _file(self, name: str) -> str:
+        return os.path.join(self.path, name)
+
+    @contextmanager
+    def _write_lock(self):
+        # Serializes delta appends with the swap in build() across worker processes.
+        with open(self._file('lock'), 'a') as f:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            yield
+
+    def delta_mark(self):
+        meta = self._read_meta()
+        if meta is None:
+            return None
+        try:
+            return meta['version'], os.path.getsize(self._file(f"delta.{meta['version']}.bin"))
+        except OSError:
+            return meta['version'], 0
+
+    def build(self, ids: np.ndarray, vectors: np.ndarray, nlist: int = None, iterations: int = 8, seed: int = 0,
+              replay_from=None):
+        os.makedirs(self.path, exist_ok=True)
+        count = len(ids)
+        nlist = max(1, min(count, nlist or int(np.sqrt(count))))
+        rng = np.random.default_rng(seed)
+        centroids = vectors[rng.choice(count, nlist, replace=False)].copy() if count else np.zeros((1, self.dim), np.float32)
+
+        assignments = np.zeros(count, dtype=np.int64)
+        for _ in range(iterations if count else 0):
+            for start in range(0, count, 65536):
+                assignments[start:start + 65536] = np.argmax(vectors[start:start + 65536] @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignments, vectors)
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            empty = norms[:, 0] == 0
+            centroids = np.where(empty[:, None], centroids, sums / np.where(norms == 0, 1, norms))
+
+        order = np.argsort(assignments, kind='stable')
+        offsets = np.searchsorted(assignments[order], np.arange(len(centroids) + 1))
+
+        # Write to temporary names and swap in, so workers never map a half-written index.
+        version = str(int.from_bytes(os.urandom(4), 'little'))
+        vectors[order].astype(np.float32).tofile(self._file(f'vectors.{version}.f32'))
+        ids[order].astype(np.int64).tofile(self._file(f'ids.{version}.i64'))
+        centroids.astype(np.float32).tofile(self._file(f'centroids.{version}.f32'))
+        offsets.astype(np.int64).tofile(self._file(f'offsets.{version}.i64'))
+        open(self._file(f'delta.{version}.bin'), 'wb').close()
+
+        with self._write_lock():
+            previous = self._read_meta()
+            meta_tmp = self._file('meta.json.tmp')
+            with open(meta_tmp, 'w') as f:
+                json.dump({'version': version, 'dim': self.dim, 'count': int(count), 'nlist': int(len(centroids))}, f)
+            os.replace(meta_tmp, self._file('meta.json'))
+            # Records appended after replay_from was taken (edits and removals made while the rows were being
+            # read and clustered) are carried over, so the new index does not lose them.
+            if previous and replay_from and replay_from[0] == previous['version']:
+                with open(self._file(f"delta.{previous['version']}.bin"), 'rb') as f:
+                    f.seek(replay_from[1] - replay_from[1] % self.record_dtype.itemsize)
+                    tail = f.read()
+                tail = tail[:len(tail) - len(tail) % self.record_dtype.itemsize]
+                with open(self._file(f'delta.{version}.bin'), 'ab') as f:
+                    f.write(tail)
+
+        if previous:
+            for name in ('vectors.{}.f32', 'ids.{}.i64', 'centroids.{}.f32', 'offsets.{}.i64', 'delta.{}.bin'):
+                try:
+                    os.remove(self._file(name.format(previous['version'])))
+                except OSError:
+                    pass
+        logger.info(f"Built IVF index with {count} vectors in {len(centroids)} lists at {self.path}")
+
+    def _read_meta(self):
+        try:
+            with open(self._file('meta.json')) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def load(self) -> bool:
+        meta = self._read_meta()
+        if meta is None:
+            return False
+        with self._lock:
+            if meta['version'] != self._version:
+                version = meta['version']
+                count = meta['count']
+                self.vectors = np.memmap(self._file(f'vectors.{version}.f32'), dtype=np.float32, mode='r',
+                                         shape=(count, self.dim)) if count else np.zeros((0, self.dim), np.float32)
+                self.ids = np.fromfile(self._file(f'ids.{version}.i64'), dtype=np.int64)
+                self.centroids = np.fromfile(self._file(f'centroids.{version}.f32'), dtype=np.float32).reshape(-1, self.dim)
+                self.offsets = np.fromfile(self._file(f'offsets.{version}.i64'), dtype=np.int64)
+                self._version = version
+                self._delta_size = -1
+            self._load_delta()
+        return True
+
+    def _load_delta(self):
+        path = self._file(f'delta.{self._version}.bin')
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            size = 0
+        if size != self._delta_size:
+            usable = size - size % self.record_dtype.itemsize
+            self._delta = np.fromfile(path, dtype=self.record_dtype, count=usable // self.record_dtype.itemsize) \
+                if usable else np.zeros(0, dtype=self.record_dtype)
+            self._delta_size = size
+
+    def add(self, ids: List[int], vectors: List[np.ndarray]):
+        # New and edited vectors go to an append-only delta segment until the next rebuild.
+        records = np.zeros(len(ids), dtype=self.record_dtype)
+        records['id'] = ids
+        records['vector'] = np.asarray(vectors, dtype=np.float32).reshape(len(ids), self.dim)
+        self._append(records)
+
+    def remove(self, ids: List[int]):
+        # A zero vector is a tombstone: it hides the job from the base segment and earlier delta records.
+        records = np.zeros(len(ids), dtype=self.record_dtype)
+        records['id'] = ids
+        self._append(records)
+
+    def _append(self, records: np.ndarray):
+        if not len(records) or self._read_meta() is None:
+            return
+        with self._write_lock():
+            meta = self._read_meta()
+            fd = os.open(self._file(f"delta.{meta['version']}.bin"), os.O_WRONLY | os.O_APPEND | os.O_CREAT)
+            try:
+                os.write(fd, records.tobytes())
+            finally:
+                os.close(fd)
+
+    def search(self, query: np.ndarray, k: int = 100, nprobe: int = 8) -> List[Tuple[int, float]]:
+        if not self.load():
+            return []
+        query = query.astype(np.float32)
+
+        delta = self._delta
+        latest = {}
+        if len(delta):
+            delta_scores = delta['vector'] @ query
+            live = np.any(delta['vector'] != 0, axis=1)
+            # Later records win, so a job removed and then re-added is live again.
+            for job_id, score, is_live in zip(delta['id'].tolist(), delta_scores.tolist(), live.tolist()):
+                latest[job_id] = score if is_live else None
+        results = {job_id: score for job_id, score in latest.items() if score is not None}
+
+        if len(self.ids):
+            probe = np.argsort(-(self.centroids @ query))[:nprobe]
+            slices = [(int(self.offsets[c]), int(self.offsets[c + 1])) for c in probe]
+            candidate_ids = np.concatenate([self.ids[s:e] for s, e in slices])
+            candidate_scores = np.concatenate([np.asarray(self.vectors[s:e]) @ query for s, e in slices])
+            if latest:
+                # Delta entries are newer than the base segment, so edited and removed jobs are dropped from it
+                # before the top k is taken rather than using up slots.
+                keep = ~np.isin(candidate_ids, np.fromiter(latest, dtype=np.int64, count=len(latest)))
+                candidate_ids, candidate_scores = candidate_ids[keep], candidate_scores[keep]
+            if len(candidate_ids) > k:
+                top = np.argpartition(-candidate_scores, k)[:k]
+                candidate_ids, candidate_scores = candidate_ids[top], candidate_scores[top]
+            results.update(zip(candidate_ids.tolist(), candidate_scores.tolist()))
+
+        return sorted(results.items(), key=lambda x: x[1], reverse=True)[:k]
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+def get_job_index(app=None) -> IVFIndex:
+    from flask import current_app
+    app = app or current_app
+    path = os.path.join(app.config['EMBEDDING_INDEX_DIR'], 'jobs')
+    with _indexes_lock:
+        if path not in _indexes:
+            _indexes[path] = IVFIndex(path, dim=app.config['EMBEDDING_DIM'])
+        return _indexes[path]
+
+def get_embedder(app=None) -> HashingEmbedder:
+    from flask import current_app
+    app = app or current_app
+    return HashingEmbedder(dim=app.config['EMBEDDING_DIM'])
+
+def embed_job(job):
+    embedder = get_embedder()
+    job.embedding = embedder.to_bytes(embedder.embed_job(job))
+
+def index_jobs(jobs):
+    try:
+        embedder = get_embedder()
+        index = get_job_index()
+        inactive = [job.id for job in jobs if job.is_active is False]
+        jobs = [job for job in jobs if job.is_active is not False and job.embedding]
+        if jobs:
+            index.add([job.id for job in jobs], [embedder.from_bytes(job.embedding) for job in jobs])
+        index.remove(inactive)
+    except Exception as e:
+        logger.error(f"Error adding jobs to the embedding index: {str(e)}")
+
+def unindex_jobs(job_ids):
+    try:
+        get_job_index().remove(job_ids)
+    except Exception as e:
+        logger.error(f"Error removing jobs from the embedding index: {str(e)}")
+
+def rebuild_job_index(batch_size: int = 2000) -> int:
+    from talentbridge.extensions import db
+    from talentbridge.models import Job
+
+    embedder = get_embedder()
+    index = get_job_index()
+    # Taken before the rows are read, so changes indexed while the build runs are replayed onto the new index.
+    mark = index.delta_mark()
+    ids = []
+    vectors = []
+    updates = []
+    stored = db.session.query(Job.id, Job.embedding).filter(Job.is_active == True, Job.embedding.isnot(None))
+    for row in stored.yield_per(batch_size):
+        ids.append(row.id)
+        vectors.append(embedder.from_bytes(row.embedding))
+
+    # Only jobs without a stored embedding need their deferred body columns, so they are selected explicitly.
+    columns = (Job.id, Job.title, Job.skills_required, Job.industry, Job.experience_level, Job.requirements,
+               Job.description)
+    missing = db.session.query(*columns).filter(Job.is_active == True, Job.embedding.is_(None))
+    for row in missing.yield_per(batch_size):
+        vector = embedder.embed_job(row)
+        updates.append({'id': row.id, 'embedding': embedder.to_bytes(vector)})
+        ids.append(row.id)
+        vectors.append(vector)
+
+    for start in range(0, len(updates), batch_size):
+        db.session.bulk_update_mappings(Job, updates[start:start + batch_size])
+    db.session.commit()
+
+    index.build(np.asarray(ids, dtype=np.int64), np.asarray(vectors, dtype=np.float32).reshape(len(ids), embedder.dim),
+                replay_from=mark)
+    return len(ids)
@@ -0,0 +1,256 @@
+import os
+import json
+import time
+import random
+import hashlib
+import logging
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+import openai
+from openai import OpenAI
+from talentbridge.resumes.matcher import JobMatcher
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+PROMPT_VERSION = 1
+TRANSIENT_ERRORS = (openai.RateLimitError, openai.APITimeoutError, openai.APIConnectionError,
+                    openai.InternalServerError)
+
+class RateLimiter:
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int, window: float = 60.0):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.window = window
+        self._events = deque()
+        self._condition = threading.Condition()
+
+    def acquire(self, tokens: int) -> list:
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                while self._events and self._events[0][0] <= now - self.window:
+                    self._events.popleft()
+                used = sum(event[1] for event in self._events)
+                # An oversized request still goes through once the window is empty.
+                if len(self._events) < self.requests_per_minute and \
+                        (used + tokens <= self.tokens_per_minute or not self._events):
+                    event = [now, tokens]
+                    self._events.append(event)
+                    return event
+                self._condition.wait(max(self._events[0][0] + self.window - now, 0.01))
+
+    def settle(self, event: list, tokens: int):
+        # Replace the up-front estimate with what the API actually billed.
+        with self._condition:
+            event[1] = tokens
+            self._condition.notify_all()
+
+class ResponseCache:
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def _file(self, key: str) -> str:
+        return os.path.join(self.path, key[:2], f'{key}.json')
+
+    def get(self, key: str) -> Optional[Dict]:
+        try:
+            with open(self._file(key)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def set(self, key: str, value: Dict):
+        path = self._file(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(tmp, 'w') as f:
+            json.dump(value, f)
+        os.replace(tmp, path)
+
+class SkillEnhancer:
+
+    def __init__(self, client: OpenAI = None, model: str = 'gpt-4o', concurrency: int = 8,
+                 requests_per_minute: int = 500, tokens_per_minute: int = 30000, max_retries: int = 5,
+                 max_tokens: int = 500, cache_dir: str = None, input_cost: float = 0.0, output_cost: float = 0.0):
+        self.matcher = JobMatcher()
+        client = client or self.matcher.client
+        # Retries are handled here so they are counted and share the rate budget.
+        self.client = client.with_options(max_retries=0) if client else None
+        self.model = model
+        self.concurrency = concurrency
+        self.limiter = RateLimiter(requests_per_minute, tokens_per_minute)
+        self.max_retries = max_retries
+        self.max_tokens = max_tokens
+        self.cache = ResponseCache(cache_dir) if cache_dir else None
+        self.input_cost = input_cost
+        self.output_cost = output_cost
+        self._executor = None
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix='skill-enhancer')
+        return self._executor
+
+    def cache_key(self, text: str) -> str:
+        payload = f'{PROMPT_VERSION}:{self.model}:{self.max_tokens}:{text[:4000]}'
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def enhance_batch(self, texts: Dict[int, str]) -> Dict:
+        started = time.perf_counter()
+        stats = {'items': len(texts), 'unique': 0, 'cached': 0, 'requests': 0, 'retries': 0, 'failed': 0,
+                 'prompt_tokens': 0, 'completion_tokens': 0, 'latencies': []}
+
+        keys = {}
+        for item_id, text in texts.items():
+            if text and text.strip():
+                keys.setdefault(self.cache_key(text), (text, []))[1].append(item_id)
+        stats['unique'] = len(keys)
+
+        responses = {}
+        pending = []
+        for key, (text, _) in keys.items():
+            cached = self.cache.get(key) if self.cache else None
+            if cached is not None:
+                responses[key] = cached
+                stats['cached'] += 1
+            else:
+                pending.append((key, text))
+
+        if pending and not self.client:
+            logger.warning("OpenAI client not initialized. Skipping AI enhancement.")
+            pending = []
+
+        futures = {key: self.executor.submit(self._request, text) for key, text in pending}
+        for key, future in futures.items():
+            result = future.result()
+            stats['requests'] += result['attempts']
+            stats['retries'] += result['attempts'] - 1
+            if result['response'] is None:
+                stats['failed'] += 1
+                continue
+            response = result['response']
+            stats['prompt_tokens'] += response['prompt_tokens']
+            stats['completion_tokens'] += response['completion_tokens']
+            stats['latencies'].append(result['latency'])
+            responses[key] = response
+            if self.cache:
+                self.cache.set(key, response)
+
+        skills = {}
+        for key, (_, item_ids) in keys.items():
+            if key in responses:
+                for item_id in item_ids:
+                    skills[item_id] = self.matcher.parse_skills(responses[key]['content'])
+
+        stats['cost'] = (stats['prompt_tokens'] * self.input_cost +
+                         stats['completion_tokens'] * self.output_cost) / 1000000
+        stats['elapsed'] = time.perf_counter() - started
+        return {'skills': skills, 'stats': stats}
+
+    def _request(self, text: str) -> Dict:
+        messages = self.matcher.skill_messages(text)
+        estimate = sum(len(m['content']) for m in messages) // 4 + self.max_tokens
+        attempts = 0
+        while True:
+            attempts += 1
+            event = self.limiter.acquire(estimate)
+            request_started = time.perf_counter()
+            try:
+                response = self.client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    max_tokens=self.max_tokens,
+                    temperature=0.3
+                )
+            except TRANSIENT_ERRORS as e:
+                self.limiter.settle(event, estimate)
+                if attempts > self.max_retries:
+                    logger.error(f"Error enhancing skills with AI after {attempts} attempts: {str(e)}")
+                    return {'response': None, 'attempts': attempts, 'latency': None}
+                time.sleep(self._backoff(attempts, e))
+                continue
+            except Exception as e:
+                self.limiter.settle(event, 0)
+                logger.error(f"Error enhancing skills with AI: {str(e)}")
+                return {'response': None, 'attempts': attempts, 'latency': None}
+
+            usage = response.usage
+            prompt_tokens = usage.prompt_tokens if usage else estimate - self.max_tokens
+            completion_tokens = usage.completion_tokens if usage else 0
+            self.limiter.settle(event, prompt_tokens + completion_tokens)
+            return {
+                'response': {
+                    'content': response.choices[0].message.content,
+                    'prompt_tokens': prompt_tokens,
+                    'completion_tokens': completion_tokens,
+                },
+                'attempts': attempts,
+                'latency': time.perf_counter() - request_started,
+            }
+
+    def _backoff(self, attempt: int, error: Exception) -> float:
+        response = getattr(error, 'response', None)
+        retry_after = response.headers.get('retry-after') if response is not None else None
+        if retry_after:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass
+        return min(2 ** (attempt - 1), 30) * (0.5 + random.random() / 2)
+
+def format_stats(stats: Dict) -> str:
+    latencies = sorted(stats['latencies'])
+    p50 = latencies[len(latencies) // 2] if latencies else 0.0
+    p95 = latencies[min(int(len(latencies) * 0.95), len(latencies) - 1)] if latencies else 0.0
+    return (f"{stats['items']} resumes, {stats['unique']} unique, {stats['cached']} cached, "
+            f"{stats['requests']} requests ({stats['retries']} retries, {stats['failed']} failed), "
+            f"{stats['prompt_tokens']} prompt + {stats['completion_tokens']} completion tokens, "
+            f"${stats['cost']:.4f}, latency p50 {p50:.2f}s p95 {p95:.2f}s, {stats['elapsed']:.1f}s")
+
+def enhance_resumes(enhancer: SkillEnhancer, batch_size: int = 100, limit: int = None, on_batch=None) -> Dict:
+    from talentbridge.extensions import db
+    from talentbridge.models import Resume, ResumeText
+    from talentbridge.resumes.embeddings import get_embedder
+    from talentbridge.resumes.talent import TalentMatcher
+
+    embedder = get_embedder()
+    talent = TalentMatcher()
+    totals = {'items': 0, 'updated': 0, 'unique': 0, 'cached': 0, 'requests': 0, 'retries': 0, 'failed': 0,
+              'prompt_tokens': 0, 'completion_tokens': 0, 'cost': 0.0, 'latencies': [], 'elapsed': 0.0}
+    last_id = 0
+    while limit is None or totals['items'] < limit:
+        size = batch_size if limit is None else min(batch_size, limit - totals['items'])
+        resumes = Resume.query.filter(Resume.id > last_id).options(db.joinedload(Resume.text).undefer(ResumeText.content)) \
+            .order_by(Resume.id).limit(size).all()
+        if not resumes:
+            break
+        last_id = resumes[-1].id
+
+        result = enhancer.enhance_batch({resume.id: resume.parsed_text for resume in resumes})
+        updated = 0
+        for resume in resumes:
+            current = resume.get_skills_list()
+            known = {skill.lower() for skill in current}
+            added = [skill for skill in result['skills'].get(resume.id, []) if skill not in known]
+            if added:
+                skills = [skill for skill in current if skill] + added
+                resume.extracted_skills = ','.join(skills)
+                resume.embedding = embedder.to_bytes(embedder.embed_resume(resume.parsed_text, skills))
+                talent.index_resume(resume)
+                updated += 1
+        db.session.commit()
+
+        stats = result['stats']
+        stats['updated'] = updated
+        for key, value in stats.items():
+            totals[key] += value
+        if on_batch:
+            on_batch(stats)
+        db.session.expunge_all()
+    return totals
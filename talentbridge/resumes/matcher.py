@@ -1,73 +1,146 @@
 import os
+import re
 import logging
 from typing import List, Dict, Tuple
-from openai import OpenAI
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+_client = None
+
+def get_openai_client():
+    # One client per process so requests reuse its connection pool instead of opening a new one each time.
+    global _client
+    api_key = os.environ.get('OPENAI_API_KEY')
+    if not api_key:
+        return None
+    if _client is None or _client.api_key != api_key:
+        # The SDK takes ~0.5s to import, so workers only pay for it once a request needs OpenAI.
+        from openai import OpenAI
+        _client = OpenAI(api_key=api_key, timeout=float(os.environ.get('OPENAI_TIMEOUT', 30)))
+    return _client
+
 class JobMatcher:
     
     def __init__(self):
-        api_key = os.environ.get('OPENAI_API_KEY')
-        self.client = OpenAI(api_key=api_key) if api_key else None
+        self.client = get_openai_client()
     
-    def calculate_skill_match(self, resume_skills: List[str], job_skills: str) -> float:
+    def calculate_skill_match(self, resume_skills: List[str], job_skills: List[str]) -> float:
+        resume_skills = self._skills(resume_skills)
+        job_skills = self._skills(job_skills)
         if not resume_skills or not job_skills:
             return 0.0
         
-        job_skills_list = [s.strip().lower() for s in job_skills.split(',')]
-        resume_skills_lower = [s.lower() for s in resume_skills]
-        
-        if not job_skills_list:
+        return self._skill_score(resume_skills, job_skills)
+    
+    def calculate_title_match(self, resume_text: str, job_title: str) -> float:
+        if not resume_text or not job_title:
             return 0.0
         
-        matches = sum(1 for skill in job_skills_list if any(
-            skill in rs or rs in skill for rs in resume_skills_lower
-        ))
+        return self._title_score(resume_text.lower(), job_title.lower().split())
+    
+    def calculate_experience_match(self, resume_years: int, job_requirements: str) -> float:
+        return self._experience_score(resume_years, self._required_years(job_requirements))
+    
+    def calculate_match_score(self, resume_skills: List[str], resume_text: str, 
+                              resume_years: int, job, job_skills: List[str] = None) -> Dict:
+        if job_skills is None:
+            job_skills = job.get_skill_names()
+        skill_score = self.calculate_skill_match(resume_skills, job_skills)
+        title_score = self.calculate_title_match(resume_text, job.title)
+        exp_score = self.calculate_experience_match(resume_years, job.requirements or '')
         
-        return min(matches / len(job_skills_list), 1.0)
+        return self._match_data(job.id, skill_score, title_score, exp_score)
     
-    def calculate_title_match(self, resume_text: str, job_title: str) -> float:
-        if not resume_text or not job_title:
+    def prepare_resume(self, resume_skills: List[str], resume_text: str, resume_years: int) -> Dict:
+        # resume_text may be the raw text or its vocabulary (Resume.vocabulary); the title score is the same.
+        return {
+            'skills': self._skills(resume_skills),
+            'text': (resume_text or '').lower(),
+            'years': resume_years,
+            'skill_hits': {},
+            'title_hits': {}
+        }
+    
+    def prepare_job(self, job, job_skills: List[str]) -> Dict:
+        return {
+            'id': job.id,
+            'skills': self._skills(job_skills),
+            'title_words': job.title.lower().split() if job.title else [],
+            'required_years': self._required_years(job.requirements)
+        }
+    
+    def score_prepared(self, resume: Dict, job: Dict) -> Dict:
+        # Same score as calculate_match_score, with lowercasing and parsing hoisted out of the pair loop.
+        skill_score = self._skill_score(resume['skills'], job['skills'], resume['skill_hits']) if resume['skills'] else 0.0
+        title_score = self._title_score(resume['text'], job['title_words'], resume['title_hits']) if resume['text'] else 0.0
+        exp_score = self._experience_score(resume['years'], job['required_years'])
+        
+        return self._match_data(job['id'], skill_score, title_score, exp_score)
+    
+    def _skills(self, skills) -> List[str]:
+        # Names from the skills tables are already lowercased; raw lists and comma-separated text are not.
+        if isinstance(skills, str):
+            skills = skills.split(',')
+        return [s.strip().lower() for s in skills or [] if s and s.strip()]
+    
+    def _required_years(self, job_requirements: str):
+        if job_requirements:
+            years_match = re.search(r'(\d+)\+?\s*years?', job_requirements, re.IGNORECASE)
+            if years_match:
+                return int(years_match.group(1))
+        return None
+    
+    def _skill_score(self, resume_skills_lower: List[str], job_skills_list: List[str],
+                     hits: Dict[str, bool] = None) -> float:
+        if not job_skills_list:
             return 0.0
         
-        resume_text_lower = resume_text.lower()
-        job_title_lower = job_title.lower()
+        # Jobs draw on one skills dictionary and titles repeat the same few words, so with a per-resume
+        # hits dict each skill or word is compared against the resume once rather than once per job.
+        if hits is None:
+            hits = {}
+        matches = 0
+        for skill in job_skills_list:
+            found = hits.get(skill)
+            if found is None:
+                found = hits[skill] = any(skill in rs or rs in skill for rs in resume_skills_lower)
+            matches += found
         
-        title_words = job_title_lower.split()
-        matches = sum(1 for word in title_words if len(word) > 2 and word in resume_text_lower)
+        return min(matches / len(job_skills_list), 1.0)
+    
+    def _title_score(self, resume_text_lower: str, title_words: List[str], hits: Dict[str, bool] = None) -> float:
+        if hits is None:
+            hits = {}
+        matches = 0
+        for word in title_words:
+            if len(word) > 2:
+                found = hits.get(word)
+                if found is None:
+                    found = hits[word] = word in resume_text_lower
+                matches += found
         
         return min(matches / len(title_words), 1.0) if title_words else 0.0
     
-    def calculate_experience_match(self, resume_years: int, job_requirements: str) -> float:
+    def _experience_score(self, resume_years: int, required_years: int) -> float:
         if resume_years is None:
             return 0.5
         
-        if job_requirements:
-            import re
-            years_match = re.search(r'(\d+)\+?\s*years?', job_requirements, re.IGNORECASE)
-            if years_match:
-                required_years = int(years_match.group(1))
-                if resume_years >= required_years:
-                    return 1.0
-                elif resume_years >= required_years - 2:
-                    return 0.7
-                else:
-                    return 0.3
+        if required_years is not None:
+            if resume_years >= required_years:
+                return 1.0
+            elif resume_years >= required_years - 2:
+                return 0.7
+            else:
+                return 0.3
         
         return 0.5
     
-    def calculate_match_score(self, resume_skills: List[str], resume_text: str, 
-                              resume_years: int, job) -> Dict:
-        skill_score = self.calculate_skill_match(resume_skills, job.skills_required or '')
-        title_score = self.calculate_title_match(resume_text, job.title)
-        exp_score = self.calculate_experience_match(resume_years, job.requirements or '')
-        
+    def _match_data(self, job_id: int, skill_score: float, title_score: float, exp_score: float) -> Dict:
         overall_score = (skill_score * 0.5) + (title_score * 0.3) + (exp_score * 0.2)
         
         return {
-            'job_id': job.id,
+            'job_id': job_id,
             'overall_score': round(overall_score * 100, 1),
             'skill_match': round(skill_score * 100, 1),
             'title_match': round(title_score * 100, 1),
@@ -78,13 +151,54 @@ class JobMatcher:
         if not resume:
             return []
         
-        resume_skills = resume.get_skills_list()
-        resume_text = resume.parsed_text or ''
-        resume_years = resume.experience_years
+        from talentbridge.models import job_skills
+        from talentbridge.skills import SkillIndex
+        
+        features = self.prepare_resume(resume.get_skill_names(), resume.vocabulary, resume.experience_years)
+        skills = SkillIndex().names(job_skills, [job.id for job in jobs])
+        
+        job_scores = []
+        for job in jobs:
+            match_data = self.score_prepared(features, self.prepare_job(job, skills.get(job.id, [])))
+            if match_data['overall_score'] >= 20:
+                job_scores.append((job, match_data))
+        
+        job_scores.sort(key=lambda x: x[1]['overall_score'], reverse=True)
+        
+        return job_scores[:limit]
+    
+    def get_semantic_matched_jobs(self, resume, limit: int = 20, candidates: int = 200) -> List[Tuple]:
+        from flask import current_app
+        from talentbridge.extensions import db
+        from talentbridge.models import Job, job_skills
+        from talentbridge.skills import SkillIndex
+        from talentbridge.resumes.embeddings import get_embedder, get_job_index
+        
+        if not resume:
+            return []
+        
+        embedder = get_embedder()
+        if resume.embedding:
+            query = embedder.from_bytes(resume.embedding)
+        else:
+            query = embedder.embed_resume(resume.parsed_text, resume.get_skills_list())
+        
+        hits = get_job_index().search(query, k=candidates, nprobe=current_app.config['EMBEDDING_NPROBE'])
+        if not hits:
+            return []
+        similarity = dict(hits)
+        jobs = Job.query.filter(Job.id.in_(list(similarity)), Job.is_active == True) \
+            .options(db.undefer(Job.requirements)).all()
+        skills = SkillIndex().names(job_skills, [job.id for job in jobs])
+        
+        features = self.prepare_resume(resume.get_skill_names(), resume.vocabulary, resume.experience_years)
         
         job_scores = []
         for job in jobs:
-            match_data = self.calculate_match_score(resume_skills, resume_text, resume_years, job)
+            match_data = self.score_prepared(features, self.prepare_job(job, skills.get(job.id, [])))
+            semantic_score = max(similarity[job.id], 0.0)
+            match_data['semantic_match'] = round(semantic_score * 100, 1)
+            match_data['overall_score'] = round(match_data['overall_score'] * 0.5 + semantic_score * 50, 1)
             if match_data['overall_score'] >= 20:
                 job_scores.append((job, match_data))
         
@@ -92,6 +206,21 @@ class JobMatcher:
         
         return job_scores[:limit]
     
+    def skill_messages(self, resume_text: str) -> List[Dict]:
+        return [
+            {
+                "role": "system",
+                "content": "You are an expert resume analyzer. Extract all technical and professional skills from the given resume text. Return only a comma-separated list of skills, nothing else."
+            },
+            {
+                "role": "user",
+                "content": f"Extract all skills from this resume:\n\n{resume_text[:4000]}"
+            }
+        ]
+    
+    def parse_skills(self, skills_text: str) -> List[str]:
+        return [s.strip().lower() for s in (skills_text or '').split(',') if s.strip()]
+    
     def enhance_skills_with_ai(self, resume_text: str) -> List[str]:
         if not self.client:
             logger.warning("OpenAI client not initialized. Skipping AI enhancement.")
@@ -100,23 +229,12 @@ class JobMatcher:
         try:
             response = self.client.chat.completions.create(
                 model="gpt-4o",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an expert resume analyzer. Extract all technical and professional skills from the given resume text. Return only a comma-separated list of skills, nothing else."
-                    },
-                    {
-                        "role": "user",
-                        "content": f"Extract all skills from this resume:\n\n{resume_text[:4000]}"
-                    }
-                ],
+                messages=self.skill_messages(resume_text),
                 max_tokens=500,
                 temperature=0.3
             )
             
-            skills_text = response.choices[0].message.content
-            skills = [s.strip().lower() for s in skills_text.split(',') if s.strip()]
-            return skills
+            return self.parse_skills(response.choices[0].message.content)
             
         except Exception as e:
             logger.error(f"Error enhancing skills with AI: {str(e)}")
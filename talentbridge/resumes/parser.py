@@ -2,8 +2,6 @@ import os
 import re
 import logging
 from typing import Dict, List, Optional
-import PyPDF2
-from docx import Document
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -35,6 +33,7 @@ class ResumeParser:
         self.skills_pattern = re.compile(r'\b(' + '|'.join(map(re.escape, COMMON_SKILLS)) + r')\b', re.IGNORECASE)
     
     def extract_text_from_pdf(self, file_path: str) -> str:
+        import PyPDF2
         text = ""
         try:
             with open(file_path, 'rb') as file:
@@ -48,6 +47,7 @@ class ResumeParser:
         return text
     
     def extract_text_from_docx(self, file_path: str) -> str:
+        from docx import Document
         text = ""
         try:
             doc = Document(file_path)
@@ -1,13 +1,22 @@
 import os
 from datetime import datetime
-from flask import render_template, request, redirect, url_for, flash, current_app, send_from_directory
+from flask import render_template, request, redirect, url_for, flash, current_app, jsonify, abort
 from flask_login import current_user, login_required
 from werkzeug.utils import secure_filename
 from talentbridge.extensions import db
 from talentbridge.resumes import bp
-from talentbridge.resumes.parser import ResumeParser
 from talentbridge.resumes.matcher import JobMatcher
-from talentbridge.models import Resume, Job
+from talentbridge.resumes.talent import TalentMatcher, RESUME
+from talentbridge.resumes.scoring import get_precomputed_matches
+from talentbridge.resumes.uploads import ChunkedUploads, UploadError, resume_path, save_resume
+from talentbridge.resumes.downloads import remove_preview, send_preview, send_resume
+from talentbridge.models import Resume, ResumeText, Job, UploadSession, check_admin
+
+def readable_resume(resume_id):
+    resume = Resume.query.get_or_404(resume_id)
+    if resume.user_id != current_user.id and not check_admin(current_user):
+        abort(404)
+    return resume
 
 def allowed_file(filename):
     return '.' in filename and \
@@ -29,33 +38,9 @@ def upload():
         
         if file and allowed_file(file.filename):
             filename = secure_filename(file.filename)
-            timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
-            unique_filename = f"{current_user.id}_{timestamp}_{filename}"
-            
-            upload_path = os.path.join(current_app.config['UPLOAD_FOLDER'], 'resumes')
-            os.makedirs(upload_path, exist_ok=True)
-            file_path = os.path.join(upload_path, unique_filename)
+            file_path = resume_path(current_user.id, filename)
             file.save(file_path)
-            
-            parser = ResumeParser()
-            parse_result = parser.parse_resume(file_path)
-            
-            if request.form.get('set_primary'):
-                Resume.query.filter_by(user_id=current_user.id, is_primary=True).update({'is_primary': False})
-            
-            resume = Resume(
-                user_id=current_user.id,
-                filename=filename,
-                file_path=file_path,
-                parsed_text=parse_result.get('text', ''),
-                extracted_skills=','.join(parse_result.get('skills', [])),
-                experience_years=parse_result.get('experience_years'),
-                education=','.join(parse_result.get('education', [])),
-                is_primary=bool(request.form.get('set_primary'))
-            )
-            
-            db.session.add(resume)
-            db.session.commit()
+            save_resume(current_user.id, filename, file_path, bool(request.form.get('set_primary')))
             
             flash('Resume uploaded and analyzed successfully!', 'success')
             return redirect(url_for('resumes.my_resumes'))
@@ -65,6 +50,65 @@ def upload():
     
     return render_template('resumes/upload.html', title='Upload Resume')
 
+def chunked_uploads():
+    config = current_app.config
+    return ChunkedUploads(chunk_size=config['UPLOAD_CHUNK_SIZE'], max_size=config['MAX_CONTENT_LENGTH'],
+                          bytes_per_second=config['UPLOAD_BYTES_PER_SECOND'], session_ttl=config['UPLOAD_SESSION_TTL'])
+
+def upload_error(error):
+    response = jsonify(dict(error.extra, error=str(error)))
+    response.status_code = error.status
+    if 'retry_after' in error.extra:
+        response.headers['Retry-After'] = str(max(1, int(error.extra['retry_after'] + 0.999)))
+    return response
+
+@bp.route('/uploads', methods=['POST'])
+@login_required
+def start_upload():
+    data = request.get_json(silent=True) or {}
+    uploads = chunked_uploads()
+    try:
+        session = uploads.start(current_user.id, data.get('filename'), int(data.get('size') or 0),
+                                checksum=data.get('sha256'), set_primary=bool(data.get('set_primary')))
+    except (UploadError, ValueError) as e:
+        return upload_error(e if isinstance(e, UploadError) else UploadError('size must be a number'))
+    return jsonify(dict(session.to_dict(), chunk_size=uploads.chunk_size)), 201
+
+@bp.route('/uploads/<upload_id>', methods=['GET'])
+@login_required
+def upload_status(upload_id):
+    session = UploadSession.query.filter_by(id=upload_id, user_id=current_user.id).first_or_404()
+    return jsonify(dict(session.to_dict(), chunk_size=current_app.config['UPLOAD_CHUNK_SIZE']))
+
+@bp.route('/uploads/<upload_id>', methods=['PATCH'])
+@login_required
+def upload_chunk(upload_id):
+    session = UploadSession.query.filter_by(id=upload_id, user_id=current_user.id).first_or_404()
+    try:
+        chunked_uploads().write(session, request.headers.get('Upload-Offset', type=int), request.stream,
+                                request.content_length)
+    except UploadError as e:
+        return upload_error(e)
+    return jsonify(session.to_dict())
+
+@bp.route('/uploads/<upload_id>', methods=['DELETE'])
+@login_required
+def cancel_upload(upload_id):
+    session = UploadSession.query.filter_by(id=upload_id, user_id=current_user.id).first_or_404()
+    chunked_uploads().discard(session)
+    return '', 204
+
+@bp.route('/uploads/<upload_id>/complete', methods=['POST'])
+@login_required
+def complete_upload(upload_id):
+    session = UploadSession.query.filter_by(id=upload_id, user_id=current_user.id).first_or_404()
+    try:
+        chunked_uploads().finish(session)
+    except UploadError as e:
+        return upload_error(e)
+    flash('Resume uploaded and analyzed successfully!', 'success')
+    return jsonify({'redirect': url_for('resumes.my_resumes')})
+
 @bp.route('/my-resumes')
 @login_required
 def my_resumes():
@@ -91,7 +135,12 @@ def delete_resume(resume_id):
     if os.path.exists(resume.file_path):
         os.remove(resume.file_path)
     
+    remove_preview(resume)
+    TalentMatcher().remove(RESUME, resume.id)
     db.session.delete(resume)
+    # Another resume may now be the one recommendations use; touching them lets the batch scorer see it.
+    Resume.query.filter(Resume.user_id == current_user.id, Resume.id != resume.id) \
+        .update({'updated_at': datetime.utcnow()}, synchronize_session=False)
     db.session.commit()
     
     flash('Resume deleted.', 'info')
@@ -100,26 +149,35 @@ def delete_resume(resume_id):
 @bp.route('/<int:resume_id>/download')
 @login_required
 def download_resume(resume_id):
-    resume = Resume.query.filter_by(id=resume_id, user_id=current_user.id).first_or_404()
-    directory = os.path.dirname(resume.file_path)
-    filename = os.path.basename(resume.file_path)
-    return send_from_directory(directory, filename, as_attachment=True, download_name=resume.filename)
+    return send_resume(readable_resume(resume_id))
+
+@bp.route('/<int:resume_id>/preview')
+@login_required
+def preview_resume(resume_id):
+    return send_preview(readable_resume(resume_id))
 
 @bp.route('/recommended')
 @login_required
 def recommended():
-    primary_resume = Resume.query.filter_by(user_id=current_user.id, is_primary=True).first()
+    # Matching reads the vocabulary and the AI prompt the text, so both come with the resume row.
+    resumes = Resume.query.options(db.joinedload(Resume.text).undefer(ResumeText.content))
+    primary_resume = resumes.filter_by(user_id=current_user.id, is_primary=True).first()
     if not primary_resume:
-        primary_resume = Resume.query.filter_by(user_id=current_user.id).order_by(Resume.upload_date.desc()).first()
+        primary_resume = resumes.filter_by(user_id=current_user.id).order_by(Resume.upload_date.desc()).first()
     
     if not primary_resume:
         flash('Please upload a resume to see job recommendations.', 'info')
         return redirect(url_for('resumes.upload'))
     
-    jobs = Job.query.filter_by(is_active=True).all()
-    
     matcher = JobMatcher()
-    matched_jobs = matcher.get_matched_jobs(primary_resume, jobs, limit=20)
+    if current_app.config['MATCHING_MODE'] == 'semantic':
+        matched_jobs = matcher.get_semantic_matched_jobs(primary_resume, limit=20)
+    else:
+        # The batch scorer keeps a top-k per user; score live only until it has covered this resume.
+        matched_jobs = get_precomputed_matches(current_user.id, primary_resume, limit=20)
+        if matched_jobs is None:
+            jobs = Job.query.filter_by(is_active=True).options(db.undefer(Job.requirements)).all()
+            matched_jobs = matcher.get_matched_jobs(primary_resume, jobs, limit=20)
     
     ai_recommendations = None
     if matched_jobs:
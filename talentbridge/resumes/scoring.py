@@ -0,0 +1,207 @@
+import os
+import heapq
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import func
+from sqlalchemy.orm import contains_eager
+from talentbridge.extensions import db
+from talentbridge.models import Job, Resume, ResumeText, RecommendedJob, RecommendationRun, job_skills, resume_skills
+from talentbridge.resumes.matcher import JobMatcher
+from talentbridge.skills import SkillIndex
+from talentbridge.textstore import unpack
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+MIN_SCORE = 20
+
+_worker_state = {}
+
+def _init_worker(jobs: List[Dict], top_k: int):
+    _worker_state['matcher'] = JobMatcher()
+    _worker_state['jobs'] = jobs
+    _worker_state['top_k'] = top_k
+
+def _score_chunk(resumes: List[Tuple[int, int, Dict]]) -> List[Tuple[int, int, List[Dict]]]:
+    matcher = _worker_state['matcher']
+    jobs = _worker_state['jobs']
+    results = []
+    for user_id, resume_id, features in resumes:
+        scored = []
+        for job in jobs:
+            match_data = matcher.score_prepared(features, job)
+            if match_data['overall_score'] >= MIN_SCORE:
+                scored.append(match_data)
+        top = heapq.nlargest(_worker_state['top_k'], scored, key=lambda x: x['overall_score'])
+        results.append((user_id, resume_id, top))
+    return results
+
+class RecommendationScorer:
+
+    def __init__(self, top_k: int = 50, workers: int = None, chunk_size: int = 20, batch_size: int = 5000):
+        self.top_k = top_k
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.batch_size = batch_size
+        self.matcher = JobMatcher()
+        self.skills = SkillIndex(batch_size=batch_size)
+
+    def primary_resumes(self) -> Dict[int, Tuple]:
+        # Same choice as the recommended page: the primary resume, else the latest upload.
+        query = db.session.query(
+            Resume.user_id, Resume.id, ResumeText.codec, ResumeText.vocabulary,
+            Resume.experience_years, Resume.upload_date, Resume.updated_at
+        ).outerjoin(ResumeText, ResumeText.resume_id == Resume.id) \
+            .order_by(Resume.user_id, func.coalesce(Resume.is_primary, False).desc(), Resume.upload_date.desc())
+        resumes = {}
+        for row in query.yield_per(self.batch_size):
+            resumes.setdefault(row.user_id, row)
+        return resumes
+
+    def prepare_resume(self, row, skills: List[str]) -> Dict:
+        return self.matcher.prepare_resume(skills, unpack(row.vocabulary, row.codec), row.experience_years)
+
+    def prepare_jobs(self, query) -> List[Dict]:
+        skills = self.skills.names(job_skills, query.with_entities(Job.id).statement)
+        columns = (Job.id, Job.title, Job.requirements)
+        return [self.matcher.prepare_job(row, skills.get(row.id, []))
+                for row in query.with_entities(*columns).yield_per(self.batch_size)]
+
+    def run(self, full: bool = False) -> RecommendationRun:
+        started = datetime.utcnow()
+        last = RecommendationRun.query.filter(RecommendationRun.finished_at.isnot(None)).order_by(
+            RecommendationRun.started_at.desc()
+        ).first()
+        full = full or last is None
+
+        resumes = self.primary_resumes()
+        stored = dict(db.session.query(RecommendedJob.user_id, func.max(RecommendedJob.resume_id))
+                      .group_by(RecommendedJob.user_id).all())
+
+        stale_users = [user_id for user_id in stored if user_id not in resumes]
+        if full:
+            rescore_users = list(resumes)
+            delta_users = []
+            changed_ids = set()
+        else:
+            rescore_users = [user_id for user_id, row in resumes.items()
+                             if changed_at(row) > last.started_at
+                             or (user_id in stored and stored[user_id] != row.id)]
+            rescore = set(rescore_users)
+            delta_users = [user_id for user_id in resumes if user_id not in rescore]
+            changed_ids = {row[0] for row in db.session.query(Job.id).filter(Job.updated_at > last.started_at)}
+
+        for start in range(0, len(stale_users), self.batch_size):
+            RecommendedJob.query.filter(RecommendedJob.user_id.in_(stale_users[start:start + self.batch_size])) \
+                .delete(synchronize_session=False)
+
+        jobs_scored = 0
+        if delta_users and changed_ids:
+            changed_jobs = self.prepare_jobs(Job.query.filter(Job.id.in_(changed_ids), Job.is_active == True))
+            jobs_scored = len(changed_ids)
+            rescore_users.extend(self._score(resumes, delta_users, changed_jobs, started, changed_ids))
+
+        if rescore_users:
+            all_jobs = self.prepare_jobs(Job.query.filter(Job.is_active == True))
+            jobs_scored = len(all_jobs)
+            self._score(resumes, rescore_users, all_jobs, started)
+
+        run = RecommendationRun(started_at=started, finished_at=datetime.utcnow(), full=full,
+                                jobs_scored=jobs_scored,
+                                users_scored=len(set(rescore_users).union(delta_users if changed_ids else ())))
+        db.session.add(run)
+        db.session.commit()
+        logger.info(f"Scored {run.users_scored} users against {jobs_scored} jobs "
+                    f"({'full' if full else 'delta'}) in {(run.finished_at - started).total_seconds():.1f}s")
+        return run
+
+    def _score(self, resumes: Dict[int, Tuple], user_ids: List[int], jobs: List[Dict], now: datetime,
+               changed_ids: set = None) -> List[int]:
+        # With changed_ids the scores are merged into each user's stored list; the
+        # users whose list can no longer be merged exactly are returned for a full rescore.
+        incomplete = []
+        skills = self.skills.names(resume_skills, [resumes[user_id].id for user_id in user_ids])
+        work = [(user_id, resumes[user_id].id, self.prepare_resume(resumes[user_id], skills.get(resumes[user_id].id, [])))
+                for user_id in user_ids]
+        chunks = [work[start:start + self.chunk_size] for start in range(0, len(work), self.chunk_size)]
+
+        pending = []
+        for results in self._map(chunks, jobs):
+            pending.extend(results)
+            if len(pending) >= self.batch_size // 10:
+                incomplete.extend(self._write(pending, now, changed_ids))
+                pending = []
+        if pending:
+            incomplete.extend(self._write(pending, now, changed_ids))
+        return incomplete
+
+    def _map(self, chunks: List[List], jobs: List[Dict]) -> Iterable[List]:
+        if self.workers <= 1 or len(chunks) <= 1:
+            _init_worker(jobs, self.top_k)
+            try:
+                for chunk in chunks:
+                    yield _score_chunk(chunk)
+            finally:
+                _worker_state.clear()
+            return
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                 initargs=(jobs, self.top_k)) as pool:
+            yield from pool.map(_score_chunk, chunks)
+
+    def _write(self, results: List[Tuple[int, int, List[Dict]]], now: datetime, changed_ids: set = None) -> List[int]:
+        merge = changed_ids is not None
+        user_ids = [user_id for user_id, _, _ in results]
+        existing = {}
+        incomplete = []
+        if merge:
+            for row in RecommendedJob.query.filter(RecommendedJob.user_id.in_(user_ids)).all():
+                existing.setdefault(row.user_id, []).append(row.get_match_data())
+
+        rows = []
+        rewrite = []
+        for user_id, resume_id, scored in results:
+            if merge:
+                current = existing.get(user_id, [])
+                kept = [m for m in current if m['job_id'] not in changed_ids]
+                if not scored and len(kept) == len(current):
+                    continue
+                merged = heapq.nlargest(self.top_k, kept + scored, key=lambda x: x['overall_score'])
+                if len(current) >= self.top_k:
+                    # A full list only proves that unscored jobs rank at or below its last entry.
+                    boundary = min(m['overall_score'] for m in current)
+                    if sum(1 for m in merged if m['overall_score'] >= boundary) < self.top_k:
+                        incomplete.append(user_id)
+                        continue
+                scored = merged
+            rewrite.append(user_id)
+            rows.extend(dict(match_data, user_id=user_id, resume_id=resume_id, computed_at=now)
+                        for match_data in scored)
+
+        if rewrite:
+            RecommendedJob.query.filter(RecommendedJob.user_id.in_(rewrite)).delete(synchronize_session=False)
+        for start in range(0, len(rows), self.batch_size):
+            db.session.execute(RecommendedJob.__table__.insert(), rows[start:start + self.batch_size])
+        db.session.commit()
+        return incomplete
+
+def changed_at(resume) -> datetime:
+    return resume.updated_at or resume.upload_date or datetime.min
+
+def get_precomputed_matches(user_id: int, resume, limit: int = 20) -> Optional[List[Tuple]]:
+    # None when the batch scorer has not covered this resume yet. An empty list is a real result:
+    # the resume was scored and nothing passed MIN_SCORE.
+    rows = RecommendedJob.query.join(RecommendedJob.job).options(contains_eager(RecommendedJob.job)).filter(
+        RecommendedJob.user_id == user_id,
+        RecommendedJob.resume_id == resume.id,
+        Job.is_active == True
+    ).order_by(RecommendedJob.overall_score.desc()).limit(limit).all()
+    if rows:
+        return [(row.job, row.get_match_data()) for row in rows]
+    stored = RecommendedJob.query.filter_by(user_id=user_id, resume_id=resume.id).exists()
+    scored = RecommendationRun.query.filter(RecommendationRun.finished_at.isnot(None),
+                                            RecommendationRun.started_at >= changed_at(resume)).exists()
+    if db.session.query(stored).scalar() or db.session.query(scored).scalar():
+        return []
+    return None
@@ -0,0 +1,86 @@
+import logging
+from typing import Dict, List, Tuple
+from sqlalchemy import func, literal, select, union_all
+from talentbridge.extensions import db
+from talentbridge.models import Resume, Candidate, Skill, resume_skills, candidate_skills
+from talentbridge.resumes.matcher import JobMatcher
+from talentbridge.skills import SkillIndex
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+RESUME = 'resume'
+CANDIDATE = 'candidate'
+
+class TalentMatcher:
+
+    def __init__(self, pool_size: int = 200, batch_size: int = 5000):
+        self.pool_size = pool_size
+        self.batch_size = batch_size
+        self.matcher = JobMatcher()
+        self.skills = SkillIndex(batch_size=batch_size)
+
+    def index_resume(self, resume: Resume):
+        self.skills.index_resumes([(resume.id, resume.extracted_skills, resume.education)])
+
+    def index_candidate(self, candidate: Candidate):
+        self.skills.index_candidates([(candidate.id, candidate.skills)])
+
+    def remove(self, source_type: str, source_id: int):
+        if source_type == RESUME:
+            self.skills.index_resumes([(source_id, None, None)])
+        else:
+            self.skills.index_candidates([(source_id, None)])
+
+    def candidate_pool(self, skills: List[str]) -> List[Tuple[str, int, int]]:
+        # Only the postings for this job's skills are touched, via the (skill_id, owner) indexes.
+        if not skills:
+            return []
+        skill_ids = select(Skill.id).where(Skill.name.in_(skills))
+        sources = []
+        for source_type, table, owner, model in ((RESUME, resume_skills, resume_skills.c.resume_id, Resume),
+                                                 (CANDIDATE, candidate_skills, candidate_skills.c.candidate_id, Candidate)):
+            sources.append(select(
+                literal(source_type).label('source_type'), owner.label('source_id'),
+                func.count().label('matched'), func.max(model.experience_years).label('years')
+            ).select_from(table).join(model, model.id == owner).where(table.c.skill_id.in_(skill_ids)).group_by(owner))
+        pool = union_all(*sources).subquery()
+        return db.session.query(pool.c.source_type, pool.c.source_id, pool.c.matched).order_by(
+            pool.c.matched.desc(), pool.c.years.desc()
+        ).limit(self.pool_size).all()
+
+    def top_candidates(self, job, limit: int = 20) -> List[Tuple[str, object, Dict]]:
+        job_skills = job.get_skill_names()
+        pool = self.candidate_pool(job_skills)
+        resume_ids = [source_id for source_type, source_id, _ in pool if source_type == RESUME]
+        candidate_ids = [source_id for source_type, source_id, _ in pool if source_type == CANDIDATE]
+
+        results = []
+        if resume_ids:
+            names = self.skills.names(resume_skills, resume_ids)
+            for resume in Resume.query.filter(Resume.id.in_(resume_ids)).options(db.joinedload(Resume.text)).all():
+                results.append((RESUME, resume, self.score(names.get(resume.id, []), resume.vocabulary,
+                                                           resume.experience_years, job, job_skills)))
+        if candidate_ids:
+            names = self.skills.names(candidate_skills, candidate_ids)
+            for candidate in Candidate.query.filter(Candidate.id.in_(candidate_ids)).all():
+                results.append((CANDIDATE, candidate, self.score(names.get(candidate.id, []), candidate.current_role,
+                                                                 candidate.experience_years, job, job_skills)))
+
+        results.sort(key=lambda x: x[2]['overall_score'], reverse=True)
+        return results[:limit]
+
+    def score(self, skills: List[str], text: str, years: int, job, job_skills: List[str]) -> Dict:
+        return self.matcher.calculate_match_score(skills, text or '', years, job, job_skills)
+
+def index_talent(source):
+    try:
+        matcher = TalentMatcher()
+        if isinstance(source, Resume):
+            matcher.index_resume(source)
+        else:
+            matcher.index_candidate(source)
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"Error updating talent index: {str(e)}")
@@ -0,0 +1,255 @@
+import os
+import re
+import time
+import uuid
+import hashlib
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import IO, Optional
+from flask import current_app
+from sqlalchemy.orm.exc import ObjectDeletedError
+from werkzeug.utils import secure_filename
+from talentbridge.extensions import db
+from talentbridge.models import Resume, UploadSession
+from talentbridge.resumes.parser import ResumeParser
+from talentbridge.resumes.talent import index_talent
+from talentbridge.resumes.downloads import file_digest, write_preview
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+SIGNATURES = {
+    'pdf': b'%PDF-',
+    'docx': b'PK\x03\x04',
+}
+CHECKSUM_RE = re.compile(r'^[0-9a-f]{64}$')
+READ_SIZE = 64 * 1024
+
+class UploadError(Exception):
+
+    def __init__(self, message: str, status: int = 400, **extra):
+        super().__init__(message)
+        self.status = status
+        self.extra = extra
+
+def resume_path(user_id: int, filename: str) -> str:
+    timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
+    upload_path = os.path.join(current_app.config['UPLOAD_FOLDER'], 'resumes')
+    os.makedirs(upload_path, exist_ok=True)
+    return os.path.join(upload_path, f"{user_id}_{timestamp}_{filename}")
+
+def save_resume(user_id: int, filename: str, file_path: str, set_primary: bool,
+                content_hash: Optional[str] = None) -> Resume:
+    if content_hash:
+        file_size = os.path.getsize(file_path)
+    else:
+        content_hash, file_size = file_digest(file_path)
+    parser = ResumeParser()
+    parse_result = parser.parse_resume(file_path)
+
+    if set_primary:
+        Resume.query.filter_by(user_id=user_id, is_primary=True).update({'is_primary': False})
+
+    resume = Resume(
+        user_id=user_id,
+        filename=filename,
+        file_path=file_path,
+        parsed_text=parse_result.get('text', ''),
+        extracted_skills=','.join(parse_result.get('skills', [])),
+        experience_years=parse_result.get('experience_years'),
+        education=','.join(parse_result.get('education', [])),
+        is_primary=set_primary,
+        content_hash=content_hash,
+        file_size=file_size
+    )
+    from talentbridge.resumes.embeddings import get_embedder
+    embedder = get_embedder()
+    resume.embedding = embedder.to_bytes(embedder.embed_resume(resume.parsed_text, parse_result.get('skills', [])))
+
+    db.session.add(resume)
+    db.session.commit()
+    index_talent(resume)
+    if current_app.config['RESUME_PREVIEWS']:
+        write_preview(resume)
+    return resume
+
+class ChunkedUploads:
+    # Running SHA-256 state per session, so each chunk is hashed once as it streams to disk.
+    _hashes = {}
+    _lock = threading.Lock()
+
+    def __init__(self, chunk_size: int, max_size: int, bytes_per_second: int = 0, session_ttl: int = 86400):
+        self.chunk_size = chunk_size
+        self.max_size = max_size
+        self.bytes_per_second = bytes_per_second
+        self.session_ttl = session_ttl
+
+    def start(self, user_id: int, filename: str, size: int, checksum: Optional[str] = None,
+              set_primary: bool = False) -> UploadSession:
+        filename = secure_filename(filename or '')
+        extension = filename.rsplit('.', 1)[1].lower() if '.' in filename else ''
+        if extension not in current_app.config['ALLOWED_EXTENSIONS']:
+            raise UploadError('Invalid file type. Please upload a PDF or DOCX file.')
+        if size <= 0 or size > self.max_size:
+            raise UploadError(f'File size must be less than {self.max_size // (1024 * 1024)}MB.', 413)
+        if checksum and not CHECKSUM_RE.match(checksum):
+            raise UploadError('sha256 must be 64 lowercase hex characters')
+
+        session = UploadSession(
+            id=uuid.uuid4().hex,
+            user_id=user_id,
+            filename=filename,
+            file_path=resume_path(user_id, filename),
+            size=size,
+            received=0,
+            checksum=checksum or None,
+            set_primary=set_primary,
+            rate_tat=time.time()
+        )
+        open(session.partial_path, 'wb').close()
+        db.session.add(session)
+        db.session.commit()
+        return session
+
+    def write(self, session: UploadSession, offset: Optional[int], stream: IO[bytes], length: Optional[int]) -> int:
+        if session.updated_at and session.updated_at < datetime.utcnow() - timedelta(seconds=self.session_ttl):
+            raise UploadError('Upload session has expired, please start again', 410)
+        try:
+            f = open(session.partial_path, 'r+b')
+        except FileNotFoundError:
+            # Discarded or completed by another request since the session was looked up.
+            raise UploadError('Upload not found', 404)
+        with f:
+            # Two PATCHes for the same offset may reach different workers. The first one to lock the
+            # file writes the chunk, and the other is told to re-check the offset.
+            if fcntl is not None:
+                try:
+                    fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    raise UploadError('Another chunk is being written to this upload', 409, offset=session.received)
+            try:
+                db.session.refresh(session)
+            except ObjectDeletedError:
+                raise UploadError('Upload not found', 404)
+            return self._write_locked(session, f, offset, stream, length)
+
+    def _write_locked(self, session: UploadSession, f: IO[bytes], offset: Optional[int], stream: IO[bytes],
+                      length: Optional[int]) -> int:
+        if offset != session.received:
+            raise UploadError('Upload-Offset does not match the bytes received so far', 409, offset=session.received)
+        if length is None:
+            raise UploadError('Content-Length is required', 411)
+        if length > self.chunk_size:
+            raise UploadError(f'Chunks must be at most {self.chunk_size} bytes', 413)
+        if offset + length > session.size:
+            raise UploadError('Chunk runs past the declared file size', 413)
+        self._throttle(session, length)
+
+        signature = SIGNATURES.get(session.filename.rsplit('.', 1)[1].lower(), b'') if offset == 0 else b''
+        head = b''
+        hasher = self._hasher(session)
+        written = 0
+        f.seek(offset)
+        while written < length:
+            piece = stream.read(min(READ_SIZE, length - written))
+            if not piece:
+                break
+            if len(head) < len(signature):
+                head += piece[:len(signature) - len(head)]
+                if not signature.startswith(head):
+                    self.discard(session)
+                    raise UploadError('File contents do not match its type. Please upload a PDF or DOCX file.', 415)
+            f.write(piece)
+            hasher.update(piece)
+            written += len(piece)
+        f.flush()
+
+        # A dropped connection keeps whatever arrived; the client resumes from the returned offset.
+        # The commit happens under the file lock, so the next chunk sees the new offset.
+        session.received = offset + written
+        with self._lock:
+            self._hashes[session.id] = (session.received, hasher, time.time())
+        self._evict_idle_hashes()
+        db.session.commit()
+        return session.received
+
+    def finish(self, session: UploadSession) -> Resume:
+        if session.received != session.size:
+            raise UploadError('Upload is incomplete', 409, offset=session.received)
+        digest = self._hasher(session).hexdigest()
+        if session.checksum and digest != session.checksum:
+            self.discard(session)
+            raise UploadError('Checksum mismatch, the upload was discarded. Please try again.', 422)
+
+        os.replace(session.partial_path, session.file_path)
+        with self._lock:
+            self._hashes.pop(session.id, None)
+        user_id, filename, file_path, size = session.user_id, session.filename, session.file_path, session.size
+        set_primary = bool(session.set_primary)
+        db.session.delete(session)
+        resume = save_resume(user_id, filename, file_path, set_primary, content_hash=digest)
+        logger.info(f"Stored chunked upload {filename} ({size} bytes, sha256 {digest})")
+        return resume
+
+    def discard(self, session: UploadSession):
+        try:
+            os.remove(session.partial_path)
+        except FileNotFoundError:
+            pass
+        with self._lock:
+            self._hashes.pop(session.id, None)
+        db.session.delete(session)
+        db.session.commit()
+
+    def purge_expired(self) -> int:
+        cutoff = datetime.utcnow() - timedelta(seconds=self.session_ttl)
+        expired = UploadSession.query.filter(UploadSession.updated_at < cutoff).all()
+        for session in expired:
+            self.discard(session)
+        self._evict_idle_hashes()
+        return len(expired)
+
+    def _evict_idle_hashes(self):
+        # purge_expired usually runs in its own process, so each worker also drops the hash state of
+        # sessions it has not seen a chunk for within the session lifetime.
+        cutoff = time.time() - self.session_ttl
+        with self._lock:
+            for session_id in [key for key, entry in self._hashes.items() if entry[2] < cutoff]:
+                del self._hashes[session_id]
+
+    def _hasher(self, session: UploadSession):
+        with self._lock:
+            entry = self._hashes.get(session.id)
+        if entry and entry[0] == session.received:
+            return entry[1].copy()
+
+        # Earlier chunks went to another worker or a previous process; rebuild the state from disk.
+        hasher = hashlib.sha256()
+        remaining = session.received
+        with open(session.partial_path, 'rb') as f:
+            while remaining > 0:
+                piece = f.read(min(READ_SIZE, remaining))
+                if not piece:
+                    break
+                hasher.update(piece)
+                remaining -= len(piece)
+        return hasher
+
+    def _throttle(self, session: UploadSession, length: int):
+        if not self.bytes_per_second:
+            return
+        # Generic cell rate algorithm: a client may run up to one chunk ahead of the byte budget,
+        # beyond that it is told when to retry instead of holding a worker while it waits.
+        now = time.time()
+        tat = max(session.rate_tat or 0.0, now)
+        tolerance = self.chunk_size / self.bytes_per_second
+        if tat - now > tolerance:
+            raise UploadError('Upload rate limit exceeded', 429, offset=session.received,
+                              retry_after=round(tat - now - tolerance, 2))
+        session.rate_tat = tat + length / self.bytes_per_second
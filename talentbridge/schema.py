@@ -0,0 +1,30 @@
+from typing import Sequence
+
+def init_migrations(app, db):
+    from flask_migrate import Migrate
+    Migrate(app, db, directory=app.config['MIGRATIONS_DIR'], render_as_batch=True)
+
+def upgrade_schema(app, db, revision: str = 'head'):
+    from flask_migrate import upgrade
+    if 'migrate' not in app.extensions:
+        init_migrations(app, db)
+    with app.app_context():
+        upgrade(revision=revision)
+
+def create_index_online(name: str, table: str, columns: Sequence[str], unique: bool = False):
+    # For use inside migrations. On PostgreSQL the index is built CONCURRENTLY outside the migration
+    # transaction, so reads and writes to a large table carry on while it builds.
+    from alembic import op
+    if op.get_bind().dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            op.create_index(name, table, columns, unique=unique, if_not_exists=True, postgresql_concurrently=True)
+    else:
+        op.create_index(name, table, columns, unique=unique, if_not_exists=True)
+
+def drop_index_online(name: str, table: str):
+    from alembic import op
+    if op.get_bind().dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            op.drop_index(name, table_name=table, if_exists=True, postgresql_concurrently=True)
+    else:
+        op.drop_index(name, table_name=table, if_exists=True)
@@ -0,0 +1,55 @@
+import os
+import logging
+from werkzeug.security import generate_password_hash, check_password_hash
+from talentbridge.serving import gevent_patched
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+class PasswordHasher:
+
+    def __init__(self, method: str = 'scrypt', salt_length: int = 16, workers: int = None):
+        self.method = method
+        self.salt_length = salt_length
+        self.workers = workers or os.cpu_count() or 2
+        self._executor = None
+        self._canonical_method = None
+
+    def init_app(self, app):
+        self.method = app.config.get('PASSWORD_HASH_METHOD', self.method)
+        self.salt_length = app.config.get('PASSWORD_HASH_SALT_LENGTH', self.salt_length)
+        self.workers = app.config.get('PASSWORD_HASH_WORKERS') or self.workers
+        self._canonical_method = None
+
+    @property
+    def executor(self):
+        # Only used under gevent, where a hash on the event loop would stall every greenlet in the worker.
+        # scrypt and pbkdf2 release the GIL, so native threads sized to the cores hash in parallel.
+        if self._executor is None:
+            from gevent.threadpool import ThreadPoolExecutor as NativeThreadPoolExecutor
+            self._executor = NativeThreadPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    @property
+    def canonical_method(self) -> str:
+        # Werkzeug fills in default cost parameters, so read them back from a real hash.
+        if self._canonical_method is None:
+            self._canonical_method = generate_password_hash('', method=self.method, salt_length=1).split('$', 1)[0]
+        return self._canonical_method
+
+    def hash(self, password: str) -> str:
+        return generate_password_hash(password, method=self.method, salt_length=self.salt_length)
+
+    def verify(self, pwhash: str, password: str) -> bool:
+        if not pwhash:
+            return False
+        if gevent_patched():
+            return self.executor.submit(check_password_hash, pwhash, password).result()
+        # Sync and gthread workers give each request its own OS thread, which would block on a pool the
+        # same way; hashing in place skips the handoff.
+        return check_password_hash(pwhash, password)
+
+    def needs_rehash(self, pwhash: str) -> bool:
+        if not pwhash or '$' not in pwhash:
+            return True
+        return pwhash.split('$', 1)[0] != self.canonical_method
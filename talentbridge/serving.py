@@ -0,0 +1,8 @@
+import sys
+
+def gevent_patched() -> bool:
+    # True inside a gevent worker, where threading and socket are cooperative.
+    if 'gevent' not in sys.modules:
+        return False
+    from gevent import monkey
+    return monkey.is_module_patched('socket')
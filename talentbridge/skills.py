@@ -0,0 +1,145 @@
+import logging
+from typing import Dict, Iterable, List, Sequence, Tuple
+from sqlalchemy import func, insert, select
+from talentbridge.extensions import db
+from talentbridge.models import Skill, Degree, Job, Resume, Candidate, job_skills, resume_skills, resume_degrees, candidate_skills
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Association table name -> (owner column, dictionary column, dictionary model)
+TABLES = {
+    'job_skills': (job_skills.c.job_id, job_skills.c.skill_id, Skill),
+    'resume_skills': (resume_skills.c.resume_id, resume_skills.c.skill_id, Skill),
+    'resume_degrees': (resume_degrees.c.resume_id, resume_degrees.c.degree_id, Degree),
+    'candidate_skills': (candidate_skills.c.candidate_id, candidate_skills.c.skill_id, Skill),
+}
+
+def normalize_skills(skills) -> List[str]:
+    if isinstance(skills, str):
+        skills = skills.split(',')
+    seen = []
+    for skill in skills or []:
+        skill = skill.strip().lower()[:100]
+        if skill and skill not in seen:
+            seen.append(skill)
+    return seen
+
+def _insert_ignore(table):
+    dialect = db.engine.dialect.name
+    if dialect == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    elif dialect == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    else:
+        return insert(table)
+    return dialect_insert(table).on_conflict_do_nothing()
+
+def jobs_with_skills(names: Sequence[str]):
+    # Job ids tagged with every one of the skills, answered from ix_job_skills_skill.
+    names = normalize_skills(names)
+    query = select(job_skills.c.job_id).join(Skill, Skill.id == job_skills.c.skill_id).where(Skill.name.in_(names))
+    if len(names) > 1:
+        query = query.group_by(job_skills.c.job_id).having(func.count() == len(names))
+    return query
+
+def jobs_matching_skill(text: str):
+    # Job ids tagged with a skill whose name contains the text, as the keyword search did on skills_required.
+    return select(job_skills.c.job_id).join(Skill, Skill.id == job_skills.c.skill_id) \
+        .where(Skill.name.ilike(f'%{text.strip().lower()}%'))
+
+class SkillIndex:
+
+    def __init__(self, batch_size: int = 5000):
+        self.batch_size = batch_size
+        # Keyed by dictionary table name
+        self._ids: Dict[str, Dict[str, int]] = {}
+        self._names: Dict[str, Dict[int, str]] = {}
+
+    def ids(self, names: Iterable[str], model=Skill) -> Dict[str, int]:
+        known = self._ids.setdefault(model.__tablename__, {})
+        wanted = set(names)
+        missing = [name for name in wanted if name not in known]
+        for start in range(0, len(missing), 500):
+            chunk = missing[start:start + 500]
+            known.update(db.session.query(model.name, model.id).filter(model.name.in_(chunk)))
+            new = [{'name': name} for name in chunk if name not in known]
+            if new:
+                # Another worker may add the same name at once; the unique name settles it.
+                db.session.execute(_insert_ignore(model.__table__), new)
+                known.update(db.session.query(model.name, model.id).filter(model.name.in_([row['name'] for row in new])))
+        return {name: known[name] for name in wanted}
+
+    def replace(self, table, rows: Iterable[Tuple[int, object]]):
+        owner_column, skill_column, model = TABLES[table.name]
+        rows = [(owner_id, normalize_skills(skills)) for owner_id, skills in rows]
+        if not rows:
+            return
+        ids = self.ids((name for _, names in rows for name in names), model)
+        owner_ids = [owner_id for owner_id, _ in rows]
+        for start in range(0, len(owner_ids), self.batch_size):
+            db.session.execute(table.delete().where(owner_column.in_(owner_ids[start:start + self.batch_size])))
+        values = [{owner_column.key: owner_id, skill_column.key: ids[name]} for owner_id, names in rows for name in names]
+        for start in range(0, len(values), self.batch_size):
+            db.session.execute(table.insert(), values[start:start + self.batch_size])
+
+    def index_jobs(self, rows: Iterable[Tuple[int, str]]):
+        self.replace(job_skills, rows)
+
+    def index_resumes(self, rows: Iterable[Tuple[int, str, str]]):
+        rows = list(rows)
+        self.replace(resume_skills, [(resume_id, skills) for resume_id, skills, _ in rows])
+        self.replace(resume_degrees, [(resume_id, education) for resume_id, _, education in rows])
+
+    def index_candidates(self, rows: Iterable[Tuple[int, str]]):
+        self.replace(candidate_skills, rows)
+
+    def names(self, table, owner_ids) -> Dict[int, List[str]]:
+        # owner_ids may be a list or a select of ids, which keeps large sets on the database side. Only the
+        # integer pairs are read; names come from the (small) dictionary, so each is one shared string.
+        owner_column, skill_column, model = TABLES[table.name]
+        query = select(owner_column, skill_column)
+        if isinstance(owner_ids, (list, tuple, set)):
+            owner_ids = list(owner_ids)
+            chunks = [owner_column.in_(owner_ids[start:start + self.batch_size])
+                      for start in range(0, len(owner_ids), self.batch_size)]
+        else:
+            chunks = [owner_column.in_(owner_ids)]
+        names = self.dictionary(model=model)
+        result: Dict[int, List[str]] = {}
+        for condition in chunks:
+            for owner_id, skill_id in db.session.execute(query.where(condition)):
+                name = names.get(skill_id)
+                if name is None:
+                    names = self.dictionary(refresh=True, model=model)
+                    name = names[skill_id]
+                result.setdefault(owner_id, []).append(name)
+        return result
+
+    def dictionary(self, refresh: bool = False, model=Skill) -> Dict[int, str]:
+        if refresh or model.__tablename__ not in self._names:
+            self._names[model.__tablename__] = dict(db.session.query(model.id, model.name))
+        return self._names[model.__tablename__]
+
+    def rebuild(self) -> Dict[str, int]:
+        sources = (
+            (self.index_jobs, db.session.query(Job.id, Job.skills_required).order_by(Job.id)),
+            (self.index_resumes, db.session.query(Resume.id, Resume.extracted_skills, Resume.education).order_by(Resume.id)),
+            (self.index_candidates, db.session.query(Candidate.id, Candidate.skills).order_by(Candidate.id)),
+        )
+        for table in (job_skills, resume_skills, resume_degrees, candidate_skills):
+            db.session.execute(table.delete())
+        for index, query in sources:
+            batch = []
+            for row in query.yield_per(self.batch_size):
+                batch.append(tuple(row))
+                if len(batch) >= self.batch_size:
+                    index(batch)
+                    batch = []
+            if batch:
+                index(batch)
+        db.session.commit()
+        counts = {table.name: db.session.query(func.count()).select_from(table).scalar()
+                  for table in (job_skills, resume_skills, resume_degrees, candidate_skills)}
+        logger.info(f"Indexed skills: {counts}")
+        return counts
@@ -2,8 +2,10 @@ document.addEventListener('DOMContentLoaded', function() {
     initFormValidation();
     initJobSearch();
     initFileUpload();
+    initChunkedUpload();
     initScrollEffects();
     initTooltips();
+    initBulkActions();
 });
 
 function initFormValidation() {
@@ -148,6 +150,127 @@ function initFileUpload() {
     }
 }
 
+function initChunkedUpload() {
+    const form = document.querySelector('form[data-chunked-upload]');
+    
+    if (form && window.fetch && window.Blob && Blob.prototype.slice) {
+        const fileInput = form.querySelector('input[type="file"][name="resume"]');
+        const primaryInput = form.querySelector('input[name="set_primary"]');
+        const progress = form.querySelector('[data-upload-progress]');
+        const bar = progress.querySelector('.progress-bar');
+        const status = progress.querySelector('[data-upload-status]');
+        const button = form.querySelector('button[type="submit"]');
+        
+        form.addEventListener('submit', async function(e) {
+            const file = fileInput.files[0];
+            if (!file) {
+                return;
+            }
+            e.preventDefault();
+            const originalText = showLoading(button);
+            progress.classList.remove('d-none');
+            bar.classList.remove('bg-danger');
+            
+            try {
+                window.location = await uploadInChunks(form.dataset.chunkedUpload, file, primaryInput.checked, (sent, total) => {
+                    bar.style.width = `${Math.round(sent * 100 / total)}%`;
+                    status.textContent = sent < total ? `${formatFileSize(sent)} of ${formatFileSize(total)}` : 'Analyzing resume...';
+                });
+            } catch (error) {
+                bar.classList.add('bg-danger');
+                status.textContent = error.message;
+                hideLoading(button, originalText);
+            }
+        });
+    }
+}
+
+async function uploadInChunks(startUrl, file, setPrimary, onProgress) {
+    const key = `resume-upload:${file.name}:${file.size}:${file.lastModified}`;
+    let session = null;
+    
+    const savedId = localStorage.getItem(key);
+    if (savedId) {
+        const response = await fetch(`${startUrl}/${savedId}`);
+        if (response.ok) {
+            session = await response.json();
+        }
+    }
+    if (!session) {
+        const response = await fetch(startUrl, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ filename: file.name, size: file.size, sha256: await sha256Hex(file), set_primary: setPrimary })
+        });
+        session = await readUploadResponse(response);
+        localStorage.setItem(key, session.id);
+    }
+    
+    const url = `${startUrl}/${session.id}`;
+    let offset = session.offset;
+    let failures = 0;
+    while (offset < file.size) {
+        onProgress(offset, file.size);
+        let response = null;
+        try {
+            response = await fetch(url, {
+                method: 'PATCH',
+                headers: { 'Upload-Offset': String(offset), 'Content-Type': 'application/offset+octet-stream' },
+                body: file.slice(offset, offset + session.chunk_size)
+            });
+        } catch (error) {
+            response = null;
+        }
+        
+        if (response && (response.ok || response.status === 409)) {
+            offset = (await response.json()).offset;
+            failures = 0;
+        } else if (response && response.status === 429) {
+            await sleep(Number(response.headers.get('Retry-After') || 1) * 1000);
+        } else if (response && response.status < 500) {
+            localStorage.removeItem(key);
+            await readUploadResponse(response);
+        } else {
+            if (++failures > 5) {
+                throw new Error('Upload interrupted. Submit again to continue where it stopped.');
+            }
+            await sleep(1000 * 2 ** failures);
+            const current = await fetch(url).catch(() => null);
+            if (current && current.ok) {
+                offset = (await current.json()).offset;
+            }
+        }
+    }
+    
+    onProgress(file.size, file.size);
+    const response = await fetch(`${url}/complete`, { method: 'POST' });
+    if (response.status !== 409) {
+        localStorage.removeItem(key);
+    }
+    return (await readUploadResponse(response)).redirect;
+}
+
+async function readUploadResponse(response) {
+    const data = await response.json().catch(() => ({}));
+    if (!response.ok) {
+        throw new Error(data.error || `Upload failed (${response.status})`);
+    }
+    return data;
+}
+
+async function sha256Hex(file) {
+    // crypto.subtle is only available on HTTPS and localhost; the server skips verification without it.
+    if (!window.crypto || !crypto.subtle) {
+        return null;
+    }
+    const digest = await crypto.subtle.digest('SHA-256', await file.arrayBuffer());
+    return Array.from(new Uint8Array(digest)).map(b => b.toString(16).padStart(2, '0')).join('');
+}
+
+function sleep(ms) {
+    return new Promise(resolve => setTimeout(resolve, ms));
+}
+
 function updateFileDisplay(file) {
     const uploadZone = document.querySelector('.resume-upload-zone');
     const allowedTypes = ['application/pdf', 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'];
@@ -217,6 +340,72 @@ function initTooltips() {
     });
 }
 
+function initBulkActions() {
+    const form = document.querySelector('form[data-bulk-form]');
+    
+    if (form) {
+        const boxes = Array.from(document.querySelectorAll(`input[name="ids"][form="${form.id}"]`));
+        const toggle = document.querySelector('[data-bulk-toggle]');
+        const counter = form.querySelector('[data-bulk-count]');
+        const scope = form.querySelector('select[name="scope"]');
+        const selectedCount = () => boxes.filter(box => box.checked).length;
+        
+        const updateCount = () => {
+            const count = selectedCount();
+            counter.textContent = `${count} selected`;
+            if (toggle) {
+                toggle.checked = count > 0 && count === boxes.length;
+                toggle.indeterminate = count > 0 && count < boxes.length;
+            }
+        };
+        
+        boxes.forEach(box => box.addEventListener('change', updateCount));
+        if (toggle) {
+            toggle.addEventListener('change', function() {
+                boxes.forEach(box => box.checked = toggle.checked);
+                updateCount();
+            });
+        }
+        
+        form.addEventListener('submit', function(e) {
+            if (scope.value === 'selected' && selectedCount() === 0) {
+                e.preventDefault();
+                alert('Select at least one row.');
+            } else if (scope.value === 'filter' && !confirm(`Update ${scope.options[scope.selectedIndex].text.toLowerCase()}?`)) {
+                e.preventDefault();
+            }
+        });
+    }
+
+    const progress = document.querySelector('[data-bulk-progress]');
+    
+    if (progress) {
+        const bar = progress.querySelector('.progress-bar');
+        const text = progress.querySelector('[data-bulk-progress-text]');
+        
+        const poll = () => {
+            fetch(progress.dataset.bulkProgress)
+                .then(response => response.json())
+                .then(data => {
+                    const percent = data.total ? Math.min(100, Math.round(data.processed * 100 / data.total)) : 100;
+                    bar.style.width = `${percent}%`;
+                    text.textContent = `${data.processed} / ${data.total}`;
+                    if (data.state === 'done') {
+                        bar.classList.add('bg-success');
+                        text.textContent += ' - done, refresh to see the changes';
+                    } else if (data.state === 'failed') {
+                        bar.classList.add('bg-danger');
+                        text.textContent += ` - failed: ${data.error}`;
+                    } else {
+                        setTimeout(poll, 1000);
+                    }
+                })
+                .catch(() => setTimeout(poll, 5000));
+        };
+        poll();
+    }
+}
+
 function confirmDelete(message) {
     return confirm(message || 'Are you sure you want to delete this item?');
 }
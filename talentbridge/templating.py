@@ -0,0 +1,56 @@
+import os
+import time
+import logging
+from jinja2 import FileSystemBytecodeCache, nodes
+from jinja2.ext import Extension
+from markupsafe import Markup
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+class FragmentCacheExtension(Extension):
+    # {% cache 'job-card', job.id, job.updated_at %}...{% endcache %} renders the block once per
+    # key; anything that varies per visitor has to stay outside it.
+    tags = {'cache'}
+
+    def __init__(self, environment):
+        super().__init__(environment)
+        environment.extend(fragment_cache=None)
+
+    def parse(self, parser):
+        lineno = next(parser.stream).lineno
+        parts = [parser.parse_expression()]
+        while parser.stream.skip_if('comma'):
+            parts.append(parser.parse_expression())
+        body = parser.parse_statements(['name:endcache'], drop_needle=True)
+        return nodes.CallBlock(self.call_method('_cached', [nodes.List(parts)]), [], [], body).set_lineno(lineno)
+
+    def _cached(self, parts, caller):
+        cache = self.environment.fragment_cache
+        # With auto-reload on (debug), template edits must show up immediately.
+        if cache is None or self.environment.auto_reload:
+            return caller()
+        key = ':'.join(str(part) for part in parts)
+        html = cache.get(key)
+        if html is None:
+            html = caller()
+            cache.set(key, str(html))
+        return Markup(html)
+
+def init_templates(app, fragment_cache):
+    app.jinja_options = dict(app.jinja_options, extensions=[FragmentCacheExtension])
+    directory = app.config['TEMPLATE_BYTECODE_DIR']
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+        app.jinja_options['bytecode_cache'] = FileSystemBytecodeCache(directory)
+    app.jinja_env.fragment_cache = fragment_cache
+
+def compile_templates(app) -> int:
+    # Loading every template up front fills Jinja's in-memory cache and writes the bytecode cache,
+    # so first requests after a deploy do not pay for parsing and compiling.
+    started = time.perf_counter()
+    names = app.jinja_env.list_templates(extensions=['html'])
+    for name in names:
+        app.jinja_env.get_template(name)
+    logger.info(f"Loaded {len(names)} templates in {(time.perf_counter() - started) * 1000:.0f}ms")
+    return len(names)
@@ -0,0 +1,51 @@
+import zlib
+from typing import Optional, Tuple
+from flask import current_app, has_app_context
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+ZLIB = 'zlib'
+ZSTD = 'zstd'
+CODECS = (ZLIB, ZSTD)
+MIN_WORD_LENGTH = 3
+
+def default_codec() -> str:
+    # Chosen by RESUME_TEXT_CODEC rather than by whichever packages this host has, so every host
+    # that reads the rows can decode them.
+    codec = current_app.config.get('RESUME_TEXT_CODEC', ZLIB) if has_app_context() else ZLIB
+    if codec not in CODECS:
+        raise RuntimeError(f'RESUME_TEXT_CODEC must be one of {", ".join(CODECS)}, not {codec!r}')
+    return codec
+
+def compress(data: bytes, codec: str) -> bytes:
+    if codec == ZSTD:
+        if zstandard is None:
+            raise RuntimeError('RESUME_TEXT_CODEC is zstd; install the zstandard package to write it')
+        return zstandard.ZstdCompressor(level=9).compress(data)
+    return zlib.compress(data, 9)
+
+def decompress(data: Optional[bytes], codec: str) -> bytes:
+    if not data:
+        return b''
+    if codec == ZSTD:
+        if zstandard is None:
+            raise RuntimeError('Text was stored with zstd; install the zstandard package to read it')
+        return zstandard.ZstdDecompressor().decompress(data)
+    return zlib.decompress(data)
+
+def vocabulary(text: Optional[str]) -> str:
+    # The title score looks for each title word (three characters or more) inside the lowercased text.
+    # A word has no whitespace, so it can only be found within one whitespace-separated token: the
+    # distinct tokens give the same answers as the text while being a fraction of its size.
+    tokens = {token for token in (text or '').lower().split() if len(token) >= MIN_WORD_LENGTH}
+    return '\n'.join(sorted(tokens))
+
+def pack(text: str, codec: Optional[str] = None) -> Tuple[str, bytes, bytes]:
+    codec = codec or default_codec()
+    return codec, compress(text.encode('utf-8'), codec), compress(vocabulary(text).encode('utf-8'), codec)
+
+def unpack(data: Optional[bytes], codec: str) -> str:
+    return decompress(data, codec).decode('utf-8')
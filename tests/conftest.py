@@ -0,0 +1,81 @@
+import os
+import shutil
+import pytest
+from config import Config
+from talentbridge import create_app
+from talentbridge.extensions import db
+from talentbridge.models import User
+from talentbridge.schema import upgrade_schema
+
+def make_config(directory, database):
+    class TestConfig(Config):
+        TESTING = True
+        WTF_CSRF_ENABLED = False
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{database}'
+        UPLOAD_FOLDER = os.path.join(directory, 'uploads')
+        RESUME_PREVIEWS = False
+        RESUME_PREVIEW_DIR = os.path.join(directory, 'uploads', 'previews')
+        EMBEDDING_INDEX_DIR = os.path.join(directory, 'indexes')
+        OPENAI_API_KEY = None
+        OPENAI_CACHE_DIR = os.path.join(directory, 'cache', 'openai')
+        TEMPLATE_BYTECODE_DIR = os.path.join(directory, 'cache', 'jinja')
+        TEMPLATE_PRECOMPILE = False
+        USER_CACHE_TTL = 0
+        FRAGMENT_CACHE_TTL = 0
+        UPLOAD_BYTES_PER_SECOND = 0
+    return TestConfig
+
+@pytest.fixture(scope='session')
+def migrated_database(tmp_path_factory):
+    # Migrating takes a while, so every test starts from a copy of one upgraded database.
+    directory = str(tmp_path_factory.mktemp('schema'))
+    database = os.path.join(directory, 'head.db')
+    app = create_app(make_config(directory, database))
+    upgrade_schema(app, db)
+    with app.app_context():
+        db.engine.dispose()
+    return database
+
+@pytest.fixture
+def make_app(tmp_path):
+    apps = []
+
+    def factory(database=None):
+        directory = str(tmp_path / f'app{len(apps)}')
+        os.makedirs(directory)
+        app = create_app(make_config(directory, database or os.path.join(directory, 'app.db')))
+        apps.append(app)
+        return app
+
+    yield factory
+    for app in apps:
+        with app.app_context():
+            db.session.remove()
+            db.engine.dispose()
+
+@pytest.fixture
+def app(make_app, migrated_database, tmp_path):
+    database = str(tmp_path / 'app.db')
+    shutil.copy(migrated_database, database)
+    app = make_app(database)
+    with app.app_context():
+        yield app
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+@pytest.fixture
+def user(app):
+    user = User(email='jane@example.com', full_name='Jane Doe', password_hash='-')
+    db.session.add(user)
+    db.session.commit()
+    return user
+
+@pytest.fixture
+def login(client):
+    def login_as(user):
+        with client.session_transaction() as session:
+            session['_user_id'] = str(user.id)
+            session['_fresh'] = True
+    return login_as
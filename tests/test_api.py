@@ -0,0 +1,57 @@
+from datetime import datetime, timedelta
+import pytest
+from talentbridge.extensions import db
+from talentbridge.models import Job
+from talentbridge.api.resources import decode_cursor, encode_cursor
+
+@pytest.fixture
+def jobs(app):
+    start = datetime(2026, 1, 1)
+    jobs = []
+    for i in range(25):
+        # Groups of five share a posted_date, so pages have to break ties on id.
+        jobs.append(Job(title=f'Job {i}', company='Acme', description='Role', posted_date=start + timedelta(days=i // 5)))
+    jobs += [Job(title=f'Undated {i}', company='Acme', description='Role') for i in range(3)]
+    db.session.add_all(jobs)
+    db.session.flush()
+    for job in jobs[25:]:
+        job.posted_date = None
+    db.session.commit()
+    return jobs
+
+def list_all(client, url):
+    ids = []
+    pages = 0
+    while url:
+        data = client.get(url).get_json()
+        ids += [item['id'] for item in data['data']]
+        url = data['next']
+        pages += 1
+    return ids, pages
+
+def test_cursor_round_trip(app):
+    values = [datetime(2026, 3, 4, 5, 6, 7, 890000), 42]
+    cursor = encode_cursor(values)
+    assert '=' not in cursor
+    assert decode_cursor('jobs', cursor) == values
+
+def test_pages_list_every_dated_job_once_in_order(client, jobs):
+    ids, pages = list_all(client, '/api/v1/jobs?limit=4&fields=id')
+    dated = sorted(jobs[:25], key=lambda job: (job.posted_date, job.id), reverse=True)
+    assert ids == [job.id for job in dated]
+    assert pages == 7
+
+def test_undated_jobs_are_left_out_of_lists_but_served_by_id(client, jobs):
+    ids, _ = list_all(client, '/api/v1/jobs?limit=10&fields=id')
+    assert not set(ids) & {job.id for job in jobs[25:]}
+    assert client.get(f'/api/v1/jobs/{jobs[25].id}?fields=id').status_code == 200
+
+@pytest.mark.parametrize('cursor', [
+    encode_cursor([None, 5]),
+    encode_cursor([datetime(2026, 1, 1)]),
+    'not a cursor!',
+])
+def test_invalid_cursor_is_rejected(client, jobs, cursor):
+    response = client.get(f'/api/v1/jobs?cursor={cursor}')
+    assert response.status_code == 400
+    assert response.get_json()['error'] == 'Invalid cursor'
@@ -0,0 +1,20 @@
+from datetime import datetime, timedelta
+from talentbridge.extensions import db
+from talentbridge.models import BulkAction, User
+
+def test_stalled_background_action_is_reported_failed(app, client, login):
+    admin = User(email='admin@example.com', password_hash='-', full_name='Admin', is_admin=True)
+    db.session.add(admin)
+    db.session.commit()
+    login(admin)
+    old = datetime.utcnow() - timedelta(seconds=app.config['BULK_STALE_SECONDS'] + 60)
+    stalled = BulkAction(target='applications', status='hired', state='running', total=10, processed=4,
+                         created_at=old, updated_at=old)
+    active = BulkAction(target='applications', status='hired', state='running', total=10, processed=4)
+    db.session.add_all([stalled, active])
+    db.session.commit()
+
+    data = client.get(f'/admin/bulk-actions/{stalled.id}').get_json()
+    assert data['state'] == 'failed'
+    assert data['error']
+    assert client.get(f'/admin/bulk-actions/{active.id}').get_json()['state'] == 'running'
@@ -0,0 +1,81 @@
+from talentbridge.cache import TTLCache
+
+class SharedStore:
+    # Just the Redis calls TTLCache makes, with values stored as bytes the way redis-py returns them.
+
+    def __init__(self):
+        self.values = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value, ex=None):
+        self.values[key] = value.encode() if isinstance(value, str) else value
+
+    def delete(self, key):
+        self.values.pop(key, None)
+
+def workers(count, shared):
+    caches = []
+    for _ in range(count):
+        cache = TTLCache('users', ttl=30, versioned=True)
+        cache.shared = shared
+        caches.append(cache)
+    return caches
+
+def test_invalidate_reaches_other_workers():
+    first, second = workers(2, SharedStore())
+    first.set(1, {'full_name': 'Old'})
+    assert second.get(1) == {'full_name': 'Old'}
+
+    first.invalidate(1)
+    assert first.get(1) is None
+    assert second.get(1) is None
+
+    second.set(1, {'full_name': 'New'})
+    assert first.get(1) == {'full_name': 'New'}
+
+def test_loading_does_not_evict_other_workers():
+    shared = SharedStore()
+    first, second = workers(2, shared)
+    first.set(1, {'full_name': 'Jane'})
+    assert second.get(1) == {'full_name': 'Jane'}
+    shared.delete('talentbridge:users:1')
+
+    # second keeps its local copy: nothing changed, so the version still matches.
+    first.set(2, {'full_name': 'Other'})
+    assert second.get(1) == {'full_name': 'Jane'}
+
+def test_unversioned_cache_makes_no_version_reads():
+    shared = SharedStore()
+    cache = TTLCache('fragments', ttl=30)
+    cache.shared = shared
+    cache.set('card', '<div>')
+    assert cache.get('card') == '<div>'
+    assert list(shared.values) == ['talentbridge:fragments:card']
+
+def test_local_cache_without_shared_backend():
+    cache = TTLCache('users', ttl=30, versioned=True)
+    cache.set(1, {'full_name': 'Jane'})
+    assert cache.get(1) == {'full_name': 'Jane'}
+    cache.invalidate(1)
+    assert cache.get(1) is None
+
+def test_saved_marker_reaches_other_workers(app, user, monkeypatch):
+    from talentbridge import models
+    first, second = workers(2, SharedStore())
+    monkeypatch.setattr(models, 'user_cache', first)
+    snapshot = models.load_user(user.id)
+    assert snapshot.saved_job_ids == set()
+
+    monkeypatch.setattr(models, 'user_cache', second)
+    assert models.load_user(user.id).saved_job_ids == set()
+
+    monkeypatch.setattr(models, 'user_cache', first)
+    snapshot.mark_job_saved(7)
+    snapshot.mark_job_applied(9)
+
+    monkeypatch.setattr(models, 'user_cache', second)
+    other = models.load_user(user.id)
+    assert other.saved_job_ids == {7}
+    assert other.applied_job_ids == {9}
@@ -0,0 +1,44 @@
+import os
+import gzip
+import pytest
+from talentbridge.extensions import db
+from talentbridge.models import Resume, User
+from talentbridge.resumes.downloads import preview_path
+
+TEXT = 'Python developer with Django experience\n' * 10
+
+@pytest.fixture
+def resume(user, tmp_path):
+    path = tmp_path / 'cv.pdf'
+    path.write_bytes(b'%PDF-1.4 resume')
+    resume = Resume(user_id=user.id, filename='cv.pdf', file_path=str(path))
+    resume.parsed_text = TEXT
+    db.session.add(resume)
+    db.session.commit()
+    return resume
+
+def test_preview_is_not_written_when_previews_are_off(client, login, user, resume):
+    login(user)
+    response = client.get(f'/resumes/{resume.id}/preview', headers={'Accept-Encoding': 'gzip'})
+    assert response.status_code == 200
+    assert 'Content-Encoding' not in response.headers
+    assert response.get_data(as_text=True) == TEXT
+    assert not os.path.exists(preview_path(resume.content_hash))
+
+def test_preview_is_cached_gzip_when_previews_are_on(app, client, login, user, resume):
+    app.config['RESUME_PREVIEWS'] = True
+    login(user)
+    response = client.get(f'/resumes/{resume.id}/preview', headers={'Accept-Encoding': 'gzip'})
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert gzip.decompress(response.get_data()).decode('utf-8') == TEXT
+    assert os.path.exists(preview_path(resume.content_hash))
+
+@pytest.mark.parametrize('is_admin, status', [(False, 404), (True, 200)])
+def test_only_owners_and_admins_read_a_resume(client, login, resume, is_admin, status):
+    reader = User(email='reader@example.com', password_hash='-', full_name='Reader', is_admin=is_admin)
+    db.session.add(reader)
+    db.session.commit()
+
+    login(reader)
+    assert client.get(f'/resumes/{resume.id}/preview').status_code == status
+    assert client.get(f'/resumes/{resume.id}/download').status_code == status
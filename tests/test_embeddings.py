@@ -0,0 +1,55 @@
+import numpy as np
+from talentbridge.extensions import db
+from talentbridge.models import Job
+from talentbridge.resumes import embeddings
+from talentbridge.resumes.embeddings import IVFIndex, embed_job, get_job_index, index_jobs, rebuild_job_index
+
+DIM = 8
+
+def unit(i):
+    vector = np.zeros(DIM, dtype=np.float32)
+    vector[i % DIM] = 1.0
+    return vector
+
+def test_tombstones_free_top_k_slots(tmp_path):
+    index = IVFIndex(str(tmp_path), dim=DIM)
+    query = unit(0)
+    ids = np.arange(1, 7, dtype=np.int64)
+    vectors = np.stack([query * (1 - i / 10) + unit(1) * (i / 10) for i in range(6)]).astype(np.float32)
+    index.build(ids, vectors, nlist=1)
+    assert [job_id for job_id, _ in index.search(query, k=3)] == [1, 2, 3]
+
+    index.remove([1, 2])
+    assert [job_id for job_id, _ in index.search(query, k=3)] == [3, 4, 5]
+
+    index.add([1], [query])
+    assert [job_id for job_id, _ in index.search(query, k=3)] == [1, 3, 4]
+
+def test_changes_made_during_a_build_survive_the_swap(tmp_path):
+    index = IVFIndex(str(tmp_path), dim=DIM)
+    index.build(np.array([1, 2], dtype=np.int64), np.stack([unit(0), unit(1)]), nlist=1)
+    index.add([2], [unit(0)])
+    mark = index.delta_mark()
+    index.add([3], [unit(0)])
+    index.remove([1])
+
+    index.build(np.array([1, 2], dtype=np.int64), np.stack([unit(0), unit(0)]), nlist=1, replay_from=mark)
+    assert sorted(job_id for job_id, _ in index.search(unit(0), k=5)) == [2, 3]
+    assert index.delta_mark()[1] == 2 * index.record_dtype.itemsize
+
+def test_deactivated_and_deleted_jobs_leave_the_index(app):
+    jobs = [Job(title=f'Python Developer {i}', company='Acme', description='Role', skills_required='python')
+            for i in range(3)]
+    for job in jobs:
+        embed_job(job)
+    db.session.add_all(jobs)
+    db.session.commit()
+    rebuild_job_index()
+    query = embeddings.get_embedder().embed_text([('Python Developer', 1.0)])
+    assert {job_id for job_id, _ in get_job_index().search(query)} == {job.id for job in jobs}
+
+    jobs[0].is_active = False
+    db.session.commit()
+    index_jobs([jobs[0]])
+    embeddings.unindex_jobs([jobs[1].id])
+    assert {job_id for job_id, _ in get_job_index().search(query)} == {jobs[2].id}
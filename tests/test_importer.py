@@ -0,0 +1,25 @@
+import io
+import pytest
+from talentbridge.jobs.importer import _read_json_array
+
+def read(feed, chunk_size=4):
+    return list(_read_json_array(io.StringIO(feed), chunk_size=chunk_size))
+
+@pytest.mark.parametrize('feed', ['[]', ' [ ] ', '[{"a": 1}]', '[ {"a": 1} ,\n {"b": 2} ]'])
+def test_well_formed_arrays(feed):
+    records = read(feed)
+    assert all(error is None for _, _, error in records)
+    assert [record for _, record, _ in records] == [{'a': 1}, {'b': 2}][:feed.count('{')]
+
+@pytest.mark.parametrize('feed, good', [
+    ('[,{"a": 1}]', 0),
+    ('[{"a": 1},,{"b": 2}]', 1),
+    ('[{"a": 1},]', 1),
+    ('[{"a": 1} {"b": 2}]', 1),
+    ('[{"a": 1},', 1),
+])
+def test_malformed_separators_are_rejected(feed, good):
+    records = read(feed)
+    assert len(records) == good + 1
+    assert all(error is None for _, _, error in records[:good])
+    assert records[-1][2].startswith('Invalid JSON')
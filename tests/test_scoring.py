@@ -0,0 +1,133 @@
+import pytest
+from talentbridge.extensions import db
+from talentbridge.models import Job, Resume, RecommendedJob
+from talentbridge.resumes.scoring import RecommendationScorer
+from talentbridge.skills import SkillIndex
+
+TITLES = ['Python Developer', 'Django Engineer', 'Data Analyst', 'Java Developer', 'Office Manager', 'Nurse']
+SKILLS = ['python, django, sql', 'django, python', 'sql, excel', 'java, spring', 'excel', 'care']
+
+@pytest.fixture
+def scorer():
+    return RecommendationScorer(top_k=3, workers=1)
+
+@pytest.fixture
+def jobs(app):
+    jobs = [Job(title=title, company='Acme', description='Role', requirements='3+ years', skills_required=skills)
+            for title, skills in zip(TITLES, SKILLS)]
+    db.session.add_all(jobs)
+    db.session.flush()
+    SkillIndex().index_jobs([(job.id, job.skills_required) for job in jobs])
+    db.session.commit()
+    return jobs
+
+@pytest.fixture
+def resume(user, jobs):
+    resume = Resume(user_id=user.id, filename='cv.pdf', file_path='cv.pdf', is_primary=True, experience_years=4,
+                    extracted_skills='Python, Django, SQL', education='')
+    resume.parsed_text = 'Senior python developer building django services'
+    db.session.add(resume)
+    db.session.flush()
+    SkillIndex().index_resumes([(resume.id, resume.extracted_skills, resume.education)])
+    db.session.commit()
+    return resume
+
+def stored(user_id):
+    rows = RecommendedJob.query.filter_by(user_id=user_id).all()
+    return sorted((row.job_id, row.overall_score) for row in rows)
+
+def full_scores(scorer, user_id):
+    scorer.run(full=True)
+    return stored(user_id)
+
+def edit(job, title, skills):
+    job.title = title
+    job.skills_required = skills
+    SkillIndex().index_jobs([(job.id, skills)])
+    db.session.commit()
+
+def test_delta_merge_matches_full_rescore(scorer, user, jobs, resume):
+    assert scorer.run().full
+    assert len(stored(user.id)) == 3
+
+    # A job outside the top 3 improves enough to enter it.
+    edit(jobs[4], 'Python Django Developer', 'python, django')
+    run = scorer.run()
+    assert not run.full
+    assert run.jobs_scored == 1
+    delta = stored(user.id)
+    assert jobs[4].id in dict(delta)
+    assert delta == full_scores(scorer, user.id)
+
+def test_job_dropping_out_of_a_full_list_triggers_rescore(scorer, user, jobs, resume):
+    scorer.run()
+    top = dict(stored(user.id))
+    assert jobs[0].id in top
+
+    # The stored list cannot say which job is fourth, so the user is rescored against every job.
+    edit(jobs[0], 'Nurse', 'care')
+    run = scorer.run()
+    assert not run.full
+    assert run.jobs_scored == len(jobs)
+    delta = stored(user.id)
+    assert jobs[0].id not in dict(delta)
+    assert delta == full_scores(scorer, user.id)
+
+def test_unchanged_jobs_leave_stored_scores_alone(scorer, user, jobs, resume):
+    scorer.run()
+    before = stored(user.id)
+    run = scorer.run()
+    assert run.jobs_scored == 0
+    assert stored(user.id) == before
+
+def test_new_primary_resume_is_rescored(scorer, user, jobs, resume):
+    scorer.run()
+    resume.is_primary = False
+    other = Resume(user_id=user.id, filename='cv2.pdf', file_path='cv2.pdf', is_primary=True, experience_years=1,
+                   extracted_skills='Java, Spring', education='')
+    other.parsed_text = 'Java developer'
+    db.session.add(other)
+    db.session.flush()
+    SkillIndex().index_resumes([(other.id, other.extracted_skills, other.education)])
+    db.session.commit()
+
+    scorer.run()
+    rows = RecommendedJob.query.filter_by(user_id=user.id).all()
+    assert {row.resume_id for row in rows} == {other.id}
+    assert jobs[3].id in {row.job_id for row in rows}
+    assert stored(user.id) == full_scores(scorer, user.id)
+
+def test_enhanced_skills_are_rescored(scorer, user, jobs, resume):
+    scorer.run()
+    assert jobs[3].id not in dict(stored(user.id))
+
+    resume.extracted_skills = 'Python, Django, SQL, Java, Spring'
+    SkillIndex().index_resumes([(resume.id, resume.extracted_skills, resume.education)])
+    db.session.commit()
+    run = scorer.run()
+    assert run.jobs_scored == len(jobs)
+    assert stored(user.id) == full_scores(scorer, user.id)
+
+def test_recommended_page_uses_batch_result_even_when_empty(client, login, scorer, user, jobs, resume, monkeypatch):
+    from talentbridge.resumes.matcher import JobMatcher
+    from talentbridge.resumes.scoring import get_precomputed_matches
+    login(user)
+    calls = []
+    monkeypatch.setattr(JobMatcher, 'get_matched_jobs', lambda self, *args, **kwargs: calls.append(args) or [])
+
+    assert get_precomputed_matches(user.id, resume) is None
+    assert client.get('/resumes/recommended').status_code == 200
+    assert len(calls) == 1
+
+    for job in jobs:
+        job.is_active = False
+    db.session.commit()
+    scorer.run()
+    assert stored(user.id) == []
+    assert get_precomputed_matches(user.id, resume) == []
+    assert client.get('/resumes/recommended').status_code == 200
+    assert len(calls) == 1
+
+    resume.extracted_skills = 'care'
+    db.session.commit()
+    assert get_precomputed_matches(user.id, resume) is None
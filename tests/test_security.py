@@ -0,0 +1,16 @@
+from talentbridge.security import PasswordHasher
+
+def test_verify_outside_gevent_hashes_in_place():
+    hasher = PasswordHasher(method='pbkdf2:sha256:1000')
+    pwhash = hasher.hash('secret')
+    assert hasher.verify(pwhash, 'secret')
+    assert not hasher.verify(pwhash, 'wrong')
+    assert not hasher.verify('', 'secret')
+    assert hasher._executor is None
+
+def test_needs_rehash_follows_the_configured_policy():
+    old = PasswordHasher(method='pbkdf2:sha256:1000').hash('secret')
+    hasher = PasswordHasher(method='pbkdf2:sha256:2000')
+    assert hasher.needs_rehash(old)
+    assert not hasher.needs_rehash(hasher.hash('secret'))
+    assert hasher.needs_rehash(None)
@@ -0,0 +1,61 @@
+import pytest
+from talentbridge.extensions import db
+from talentbridge.models import Job, JobNeighbors, JobTerm
+from talentbridge.jobs.similarity import JobSimilarityEngine
+
+@pytest.fixture
+def engine():
+    return JobSimilarityEngine(k=3)
+
+@pytest.fixture
+def jobs(app):
+    rows = [('Python Developer', 'python, django'), ('Senior Python Engineer', 'python, sql'),
+            ('Data Analyst', 'sql, excel'), ('Java Developer', 'java, spring'), ('Django Developer', 'django')]
+    jobs = [Job(title=title, company='Acme', description='Role', skills_required=skills, industry='Software')
+            for title, skills in rows]
+    db.session.add_all(jobs)
+    db.session.commit()
+    return jobs
+
+def doc_counts():
+    return dict(db.session.query(JobTerm.term, JobTerm.doc_count).all())
+
+def rebuilt_counts(engine):
+    engine.rebuild()
+    return doc_counts()
+
+def test_repeated_refresh_keeps_document_counts(engine, jobs):
+    engine.rebuild()
+    jobs[0].title = 'Rust Developer'
+    jobs[0].skills_required = 'rust'
+    jobs[2].is_active = False
+    db.session.commit()
+
+    for _ in range(3):
+        engine.refresh([job.id for job in jobs])
+    counts = doc_counts()
+    assert counts['s:rust'] == 1
+    assert counts['t:python'] == 1
+    assert 's:excel' not in counts
+    assert counts == rebuilt_counts(engine)
+
+def test_refresh_of_a_new_job_adds_its_terms(engine, jobs):
+    engine.rebuild()
+    job = Job(title='Python Developer', company='Beta', description='Role', skills_required='python')
+    db.session.add(job)
+    db.session.commit()
+
+    engine.refresh([job.id])
+    assert db.session.get(JobNeighbors, job.id).get_terms()
+    assert doc_counts() == rebuilt_counts(engine)
+
+def test_remove_takes_terms_out_before_delete(engine, jobs):
+    engine.rebuild()
+    assert engine.remove([jobs[3].id]) == 1
+    db.session.delete(jobs[3])
+    db.session.commit()
+
+    counts = doc_counts()
+    assert 's:java' not in counts
+    assert db.session.get(JobNeighbors, jobs[3].id) is None
+    assert counts == rebuilt_counts(engine)
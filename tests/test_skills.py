@@ -0,0 +1,132 @@
+import pytest
+from flask_migrate import downgrade
+from sqlalchemy import text
+from talentbridge.extensions import db
+from talentbridge.models import Job, Resume, Skill, resume_degrees
+from talentbridge.resumes.matcher import JobMatcher
+from talentbridge.schema import upgrade_schema
+from talentbridge.skills import SkillIndex, jobs_matching_skill, jobs_with_skills
+
+BEFORE_SKILLS = '5c2d8e9a1f37'
+SKILLS_REVISION = '7f984aa4633a'
+BEFORE_DEGREES = 'b138c34b1b8a'
+
+def links(table, owner_column):
+    rows = db.session.execute(text(
+        f'SELECT {owner_column}, skills.name FROM {table} JOIN skills ON skills.id = {table}.skill_id'
+    )).all()
+    result = {}
+    for owner_id, name in rows:
+        result.setdefault(owner_id, set()).add(name)
+    return result
+
+def test_migration_backfills_normalized_skills(make_app):
+    app = make_app()
+    upgrade_schema(app, db, BEFORE_SKILLS)
+    with app.app_context():
+        db.session.execute(text("INSERT INTO users (id, email, password_hash, full_name) VALUES (1, 'a@b.c', '-', 'A')"))
+        db.session.execute(text(
+            "INSERT INTO jobs (id, title, company, description, skills_required) VALUES "
+            "(1, 'Dev', 'Acme', 'Role', ' Python, SQL ,python,, Machine Learning '), "
+            "(2, 'Ops', 'Acme', 'Role', NULL), "
+            "(3, 'Data', 'Acme', 'Role', 'sql')"
+        ))
+        db.session.execute(text(
+            "INSERT INTO resumes (id, user_id, filename, file_path, extracted_skills, education) VALUES "
+            "(1, 1, 'cv.pdf', 'cv.pdf', 'PYTHON, Excel', 'Bachelor, MBA')"
+        ))
+        db.session.execute(text(
+            "INSERT INTO candidates (id, name, email, skills) VALUES (1, 'C', 'c@d.e', 'Excel , ')"
+        ))
+        db.session.commit()
+
+    upgrade_schema(app, db, SKILLS_REVISION)
+    with app.app_context():
+        names = [row[0] for row in db.session.execute(text('SELECT name FROM skills ORDER BY name'))]
+        assert names == ['bachelor', 'excel', 'machine learning', 'mba', 'python', 'sql']
+        assert links('job_skills', 'job_id') == {1: {'python', 'sql', 'machine learning'}, 3: {'sql'}}
+        assert links('resume_skills', 'resume_id') == {1: {'python', 'excel'}}
+        assert links('resume_education', 'resume_id') == {1: {'bachelor', 'mba'}}
+        assert links('candidate_skills', 'candidate_id') == {1: {'excel'}}
+
+def test_migration_matches_skill_index(make_app):
+    # The migration's frozen normalizer and SkillIndex must agree, or a rebuild would change the links.
+    app = make_app()
+    upgrade_schema(app, db, BEFORE_SKILLS)
+    with app.app_context():
+        db.session.execute(text(
+            "INSERT INTO jobs (id, title, company, description, skills_required) VALUES "
+            "(1, 'Dev', 'Acme', 'Role', 'C++, c#,  Go ,GO'), (2, 'Web', 'Acme', 'Role', 'React Native, TypeScript')"
+        ))
+        db.session.commit()
+    upgrade_schema(app, db)
+    with app.app_context():
+        migrated = links('job_skills', 'job_id')
+        SkillIndex().rebuild()
+        assert links('job_skills', 'job_id') == migrated
+
+def names(table):
+    return {row[0] for row in db.session.execute(text(f'SELECT name FROM {table}'))}
+
+def test_migration_moves_education_out_of_skills(make_app):
+    app = make_app()
+    upgrade_schema(app, db, BEFORE_DEGREES)
+    with app.app_context():
+        db.session.execute(text("INSERT INTO users (id, email, password_hash, full_name) VALUES (1, 'a@b.c', '-', 'A')"))
+        db.session.execute(text("INSERT INTO resumes (id, user_id, filename, file_path) VALUES (1, 1, 'a.pdf', 'a.pdf')"))
+        db.session.execute(text("INSERT INTO skills (id, name) VALUES (1, 'python'), (2, 'bachelor'), (3, 'mba')"))
+        db.session.execute(text("INSERT INTO resume_skills (resume_id, skill_id) VALUES (1, 1), (1, 3)"))
+        db.session.execute(text("INSERT INTO resume_education (resume_id, skill_id) VALUES (1, 2), (1, 3)"))
+        db.session.commit()
+
+    upgrade_schema(app, db)
+    with app.app_context():
+        # 'mba' is also listed as a skill, so only 'bachelor' leaves the skills table.
+        assert names('skills') == {'python', 'mba'}
+        assert names('degrees') == {'bachelor', 'mba'}
+        assert sorted(SkillIndex().names(resume_degrees, [1])[1]) == ['bachelor', 'mba']
+        db.session.remove()
+
+        downgrade(revision=BEFORE_DEGREES)
+        assert names('skills') == {'python', 'bachelor', 'mba'}
+        assert links('resume_education', 'resume_id') == {1: {'bachelor', 'mba'}}
+
+def test_education_is_not_indexed_as_skills(app, user):
+    resume = Resume(user_id=user.id, filename='cv.pdf', file_path='cv.pdf', extracted_skills='Python',
+                    education='Bachelor, MBA')
+    db.session.add(resume)
+    db.session.flush()
+    SkillIndex().index_resumes([(resume.id, resume.extracted_skills, resume.education)])
+    db.session.commit()
+    assert [skill.name for skill in Skill.query] == ['python']
+    assert [degree.name for degree in resume.normalized_education] == ['bachelor', 'mba']
+
+@pytest.fixture
+def jobs(app):
+    jobs = [Job(title='Engineer', company='Acme', description='Role', skills_required='Python, React Native'),
+            Job(title='Analyst', company='Acme', description='Role', skills_required='SQL, Python')]
+    db.session.add_all(jobs)
+    db.session.flush()
+    SkillIndex().index_jobs([(job.id, job.skills_required) for job in jobs])
+    db.session.commit()
+    return jobs
+
+def job_ids(query):
+    return {row[0] for row in db.session.execute(query)}
+
+def test_skill_filters(jobs):
+    assert job_ids(jobs_with_skills(['PYTHON', ' sql'])) == {jobs[1].id}
+    assert job_ids(jobs_with_skills(['pyth'])) == set()
+    assert job_ids(jobs_matching_skill('Pyth')) == {jobs[0].id, jobs[1].id}
+    assert job_ids(jobs_matching_skill('react nat')) == {jobs[0].id}
+
+def test_keyword_search_matches_part_of_a_skill(client, jobs):
+    page = client.get('/jobs/?keyword=native').get_data(as_text=True)
+    assert 'Engineer' in page
+    assert 'Analyst' not in page
+
+def test_skill_match_normalizes_raw_lists():
+    matcher = JobMatcher()
+    assert matcher.calculate_skill_match([' Python', 'SQL'], ['python ', 'Django']) == 0.5
+    assert matcher.calculate_skill_match(['Python'], 'PYTHON, Django') == 0.5
+    assert matcher.calculate_skill_match(['python'], [' ', '']) == 0.0
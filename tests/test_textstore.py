@@ -0,0 +1,90 @@
+import pytest
+from flask_migrate import downgrade
+from sqlalchemy import text
+from talentbridge import textstore
+from talentbridge.extensions import db
+from talentbridge.models import Resume, ResumeText
+from talentbridge.schema import upgrade_schema
+
+TEXT = 'Senior Python developer — Zürich\n5 years building Django and C++ services, 日本語 OK.\n' * 20
+CODECS = [textstore.ZLIB, pytest.param(textstore.ZSTD, marks=pytest.mark.skipif(
+    textstore.zstandard is None, reason='zstandard is not installed'))]
+
+@pytest.mark.parametrize('codec', CODECS)
+def test_pack_round_trip(codec):
+    packed_codec, content, vocabulary = textstore.pack(TEXT, codec)
+    assert packed_codec == codec
+    assert len(content) < len(TEXT.encode('utf-8'))
+    assert textstore.unpack(content, codec) == TEXT
+    assert textstore.unpack(vocabulary, codec) == textstore.vocabulary(TEXT)
+
+@pytest.mark.parametrize('codec', CODECS)
+def test_empty_data_unpacks_to_empty_text(codec):
+    assert textstore.unpack(None, codec) == ''
+    assert textstore.unpack(b'', codec) == ''
+
+def test_zstd_text_needs_the_package(monkeypatch):
+    monkeypatch.setattr(textstore, 'zstandard', None)
+    with pytest.raises(RuntimeError):
+        textstore.unpack(b'\x28\xb5\x2f\xfd', textstore.ZSTD)
+
+def test_vocabulary_answers_title_lookups_like_the_text():
+    vocabulary = textstore.vocabulary(TEXT)
+    assert vocabulary.split('\n') == sorted(set(vocabulary.split('\n')))
+    assert '5' not in vocabulary.split('\n')
+    for word in ['python', 'zürich', 'django', 'c++', 'eve', 'services,', 'java', 'ok.', 'rvic', 'senior']:
+        assert (word in vocabulary) == (word in TEXT.lower()), word
+
+def test_resume_text_round_trip(app, user):
+    resume = Resume(user_id=user.id, filename='cv.pdf', file_path='cv.pdf')
+    resume.parsed_text = TEXT
+    db.session.add(resume)
+    db.session.commit()
+    resume_id = resume.id
+    db.session.expunge_all()
+
+    resume = db.session.get(Resume, resume_id)
+    assert resume.parsed_text == TEXT
+    assert resume.vocabulary == textstore.vocabulary(TEXT)
+
+    resume.parsed_text = ''
+    db.session.commit()
+    assert resume.parsed_text is None
+    assert resume.vocabulary == ''
+    assert db.session.get(ResumeText, resume_id) is None
+
+def test_migration_moves_text_both_ways(make_app):
+    app = make_app()
+    upgrade_schema(app, db, '96d5853e1fc4')
+    with app.app_context():
+        db.session.execute(text("INSERT INTO users (id, email, password_hash, full_name) VALUES (1, 'a@b.c', '-', 'A')"))
+        db.session.execute(text(
+            "INSERT INTO resumes (id, user_id, filename, file_path, parsed_text) VALUES "
+            "(1, 1, 'a.pdf', 'a.pdf', :text), (2, 1, 'b.pdf', 'b.pdf', NULL), (3, 1, 'c.pdf', 'c.pdf', '')"
+        ), {'text': TEXT})
+        db.session.commit()
+
+    upgrade_schema(app, db)
+    with app.app_context():
+        assert db.session.get(Resume, 1).parsed_text == TEXT
+        assert db.session.get(Resume, 1).vocabulary == textstore.vocabulary(TEXT)
+        assert db.session.get(Resume, 2).parsed_text is None
+        assert db.session.get(Resume, 3).parsed_text is None
+        db.session.remove()
+
+        downgrade(revision='96d5853e1fc4')
+        rows = dict(db.session.execute(text('SELECT id, parsed_text FROM resumes')).all())
+        assert rows == {1: TEXT, 2: None, 3: None}
+
+def test_codec_comes_from_config_not_installed_packages(app, monkeypatch):
+    assert textstore.pack('text')[0] == textstore.ZLIB
+    assert textstore.default_codec() == textstore.ZLIB
+
+    app.config['RESUME_TEXT_CODEC'] = textstore.ZSTD
+    monkeypatch.setattr(textstore, 'zstandard', None)
+    with pytest.raises(RuntimeError):
+        textstore.pack('text')
+
+    app.config['RESUME_TEXT_CODEC'] = 'lz4'
+    with pytest.raises(RuntimeError):
+        textstore.pack('text')
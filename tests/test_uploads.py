@@ -0,0 +1,121 @@
+import io
+import os
+import time
+import fcntl
+import hashlib
+import pytest
+from datetime import datetime, timedelta
+from talentbridge.extensions import db
+from talentbridge.models import Resume, UploadSession
+from talentbridge.resumes.uploads import ChunkedUploads, UploadError
+
+CONTENT = b'%PDF-1.4\n' + b'resume body line\n' * 200
+
+@pytest.fixture
+def upload(app, client, user, login):
+    login(user)
+    app.config['UPLOAD_CHUNK_SIZE'] = 1024
+    response = client.post('/resumes/uploads', json={
+        'filename': 'cv.pdf', 'size': len(CONTENT), 'sha256': hashlib.sha256(CONTENT).hexdigest()
+    })
+    assert response.status_code == 201
+    return response.get_json()
+
+def patch(client, upload_id, offset, data):
+    return client.patch(f'/resumes/uploads/{upload_id}', data=data, headers={'Upload-Offset': str(offset)})
+
+def test_chunks_resume_from_offset_and_complete(client, user, upload):
+    offset = 0
+    while offset < len(CONTENT):
+        response = patch(client, upload['id'], offset, CONTENT[offset:offset + 1024])
+        assert response.status_code == 200
+        offset = response.get_json()['offset']
+        assert client.get(f"/resumes/uploads/{upload['id']}").get_json()['offset'] == offset
+
+    response = client.post(f"/resumes/uploads/{upload['id']}/complete")
+    assert response.status_code < 400
+
+    resume = Resume.query.filter_by(user_id=user.id).one()
+    assert resume.content_hash == hashlib.sha256(CONTENT).hexdigest()
+    assert resume.file_size == len(CONTENT)
+    with open(resume.file_path, 'rb') as f:
+        assert f.read() == CONTENT
+    assert not os.path.exists(resume.file_path + '.part')
+    assert db.session.get(UploadSession, upload['id']) is None
+
+def test_offset_mismatch_returns_current_offset(client, upload):
+    assert patch(client, upload['id'], 0, CONTENT[:1024]).status_code == 200
+
+    for offset in (0, 2048):
+        response = patch(client, upload['id'], offset, CONTENT[offset:offset + 1024])
+        assert response.status_code == 409
+        assert response.get_json()['offset'] == 1024
+
+    response = client.post(f"/resumes/uploads/{upload['id']}/complete")
+    assert response.status_code == 409
+
+def test_chunk_while_another_is_written_is_rejected(client, upload):
+    session = db.session.get(UploadSession, upload['id'])
+    with open(session.partial_path, 'r+b') as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        response = patch(client, upload['id'], 0, CONTENT[:1024])
+    assert response.status_code == 409
+    assert response.get_json()['offset'] == 0
+
+    assert patch(client, upload['id'], 0, CONTENT[:1024]).status_code == 200
+
+def test_second_write_at_same_offset_sees_the_first(app, client, upload):
+    # A request that loaded the session before another worker wrote the chunk must not write it again.
+    stale = db.session.get(UploadSession, upload['id'])
+    assert stale.received == 0
+    assert patch(client, upload['id'], 0, CONTENT[:1024]).status_code == 200
+
+    uploads = ChunkedUploads(chunk_size=1024, max_size=len(CONTENT))
+    with pytest.raises(UploadError) as error:
+        uploads.write(stale, 0, io.BytesIO(b'X' * 1024), 1024)
+    assert error.value.status == 409
+    assert error.value.extra['offset'] == 1024
+    with open(stale.partial_path, 'rb') as f:
+        assert f.read() == CONTENT[:1024]
+
+def test_checksum_mismatch_discards_upload(client, user, upload):
+    corrupted = CONTENT[:-1] + b'!'
+    offset = 0
+    while offset < len(corrupted):
+        offset = patch(client, upload['id'], offset, corrupted[offset:offset + 1024]).get_json()['offset']
+
+    response = client.post(f"/resumes/uploads/{upload['id']}/complete")
+    assert response.status_code == 422
+    assert Resume.query.filter_by(user_id=user.id).count() == 0
+    assert db.session.get(UploadSession, upload['id']) is None
+
+def test_wrong_file_signature_is_rejected(client, upload):
+    response = patch(client, upload['id'], 0, b'MZ' + CONTENT[2:1024])
+    assert response.status_code == 415
+    assert client.get(f"/resumes/uploads/{upload['id']}").status_code == 404
+
+def test_chunk_for_a_discarded_upload_is_not_found(client, upload):
+    stale = db.session.get(UploadSession, upload['id'])
+    assert client.delete(f"/resumes/uploads/{upload['id']}").status_code < 400
+
+    uploads = ChunkedUploads(chunk_size=1024, max_size=len(CONTENT))
+    with pytest.raises(UploadError) as error:
+        uploads.write(stale, 0, io.BytesIO(CONTENT[:1024]), 1024)
+    assert error.value.status == 404
+    assert patch(client, upload['id'], 0, CONTENT[:1024]).status_code == 404
+
+def test_chunk_for_an_expired_upload_is_gone(client, upload):
+    session = db.session.get(UploadSession, upload['id'])
+    session.updated_at = datetime.utcnow() - timedelta(days=2)
+    db.session.commit()
+    assert patch(client, upload['id'], 0, CONTENT[:1024]).status_code == 410
+
+def test_idle_hash_state_is_evicted(app, client, upload):
+    assert patch(client, upload['id'], 0, CONTENT[:1024]).status_code == 200
+    assert upload['id'] in ChunkedUploads._hashes
+
+    uploads = ChunkedUploads(chunk_size=1024, max_size=len(CONTENT), session_ttl=60)
+    received, hasher, _ = ChunkedUploads._hashes[upload['id']]
+    ChunkedUploads._hashes[upload['id']] = (received, hasher, time.time() - 120)
+    assert uploads.purge_expired() == 0
+    assert upload['id'] not in ChunkedUploads._hashes